@@ -7,7 +7,11 @@ NOW INCLUDING CDTM NODES!
 
 import json
 import io
-import base64
+import re
+import os
+import functools
+import threading
+import flask
 import dash
 from dash import dcc, html, Input, Output
 import dash_bootstrap_components as dbc
@@ -15,20 +19,33 @@ import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+from matplotlib.collections import LineCollection
 import numpy as np
 from collections import defaultdict, Counter
 from typing import Dict, List, Tuple
 
+try:
+    import orjson  # Faster JSON parsing at startup
+except ImportError:
+    orjson = None
+
 
 # ==========================================
 # DATA LOADING
 # ==========================================
+def _load_json(path: str):
+    """Parse a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 def load_data():
     """Load alumni and schools data from JSON files."""
-    with open('data/cdtm_alumni_consolidated.json', 'r', encoding='utf-8') as f:
-        alumni_data = json.load(f)
-    with open('data/unique_schools_normalized.json', 'r', encoding='utf-8') as f:
-        schools_data = json.load(f)
+    alumni_data = _load_json('data/cdtm_alumni_consolidated.json')
+    schools_data = _load_json('data/unique_schools_normalized.json')
     return alumni_data, schools_data
 
 
@@ -38,53 +55,64 @@ ALUMNI_DATA, SCHOOLS_DATA = load_data()
 # ==========================================
 # DATA PROCESSING FUNCTIONS
 # ==========================================
+def _keyword_pattern(terms: List[str]) -> re.Pattern:
+    """Compile a case-insensitive substring alternation for the given terms."""
+    return re.compile('|'.join(re.escape(term) for term in terms), re.IGNORECASE)
+
+
+# Checked in order, the first matching category wins
+_DEGREE_PATTERNS = [
+    ("Bachelor's", _keyword_pattern(['bachelor', 'b.sc', 'b.a', 'b.eng', 'bsc'])),
+    ("Master's", _keyword_pattern(['master', 'm.sc', 'm.a', 'm.eng', 'msc', 'mba'])),
+    ("Doctorate", _keyword_pattern(['phd', 'ph.d', 'doctor', 'doctorate'])),
+    ("Diploma", _keyword_pattern(['dipl', 'diploma'])),
+]
+
+_FIELD_PATTERNS = [
+    ("Engineering/Tech", _keyword_pattern([
+        'engineering', 'computer', 'informatics', 'software', 'electrical',
+        'mechanical', 'technology'
+    ])),
+    ("Business", _keyword_pattern([
+        'business', 'management', 'mba', 'economics', 'finance', 'bwl'
+    ])),
+    ("Sciences", _keyword_pattern([
+        'physics', 'chemistry', 'biology', 'mathematics', 'science', 'biotech'
+    ])),
+]
+
+_MBA_PATTERN = _keyword_pattern(['mba'])
+
+
+@functools.lru_cache(maxsize=4096)
 def categorize_degree(degree: str, field: str) -> str:
     """Categorize a degree into a standardized level."""
     if not degree:
         return "Other"
 
-    degree_lower = degree.lower()
-
-    if any(term in degree_lower for term in ['bachelor', 'b.sc', 'b.a', 'b.eng', 'bsc']):
-        return "Bachelor's"
-    if any(term in degree_lower for term in ['master', 'm.sc', 'm.a', 'm.eng', 'msc', 'mba']):
-        return "Master's"
-    if any(term in degree_lower for term in ['phd', 'ph.d', 'doctor', 'doctorate']):
-        return "Doctorate"
-    if any(term in degree_lower for term in ['dipl', 'diploma']):
-        return "Diploma"
+    for category, pattern in _DEGREE_PATTERNS:
+        if pattern.search(degree):
+            return category
 
     return "Other"
 
 
+@functools.lru_cache(maxsize=4096)
 def categorize_field(field: str, degree: str) -> str:
     """Categorize field of study."""
     if not field:
-        if degree and 'mba' in degree.lower():
+        if degree and _MBA_PATTERN.search(degree):
             return "Business"
         return "Other"
 
-    field_lower = field.lower()
-
-    if any(term in field_lower for term in [
-        'engineering', 'computer', 'informatics', 'software', 'electrical',
-        'mechanical', 'technology'
-    ]):
-        return "Engineering/Tech"
-
-    if any(term in field_lower for term in [
-        'business', 'management', 'mba', 'economics', 'finance', 'bwl'
-    ]):
-        return "Business"
-
-    if any(term in field_lower for term in [
-        'physics', 'chemistry', 'biology', 'mathematics', 'science', 'biotech'
-    ]):
-        return "Sciences"
+    for category, pattern in _FIELD_PATTERNS:
+        if pattern.search(field):
+            return category
 
     return "Other"
 
 
+@functools.lru_cache(maxsize=4096)
 def get_institution_type(school_name: str) -> str:
     """Get institution type."""
     if school_name in SCHOOLS_DATA:
@@ -92,13 +120,26 @@ def get_institution_type(school_name: str) -> str:
     return 'University'
 
 
+def _is_cdtm_name(school_name: str) -> bool:
+    """Substring check for the CDTM school name."""
+    return 'CDTM' in school_name or 'Center for Digital Technology' in school_name
+
+
+# Known school names are classified once, so is_cdtm is a set lookup for them
+_CDTM_SCHOOLS = frozenset(name for name in SCHOOLS_DATA if _is_cdtm_name(name))
+
+
 def is_cdtm(school_name: str) -> bool:
     """Check if school is CDTM."""
-    return 'CDTM' in school_name or 'Center for Digital Technology' in school_name
+    if school_name in _CDTM_SCHOOLS:
+        return True
+    if school_name in SCHOOLS_DATA:
+        return False
+    return _is_cdtm_name(school_name)
 
 
-def extract_paths(alumni_data: List[Dict], filters: Dict = None) -> List[Dict]:
-    """Extract education paths from alumni data, INCLUDING CDTM, with optional filtering."""
+def _build_canonical_paths(alumni_data: List[Dict]) -> List[Dict]:
+    """Extract education paths from alumni data, INCLUDING CDTM, without any filtering."""
     paths = []
 
     for person in alumni_data:
@@ -132,32 +173,28 @@ def extract_paths(alumni_data: List[Dict], filters: Dict = None) -> List[Dict]:
         if not all_entries:
             continue
 
-        # Determine where CDTM fits in the path
-        cdtm_level = None
-        insert_position = None
-
-        # Find Bachelor's or Diploma
+        # Determine where CDTM fits in the path from the first index of each degree
+        first_index = {}
         for i, entry in enumerate(all_entries):
-            if entry['degree'] in ["Bachelor's", "Diploma"]:
-                insert_position = i + 1
-                cdtm_level = "Bachelor's Level"
-                break
+            first_index.setdefault(entry['degree'], i)
 
-        # If no Bachelor's found, check for Master's
-        if insert_position is None:
-            for i, entry in enumerate(all_entries):
-                if entry['degree'] == "Master's":
-                    insert_position = i + 1
-                    cdtm_level = "Master's Level"
-                    break
+        undergrad_indices = [first_index[d] for d in ("Bachelor's", "Diploma") if d in first_index]
 
-        # If still no position, put CDTM at the beginning
-        if insert_position is None and len(all_entries) > 0:
+        if undergrad_indices:
+            # After the first Bachelor's or Diploma
+            insert_position = min(undergrad_indices) + 1
+            cdtm_level = "Bachelor's Level"
+        elif "Master's" in first_index:
+            # If no Bachelor's found, after the first Master's
+            insert_position = first_index["Master's"] + 1
+            cdtm_level = "Master's Level"
+        else:
+            # If still no position, put CDTM at the beginning
             insert_position = 1 if len(all_entries) > 1 else 0
             cdtm_level = "Bachelor's Level"
 
         # Insert CDTM node if we found a position
-        if cdtm_entry and insert_position is not None and cdtm_level:
+        if cdtm_entry:
             # CDTM is a single independent node - no field association
             cdtm_node = {
                 'degree': 'CDTM',
@@ -177,21 +214,16 @@ def extract_paths(alumni_data: List[Dict], filters: Dict = None) -> List[Dict]:
                 primary_field = entry['field']
                 break
 
-        # Apply filters
-        if filters:
-            if filters.get('field') and filters['field'] != 'All':
-                if primary_field != filters['field']:
-                    continue
-
-            if filters.get('degree') and filters['degree'] != 'All':
-                if not any(node['degree'] == filters['degree'] for node in all_entries):
-                    continue
-
         if len(all_entries) >= 2:  # Need at least 2 nodes for a path
             paths.append({
                 'nodes': all_entries,
                 'primary_field': primary_field or "Other",
-                'name': person.get('full_name', 'Unknown')
+                # Paths without a categorized field are shown as 'Other' but
+                # match no field filter
+                'known_primary_field': primary_field is not None,
+                'name': person.get('full_name', 'Unknown'),
+                'degrees': frozenset(entry['degree'] for entry in all_entries),
+                'stations': tuple(station_index(entry) for entry in all_entries)
             })
 
     return paths
@@ -235,16 +267,59 @@ def define_stations() -> Dict[str, Tuple[float, float]]:
     return stations
 
 
-def sigmoid_curve(p1: Tuple[float, float], p2: Tuple[float, float], n_points: int = 100) -> Tuple[np.ndarray, np.ndarray]:
-    """Generate an S-curve between two points."""
-    x1, y1 = p1
-    x2, y2 = p2
+# Station lookup tables: nodes are resolved to integer indices once, so the
+# rendering loop works on integers instead of formatting and hashing keys
+STATIONS = define_stations()
+STATION_KEYS = list(STATIONS)
+STATION_XY = np.array([STATIONS[key] for key in STATION_KEYS])
+_STATION_INDEX = {key: i for i, key in enumerate(STATION_KEYS)}
+CDTM_STATION = _STATION_INDEX["CDTM"]
 
-    x = np.linspace(x1, x2, n_points)
 
-    # Sigmoid easing using cosine
-    t = (x - x1) / (x2 - x1) if x2 != x1 else np.zeros_like(x)
-    y = y1 + (y2 - y1) * (1 - np.cos(np.pi * t)) / 2
+def station_index(node: Dict) -> int:
+    """Return the station index for a path node, or -1 if it has no station."""
+    # CDTM is special and doesn't use field
+    key = "CDTM" if node.get('is_cdtm') else f"{node['degree']}|{node['field']}"
+    return _STATION_INDEX.get(key, -1)
+
+
+# Paths do not depend on the filters, so they are built once at startup
+_CANONICAL_PATHS = _build_canonical_paths(ALUMNI_DATA)
+
+
+def extract_paths(filters: Dict = None) -> List[Dict]:
+    """Return the precomputed education paths matching the optional filters."""
+    if not filters:
+        return list(_CANONICAL_PATHS)
+
+    field = filters.get('field')
+    if field == 'All':
+        field = None
+    degree = filters.get('degree')
+    if degree == 'All':
+        degree = None
+
+    return [
+        path for path in _CANONICAL_PATHS
+        if (not field or (path['known_primary_field'] and path['primary_field'] == field))
+        and (not degree or degree in path['degrees'])
+    ]
+
+
+def sigmoid_curves(x1: np.ndarray, y1: np.ndarray, x2: np.ndarray, y2: np.ndarray,
+                   n_points: int = 100) -> Tuple[np.ndarray, np.ndarray]:
+    """Generate S-curves for a batch of edges.
+
+    Takes 1-D arrays of start/end coordinates and returns (x, y) arrays of
+    shape (n_edges, n_points).
+    """
+    t = np.linspace(0.0, 1.0, n_points)
+
+    # Sigmoid easing using cosine, flat for edges without horizontal extent
+    ease = np.where((x2 != x1)[:, None], (1 - np.cos(np.pi * t)) / 2, 0.0)
+
+    x = x1[:, None] + (x2 - x1)[:, None] * t
+    y = y1[:, None] + (y2 - y1)[:, None] * ease
 
     return x, y
 
@@ -252,10 +327,18 @@ def sigmoid_curve(p1: Tuple[float, float], p2: Tuple[float, float], n_points: in
 # ==========================================
 # VISUALIZATION FUNCTION
 # ==========================================
-def create_flow_visualization(paths: List[Dict]) -> str:
-    """Create flow visualization and return as base64 encoded image."""
+_RNG = np.random.default_rng()
+
+# Setting up a figure is expensive, so a single one is reused for every render.
+# Dash may run callbacks concurrently, hence the lock around drawing/saving.
+_FIG, _AX = plt.subplots(figsize=(18, 10), facecolor='white', dpi=100)
+_FIG_LOCK = threading.Lock()
 
-    stations = define_stations()
+WEBP_OPTIONS = {'quality': 85, 'method': 4}
+
+
+def _draw_flow(ax, paths: List[Dict]):
+    """Draw the flow diagram for the given paths onto an empty axes."""
 
     # Define colors for different fields
     field_colors = {
@@ -266,70 +349,70 @@ def create_flow_visualization(paths: List[Dict]) -> str:
         "CDTM": "#f59e0b"                # Orange for CDTM
     }
 
-    # Setup figure
-    fig, ax = plt.subplots(figsize=(18, 10), facecolor='white', dpi=100)
-
-    # Count paths through each station for sizing
-    station_counts = Counter()
+    # STEP 1: Collect the edges of all paths as station index pairs
+    edge_from = []
+    edge_to = []
+    edge_styles = []
 
-    # STEP 1: Draw all the paths
     for path_data in paths:
-        path_nodes = path_data['nodes']
-        primary_field = path_data['primary_field']
-        color = field_colors.get(primary_field, field_colors["Other"])
-
-        # Draw connections between consecutive nodes
-        for i in range(len(path_nodes) - 1):
-            current = path_nodes[i]
-            next_node = path_nodes[i + 1]
-
-            # Build station keys - CDTM is special and doesn't use field
-            if current.get('is_cdtm'):
-                current_key = "CDTM"
-            else:
-                current_key = f"{current['degree']}|{current['field']}"
-
-            if next_node.get('is_cdtm'):
-                next_key = "CDTM"
-            else:
-                next_key = f"{next_node['degree']}|{next_node['field']}"
+        path_stations = path_data['stations']
+        color = field_colors.get(path_data['primary_field'], field_colors["Other"])
 
+        # Collect connections between consecutive nodes
+        for current, next_station in zip(path_stations, path_stations[1:]):
             # Skip if station doesn't exist
-            if current_key not in stations or next_key not in stations:
+            if current < 0 or next_station < 0:
                 continue
 
-            # Get coordinates
-            x1, y1 = stations[current_key]
-            x2, y2 = stations[next_key]
-
-            # Add jitter to y-coordinates for volume effect
-            y_jitter_start = np.random.uniform(-0.12, 0.12)
-            y_jitter_end = np.random.uniform(-0.12, 0.12)
-
-            # Generate curve
-            xs, ys = sigmoid_curve(
-                (x1, y1 + y_jitter_start),
-                (x2, y2 + y_jitter_end)
-            )
+            edge_from.append(current)
+            edge_to.append(next_station)
 
             # Use orange color if going through CDTM
-            if current.get('is_cdtm') or next_node.get('is_cdtm'):
-                plot_color = field_colors["CDTM"]
-                alpha = 0.12
+            if current == CDTM_STATION or next_station == CDTM_STATION:
+                edge_styles.append((field_colors["CDTM"], 0.12))
             else:
-                plot_color = color
-                alpha = 0.08
+                edge_styles.append((color, 0.08))
 
-            # Plot with transparency for overlapping effect
-            ax.plot(xs, ys, color=plot_color, alpha=alpha, linewidth=1.2, zorder=1)
+    # Count paths through each station for sizing
+    station_counts = (np.bincount(edge_from, minlength=len(STATION_KEYS))
+                      + np.bincount(edge_to, minlength=len(STATION_KEYS)))
 
-            # Track station usage
-            station_counts[current_key] += 1
-            station_counts[next_key] += 1
+    # STEP 2: Generate all curves at once and draw them
+    if edge_from:
+        # Get coordinates (fancy indexing returns copies)
+        starts = STATION_XY[edge_from]
+        ends = STATION_XY[edge_to]
 
-    # STEP 2: Draw the stations (nodes) on top
-    for station_name, (sx, sy) in stations.items():
-        count = station_counts.get(station_name, 0)
+        # Add jitter to y-coordinates for volume effect
+        jitter = _RNG.uniform(-0.12, 0.12, size=(len(edge_from), 2))
+        starts[:, 1] += jitter[:, 0]
+        ends[:, 1] += jitter[:, 1]
+
+        curves_x, curves_y = sigmoid_curves(starts[:, 0], starts[:, 1], ends[:, 0], ends[:, 1])
+
+        # One collection per (color, alpha) instead of one artist per edge
+        style_groups = defaultdict(list)
+        for edge_idx, style in enumerate(edge_styles):
+            style_groups[style].append(edge_idx)
+
+        for (plot_color, alpha), edge_idx in style_groups.items():
+            segments = np.stack([curves_x[edge_idx], curves_y[edge_idx]], axis=-1)
+            # Plot with transparency for overlapping effect
+            curves = LineCollection(segments, colors=plot_color, alpha=alpha,
+                                    linewidths=1.2, zorder=1)
+            ax.add_collection(curves)
+
+    # STEP 3: Draw the stations (nodes) on top
+    # Styling per group: (background color, outline color, outline width)
+    node_styles = {
+        True: ('#fff7ed', field_colors["CDTM"], 4),  # CDTM: light orange background
+        False: ('white', '#1e293b', 2),
+    }
+    node_groups = {is_cdtm_node: ([], [], []) for is_cdtm_node in node_styles}
+
+    for station_idx, station_name in enumerate(STATION_KEYS):
+        count = station_counts[station_idx]
+        sx, sy = STATIONS[station_name]
 
         if count == 0:
             continue  # Don't draw unused stations
@@ -340,22 +423,10 @@ def create_flow_visualization(paths: List[Dict]) -> str:
         # Special styling for CDTM node
         is_cdtm_node = (station_name == "CDTM")
 
-        if is_cdtm_node:
-            # CDTM node gets special orange color and larger size
-            node_color = '#fff7ed'  # Light orange background
-            edge_color = field_colors["CDTM"]
-            edge_width = 4
-        else:
-            node_color = 'white'
-            edge_color = '#1e293b'
-            edge_width = 2
-
-        # Background circle
-        ax.scatter(sx, sy, s=node_size, color=node_color, zorder=10, edgecolors='none')
-
-        # Outline
-        ax.scatter(sx, sy, s=node_size, facecolors='none',
-                  edgecolors=edge_color, linewidth=edge_width, zorder=11)
+        xs, ys, sizes = node_groups[is_cdtm_node]
+        xs.append(sx)
+        ys.append(sy)
+        sizes.append(node_size)
 
         # Label
         if is_cdtm_node:
@@ -376,7 +447,20 @@ def create_flow_visualization(paths: List[Dict]) -> str:
                bbox=dict(boxstyle='round,pad=0.3', facecolor='white',
                         edgecolor='none', alpha=0.9))
 
-    # STEP 3: Add legend
+    for is_cdtm_node, (xs, ys, sizes) in node_groups.items():
+        if not xs:
+            continue
+
+        node_color, edge_color, edge_width = node_styles[is_cdtm_node]
+
+        # Background circles
+        ax.scatter(xs, ys, s=sizes, color=node_color, zorder=10, edgecolors='none')
+
+        # Outlines
+        ax.scatter(xs, ys, s=sizes, facecolors='none',
+                  edgecolors=edge_color, linewidth=edge_width, zorder=11)
+
+    # STEP 4: Add legend
     legend_elements = [
         mpatches.Patch(facecolor=field_colors["Engineering/Tech"],
                       label='Engineering/Tech', alpha=0.7),
@@ -392,7 +476,7 @@ def create_flow_visualization(paths: List[Dict]) -> str:
     ax.legend(handles=legend_elements, loc='upper right',
              fontsize=11, frameon=True, fancybox=True)
 
-    # STEP 4: Final polish
+    # STEP 5: Final polish
     ax.set_xlim(-0.5, 8)
     ax.set_ylim(-0.5, 8)
     ax.axis('off')
@@ -404,16 +488,20 @@ def create_flow_visualization(paths: List[Dict]) -> str:
            ha='center', va='top', transform=ax.transAxes,
            fontsize=10, color='#64748b', style='italic')
 
-    plt.tight_layout()
 
-    # Convert to base64
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', dpi=100, bbox_inches='tight', facecolor='white')
-    buf.seek(0)
-    img_base64 = base64.b64encode(buf.read()).decode('utf-8')
-    plt.close(fig)
+def create_flow_visualization(paths: List[Dict]) -> bytes:
+    """Create flow visualization and return it as WebP bytes."""
+    with _FIG_LOCK:
+        _AX.clear()
+        _draw_flow(_AX, paths)
+        _FIG.tight_layout()
+
+        buf = io.BytesIO()
+        # WebP encodes faster and much smaller than PNG for this mostly white image
+        _FIG.savefig(buf, format='webp', dpi=100, bbox_inches='tight', facecolor='white',
+                     pil_kwargs=WEBP_OPTIONS)
 
-    return f"data:image/png;base64,{img_base64}"
+    return buf.getvalue()
 
 
 def get_statistics(paths):
@@ -423,38 +511,140 @@ def get_statistics(paths):
 
     total_alumni = len(paths)
 
-    # Count paths with CDTM
-    paths_with_cdtm = sum(1 for p in paths if any(n.get('is_cdtm') for n in p['nodes']))
-
-    # Count by primary field
-    field_counter = Counter([p['primary_field'] for p in paths])
-
-    # Count degrees
-    degree_counter = Counter()
-    for path in paths:
-        for node in path['nodes']:
-            if not node.get('is_cdtm'):
-                degree_counter[node['degree']] += 1
+    # Accumulate all counters in a single pass over the paths
+    paths_with_cdtm = 0
+    field_counts = defaultdict(int)
+    degree_counts = defaultdict(int)
+    path_lengths = np.empty(total_alumni, dtype=np.int64)
+    total_length = 0
+
+    for i, path in enumerate(paths):
+        nodes = path['nodes']
+        field_counts[path['primary_field']] += 1
+
+        has_cdtm = False
+        for node in nodes:
+            if node.get('is_cdtm'):
+                has_cdtm = True
+            else:
+                degree_counts[node['degree']] += 1
+        paths_with_cdtm += has_cdtm
 
-    # Path length stats
-    path_lengths = [len(p['nodes']) for p in paths]
+        path_lengths[i] = len(nodes)
+        total_length += len(nodes)
 
     return {
         'total_alumni': total_alumni,
         'paths_with_cdtm': paths_with_cdtm,
-        'field_counter': field_counter.most_common(),
-        'degree_counter': degree_counter.most_common(5),
-        'avg_path_length': np.mean(path_lengths),
+        'field_counter': Counter(field_counts).most_common(),
+        'degree_counter': Counter(degree_counts).most_common(5),
+        'avg_path_length': total_length / total_alumni,
         'median_path_length': np.median(path_lengths)
     }
 
 
+FIELD_FILTERS = ['All', 'Engineering/Tech', 'Business', 'Sciences', 'Other']
+DEGREE_FILTERS = ['All', "Bachelor's", "Master's", "Doctorate", "Diploma"]
+
+
+def _url_slug(value: str) -> str:
+    """Turn a filter value into a URL friendly slug."""
+    return re.sub(r'[^a-z0-9]+', '-', value.lower()).strip('-')
+
+
+_FIELD_BY_SLUG = {_url_slug(value): value for value in FIELD_FILTERS}
+_DEGREE_BY_SLUG = {_url_slug(value): value for value in DEGREE_FILTERS}
+
+# Changes whenever the data does, so browsers don't keep images of old data
+_CACHE_VERSION = int(os.path.getmtime('data/cdtm_alumni_consolidated.json'))
+
+
+def _filters_for(field_filter: str, degree_filter: str) -> Dict:
+    """Translate dropdown values into extract_paths filters."""
+    return {
+        'field': field_filter if field_filter != 'All' else None,
+        'degree': degree_filter if degree_filter != 'All' else None
+    }
+
+
+def _build_empty_placeholder() -> bytes:
+    """Render the image shown when no paths match the filters."""
+    fig, ax = plt.subplots(figsize=(18, 10))
+    ax.text(0.5, 0.5, 'No data matches the selected filters',
+           ha='center', va='center', fontsize=16, color='#64748b')
+    ax.axis('off')
+    buf = io.BytesIO()
+    fig.savefig(buf, format='webp', dpi=100, pil_kwargs=WEBP_OPTIONS)
+    plt.close(fig)
+    return buf.getvalue()
+
+
+# The placeholder never changes, so it is rendered once
+_EMPTY_IMAGE = _build_empty_placeholder()
+
+
+@functools.lru_cache(maxsize=64)
+def _render_image(field_filter: str, degree_filter: str) -> bytes:
+    """Render the flow diagram for a filter combination.
+
+    ALUMNI_DATA is never modified after startup, so the image only depends on
+    the two dropdown values and is rendered once per process.
+    """
+    paths = extract_paths(_filters_for(field_filter, degree_filter))
+    if not paths:
+        return _EMPTY_IMAGE
+    return create_flow_visualization(paths)
+
+
+@functools.lru_cache(maxsize=64)
+def _render_cached(field_filter: str, degree_filter: str) -> Tuple[str, Dict]:
+    """Return the image URL and statistics for a filter combination.
+
+    The image itself is served by the /viz route, so the callback response
+    only carries its URL.
+    """
+    paths = extract_paths(_filters_for(field_filter, degree_filter))
+
+    img_src = (f"/viz/{_url_slug(field_filter)}/{_url_slug(degree_filter)}.webp"
+               f"?v={_CACHE_VERSION}")
+
+    # Calculate statistics
+    stats = get_statistics(paths)
+
+    return img_src, stats
+
+
+def precompute_visualizations():
+    """Render every filter combination up front so requests are served from memory."""
+    for field_filter in FIELD_FILTERS:
+        for degree_filter in DEGREE_FILTERS:
+            _render_image(field_filter, degree_filter)
+
+
 # ==========================================
 # DASH APP
 # ==========================================
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
 app.title = "CDTM Alumni Education Paths"
 
+# WSGI entry point for production servers, e.g.
+#   gunicorn -w 4 -k gthread --threads 2 app:server
+server = app.server
+
+
+@server.route('/viz/<field_slug>/<degree_slug>.webp')
+def serve_visualization(field_slug, degree_slug):
+    """Serve the rendered flow diagram for a filter combination."""
+    field_filter = _FIELD_BY_SLUG.get(field_slug)
+    degree_filter = _DEGREE_BY_SLUG.get(degree_slug)
+    if field_filter is None or degree_filter is None:
+        flask.abort(404)
+
+    response = flask.Response(_render_image(field_filter, degree_filter), mimetype='image/webp')
+    # URLs are versioned, so browsers may keep the image
+    response.headers['Cache-Control'] = 'public, max-age=86400'
+    return response
+
 # Layout
 app.layout = dbc.Container([
     dbc.Row([
@@ -576,31 +766,7 @@ app.layout = dbc.Container([
 def update_visualization(field_filter, degree_filter):
     """Update the visualization based on filters."""
 
-    filters = {
-        'field': field_filter if field_filter != 'All' else None,
-        'degree': degree_filter if degree_filter != 'All' else None
-    }
-
-    # Extract paths
-    paths = extract_paths(ALUMNI_DATA, filters)
-
-    # Create visualization
-    if paths:
-        img_src = create_flow_visualization(paths)
-    else:
-        # Create empty placeholder
-        fig, ax = plt.subplots(figsize=(18, 10))
-        ax.text(0.5, 0.5, 'No data matches the selected filters',
-               ha='center', va='center', fontsize=16, color='#64748b')
-        ax.axis('off')
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', dpi=100)
-        buf.seek(0)
-        img_src = f"data:image/png;base64,{base64.b64encode(buf.read()).decode('utf-8')}"
-        plt.close(fig)
-
-    # Calculate statistics
-    stats = get_statistics(paths)
+    img_src, stats = _render_cached(field_filter, degree_filter)
 
     # Create statistics panel
     if stats:
@@ -654,4 +820,13 @@ if __name__ == '__main__':
     print("\nPress Ctrl+C to stop the server")
     print("="*60 + "\n")
 
-    app.run(debug=True, host='0.0.0.0', port=8050)
+    print("Rendering visualizations for all filter combinations...")
+    precompute_visualizations()
+
+    # Debug mode (hot reload, dev tools, prop validation) slows every callback,
+    # so it is only enabled on request
+    if os.environ.get('DASH_DEV'):
+        app.run(debug=True, host='0.0.0.0', port=8050)
+    else:
+        print("For production, serve with: gunicorn -w 4 -k gthread --threads 2 app:server\n")
+        app.run(debug=False, host='0.0.0.0', port=8050)
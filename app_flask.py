@@ -3,59 +3,81 @@
 Simple Flask web application serving interactive Plotly visualization.
 """
 
-from flask import Flask, render_template_string, jsonify, request
+from flask import Flask, Response, render_template_string, request
+import functools
 import json
-import plotly.graph_objects as go
+import math
+import re
+import zlib
+import plotly.io as pio
+import plotly.utils
 import numpy as np
-from collections import defaultdict, Counter
 from typing import Dict, List, Tuple
 
+try:
+    import orjson  # Faster JSON parsing at startup and response serialization
+except ImportError:
+    orjson = None
+
 app = Flask(__name__)
 
 # Data loading
+def _load_json(path: str):
+    """Parse a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 def load_data():
     """Load alumni and schools data."""
-    with open('data/cdtm_alumni_consolidated.json', 'r', encoding='utf-8') as f:
-        alumni_data = json.load(f)
-    with open('data/unique_schools_normalized.json', 'r', encoding='utf-8') as f:
-        schools_data = json.load(f)
+    alumni_data = _load_json('data/cdtm_alumni_consolidated.json')
+    schools_data = _load_json('data/unique_schools_normalized.json')
     return alumni_data, schools_data
 
 
 ALUMNI_DATA, SCHOOLS_DATA = load_data()
 
 
+def _keyword_pattern(terms: List[str]) -> re.Pattern:
+    """Compile a case-insensitive substring alternation for the given terms."""
+    return re.compile('|'.join(re.escape(term) for term in terms), re.IGNORECASE)
+
+
+# Checked in order, the first matching category wins
+_DEGREE_PATTERNS = [
+    ("Bachelor's", _keyword_pattern(['bachelor', 'b.sc', 'b.a', 'b.eng', 'bsc'])),
+    ("Master's", _keyword_pattern(['master', 'm.sc', 'm.a', 'm.eng', 'msc', 'mba'])),
+    ("Doctorate", _keyword_pattern(['phd', 'ph.d', 'doctor', 'doctorate'])),
+    ("Diploma", _keyword_pattern(['dipl', 'diploma'])),
+]
+
+_FIELD_PATTERNS = [
+    ("Engineering/Tech", _keyword_pattern(['engineering', 'computer science', 'informatics', 'technology', 'cs', 'electrical', 'mechanical'])),
+    ("Business", _keyword_pattern(['business', 'management', 'economics', 'mba', 'finance', 'marketing'])),
+    ("Sciences", _keyword_pattern(['science', 'physics', 'chemistry', 'biology', 'mathematics', 'math'])),
+]
+
+
+@functools.lru_cache(maxsize=4096)
 def categorize_degree(degree: str, field: str) -> str:
     if not degree:
         return "Other"
-    degree_lower = degree.lower()
-    if any(term in degree_lower for term in ['bachelor', 'b.sc', 'b.a', 'b.eng', 'bsc']):
-        return "Bachelor's"
-    if any(term in degree_lower for term in ['master', 'm.sc', 'm.a', 'm.eng', 'msc', 'mba']):
-        return "Master's"
-    if any(term in degree_lower for term in ['phd', 'ph.d', 'doctor', 'doctorate']):
-        return "Doctorate"
-    if any(term in degree_lower for term in ['dipl', 'diploma']):
-        return "Diploma"
+    for category, pattern in _DEGREE_PATTERNS:
+        if pattern.search(degree):
+            return category
     return "Other"
 
 
+@functools.lru_cache(maxsize=4096)
 def categorize_field(field: str) -> str:
     if not field:
         return "Other"
-    field_lower = field.lower()
-
-    engineering_keywords = ['engineering', 'computer science', 'informatics', 'technology', 'cs', 'electrical', 'mechanical']
-    business_keywords = ['business', 'management', 'economics', 'mba', 'finance', 'marketing']
-    science_keywords = ['science', 'physics', 'chemistry', 'biology', 'mathematics', 'math']
-
-    if any(kw in field_lower for kw in engineering_keywords):
-        return "Engineering/Tech"
-    if any(kw in field_lower for kw in business_keywords):
-        return "Business"
-    if any(kw in field_lower for kw in science_keywords):
-        return "Sciences"
-
+    for category, pattern in _FIELD_PATTERNS:
+        if pattern.search(field):
+            return category
     return "Other"
 
 
@@ -86,36 +108,82 @@ def define_stations() -> Dict[str, Tuple[float, float]]:
     return stations
 
 
-def extract_paths(alumni_data: List[Dict], filters: Dict = None):
-    """Extract education paths from alumni data."""
-    paths = []
+def _preprocess(person: Dict) -> Dict:
+    """Categorize one alumnus's education entries.
+
+    CDTM entries are dropped from the entry list; cdtm_level keeps the index
+    of the last one, as extract_paths used to compute it.
+    """
+    entries = []
+    cdtm_level = None
 
-    for person in alumni_data:
-        education_path = person.get('education_path', [])
-        if not education_path:
+    for idx, entry in enumerate(person.get('education_path', [])):
+        institution = entry.get('institution', '')
+        degree = entry.get('degree_name', '')
+        field = entry.get('field_of_study', '')
+
+        if 'CDTM' in institution.upper() or 'CENTER FOR DIGITAL TECHNOLOGY' in institution.upper():
+            cdtm_level = idx
             continue
 
-        all_entries = []
-        cdtm_level = None
+        entries.append((categorize_degree(degree, field), categorize_field(field), institution))
+
+    # First non-"Other" field overall and among the entries of each degree,
+    # i.e. the primary field without filters and with a degree filter
+    primary_field = next((f for _, f, _ in entries if f != "Other"), "Other")
+    primary_field_by_degree = {}
+    for degree, field, _ in entries:
+        if field != "Other":
+            primary_field_by_degree.setdefault(degree, field)
+
+    return {
+        'entries': tuple(entries),
+        'cdtm_level': cdtm_level,
+        'primary_field': primary_field,
+        'primary_field_by_degree': primary_field_by_degree,
+        'name': person.get('full_name', 'Unknown'),
+        'headline': person.get('headline', ''),
+        'linkedin_url': person.get('linkedin_url', '')
+    }
 
-        for idx, entry in enumerate(education_path):
-            institution = entry.get('institution', '')
-            degree = entry.get('degree_name', '')
-            field = entry.get('field_of_study', '')
 
-            if 'CDTM' in institution.upper() or 'CENTER FOR DIGITAL TECHNOLOGY' in institution.upper():
-                cdtm_level = idx
-                continue
+# Categorization only depends on the static data, so it runs once at startup.
+# Never mutated afterwards, so gunicorn --preload workers share it copy-on-write.
+PREPROCESSED_ALUMNI = tuple(_preprocess(p) for p in ALUMNI_DATA if p.get('education_path'))
+
+
+# Station positions never change, so the per-node drawing data is built once
+STATIONS = define_stations()
+STATION_NAMES = list(STATIONS)
+STATION_SX = np.array([sx for sx, _ in STATIONS.values()])
+STATION_SY = np.array([sy for _, sy in STATIONS.values()])
+STATION_IS_CDTM = np.array([name == "CDTM" for name in STATION_NAMES])
+STATION_LABELS = [name.replace('|', '<br>') for name in STATION_NAMES]
+STATION_TEXT_POSITIONS = ["top center" if sy > 3.5 else "bottom center" for sy in STATION_SY]
+
+# (degree, field) of a path node -> station index; CDTM nodes use ("CDTM", "CDTM")
+STATION_INDEX = {tuple(name.split('|')) if name != "CDTM" else ("CDTM", "CDTM"): idx
+                 for idx, name in enumerate(STATION_NAMES)}
+CDTM_STATION = STATION_INDEX[("CDTM", "CDTM")]
 
-            categorized_degree = categorize_degree(degree, field)
-            categorized_field = categorize_field(field)
 
+def extract_paths(filters: Dict = None):
+    """Extract education paths from the preprocessed alumni."""
+    paths = []
+
+    for person in PREPROCESSED_ALUMNI:
+        all_entries = []
+        first_by_degree = {}  # Degree -> index of its first kept entry
+        cdtm_level = person['cdtm_level']
+
+        for categorized_degree, categorized_field, institution in person['entries']:
             if filters:
                 if filters.get('field') and categorized_field != filters['field']:
                     continue
                 if filters.get('degree') and categorized_degree != filters['degree']:
                     continue
 
+            first_by_degree.setdefault(categorized_degree, len(all_entries))
             all_entries.append({
                 'degree': categorized_degree,
                 'field': categorized_field,
@@ -127,18 +195,14 @@ def extract_paths(alumni_data: List[Dict], filters: Dict = None):
             continue
 
         if cdtm_level is not None:
-            bachelor_idx = next((i for i, e in enumerate(all_entries)
-                               if e['degree'] in ["Bachelor's", "Diploma"]), None)
+            # After the first Bachelor's/Diploma, else after the first Master's
+            bachelor_idx = min((first_by_degree[d] for d in ("Bachelor's", "Diploma")
+                                if d in first_by_degree), default=None)
 
             if bachelor_idx is not None:
                 insert_idx = bachelor_idx + 1
             else:
-                master_idx = next((i for i, e in enumerate(all_entries)
-                                 if e['degree'] == "Master's"), None)
-                if master_idx is not None:
-                    insert_idx = master_idx + 1
-                else:
-                    insert_idx = 1
+                insert_idx = first_by_degree.get("Master's", 0) + 1
 
             cdtm_node = {
                 'degree': 'CDTM',
@@ -149,38 +213,76 @@ def extract_paths(alumni_data: List[Dict], filters: Dict = None):
             }
             all_entries.insert(min(insert_idx, len(all_entries)), cdtm_node)
 
-        primary_field = None
-        for entry in all_entries:
-            if entry['field'] != "Other" and not entry.get('is_cdtm'):
-                primary_field = entry['field']
-                break
+        # With a field filter every kept entry has that field
+        if filters and filters.get('field'):
+            primary_field = filters['field']
+        elif filters and filters.get('degree'):
+            primary_field = person['primary_field_by_degree'].get(filters['degree'], "Other")
+        else:
+            primary_field = person['primary_field']
 
         if len(all_entries) >= 2:
             paths.append({
                 'nodes': all_entries,
-                'primary_field': primary_field or "Other",
-                'name': person.get('full_name', 'Unknown'),
-                'headline': person.get('headline', ''),
-                'linkedin_url': person.get('linkedin_url', '')
+                'primary_field': primary_field,
+                'name': person['name'],
+                'headline': person['headline'],
+                'linkedin_url': person['linkedin_url']
             })
 
     return paths
 
 
-def sigmoid_curve(p1: Tuple[float, float], p2: Tuple[float, float], n_points: int = 30):
-    """Generate sigmoid curve between two points."""
-    x1, y1 = p1
-    x2, y2 = p2
-    x = np.linspace(x1, x2, n_points)
-    t = (x - x1) / (x2 - x1) if x2 != x1 else np.zeros_like(x)
-    y = y1 + (y2 - y1) * (1 - np.cos(np.pi * t)) / 2
-    return x, y
+def sigmoid_curves(x1: np.ndarray, y1: np.ndarray, x2: np.ndarray, y2: np.ndarray,
+                   n_points: int = 30) -> Tuple[np.ndarray, np.ndarray]:
+    """Generate sigmoid curves for a batch of edges.
 
+    Takes 1-D arrays of start/end coordinates and returns (x, y) arrays of
+    shape (n_edges, n_points).
+    """
+    t = np.linspace(0.0, 1.0, n_points)
 
-def create_plotly_figure(paths: List[Dict]):
-    """Create Plotly figure with hover support."""
-    stations = define_stations()
+    # Flat for edges without horizontal extent
+    ease = np.where((x2 != x1)[:, None], (1 - np.cos(np.pi * t)) / 2, 0.0)
 
+    x = x1[:, None] + (x2 - x1)[:, None] * t
+    y = y1[:, None] + (y2 - y1)[:, None] * ease
+    return x, y
+
+
+# At most this many lines are drawn for alumni sharing the same path
+MAX_BUNDLE_LINES = 3
+
+# Number of alumni names listed in a bundled line's hover text
+MAX_HOVER_NAMES = 10
+
+# Filter-independent part of the figure layout, including the default
+# template go.Figure would apply
+BASE_LAYOUT = {
+    'template': pio.templates[pio.templates.default].to_plotly_json(),
+    'title': {
+        'text': "CDTM Alumni Education Pathways",
+        'x': 0.5,
+        'xanchor': 'center',
+        'font': {'size': 24}
+    },
+    'xaxis': {'range': [-0.5, 8], 'showgrid': False, 'showticklabels': False, 'zeroline': False},
+    'yaxis': {'range': [-0.5, 8], 'showgrid': False, 'showticklabels': False, 'zeroline': False},
+    'plot_bgcolor': 'white',
+    'paper_bgcolor': 'white',
+    'height': 800,
+    'hovermode': 'closest',
+    'hoverdistance': 20,
+}
+
+
+def create_plotly_figure(paths: List[Dict], seed: int = None) -> Dict:
+    """Create the Plotly figure dict with hover support.
+
+    Identical paths are bundled into at most MAX_BUNDLE_LINES lines. The
+    layout is BASE_LAYOUT plus the per-line hover data in layout.meta.
+    seed makes the line jitter reproducible; None draws fresh jitter.
+    """
     field_colors = {
         "Engineering/Tech": "#3b82f6",
         "Business": "#ef4444",
@@ -189,131 +291,219 @@ def create_plotly_figure(paths: List[Dict]):
         "CDTM": "#f59e0b"
     }
 
-    fig = go.Figure()
-    station_counts = Counter()
+    traces = []
 
-    # Draw paths
+    # Bucket paths with the same drawable station sequence and primary field
+    buckets = {}  # (edges, primary field) -> indices of the paths sharing them
     for path_idx, path_data in enumerate(paths):
         path_nodes = path_data['nodes']
-        primary_field = path_data['primary_field']
-        color = field_colors.get(primary_field, field_colors["Other"])
+        path_edges = []
 
-        alumni_name = path_data['name']
-        headline = path_data['headline']
-        linkedin_url = path_data.get('linkedin_url', '')
-        path_id = f"path_{path_idx}"
+        for current, next_node in zip(path_nodes, path_nodes[1:]):
+            current_station = STATION_INDEX.get((current['degree'], current['field']))
+            next_station = STATION_INDEX.get((next_node['degree'], next_node['field']))
 
-        hover_text = f'<b>{alumni_name}</b><br>{headline}'
-        if linkedin_url:
-            hover_text += f'<br><br>Click to open LinkedIn profile'
+            if current_station is None or next_station is None:
+                continue
 
-        for i in range(len(path_nodes) - 1):
-            current = path_nodes[i]
-            next_node = path_nodes[i + 1]
+            path_edges.append((current_station, next_station))
+
+        if path_edges:
+            buckets.setdefault((tuple(path_edges), path_data['primary_field']), []).append(path_idx)
+
+    # Draw at most MAX_BUNDLE_LINES lines per bucket, each standing for every
+    # n-th of its alumni
+    lines = []  # (edges, primary field, indices of the represented paths)
+    for (path_edges, primary_field), members in buckets.items():
+        n_lines = min(len(members), MAX_BUNDLE_LINES)
+        for j in range(n_lines):
+            lines.append((path_edges, primary_field, members[j::n_lines]))
+
+    # Collect the edges of all lines; station counts are weighted by the
+    # number of alumni a line stands for
+    edges = []  # (line index, current station, next station)
+    edge_keys = []  # Both station indices of every edge, for the node counts
+    edge_weights = []
+    for line_idx, (path_edges, _, members) in enumerate(lines):
+        for current_station, next_station in path_edges:
+            edges.append((line_idx, current_station, next_station))
+            edge_keys.append(current_station)
+            edge_keys.append(next_station)
+            edge_weights.extend((len(members), len(members)))
+
+    counts = np.bincount(np.array(edge_keys, dtype=int), weights=edge_weights,
+                         minlength=len(STATION_NAMES)).astype(int)
+
+    # Generate all curves in one batch
+    start_idx = np.array([current_station for _, current_station, _ in edges], dtype=int)
+    end_idx = np.array([next_station for _, _, next_station in edges], dtype=int)
+    jitter = np.random.default_rng(seed).uniform(-0.1, 0.1, size=(len(edges), 2))
+    curves_x, curves_y = sigmoid_curves(
+        STATION_SX[start_idx], STATION_SY[start_idx] + jitter[:, 0],
+        STATION_SX[end_idx], STATION_SY[end_idx] + jitter[:, 1]
+    )
 
-            if current.get('is_cdtm'):
-                current_key = "CDTM"
-            else:
-                current_key = f"{current['degree']}|{current['field']}"
+    # Hover text and LinkedIn URL, sent once per line in layout.meta
+    line_meta = []
+    for _, _, members in lines:
+        if len(members) == 1:
+            path_data = paths[members[0]]
+            linkedin_url = path_data.get('linkedin_url', '')
+            hover_text = f"<b>{path_data['name']}</b><br>{path_data['headline']}"
+            if linkedin_url:
+                hover_text += f'<br><br>Click to open LinkedIn profile'
+        else:
+            names = [paths[i]['name'] for i in members[:MAX_HOVER_NAMES]]
+            if len(members) > MAX_HOVER_NAMES:
+                names.append(f"... and {len(members) - MAX_HOVER_NAMES} more")
+            hover_text = f"<b>{len(members)} alumni</b><br>" + "<br>".join(names)
+
+            # Clicking opens the first represented profile with a URL
+            profile = next((paths[i] for i in members if paths[i].get('linkedin_url')), None)
+            linkedin_url = profile['linkedin_url'] if profile else ''
+            if profile:
+                hover_text += f"<br><br>Click to open {profile['name']}'s LinkedIn profile"
+        line_meta.append([hover_text, linkedin_url])
+
+    # Line width grows with the number of alumni a line stands for, in steps
+    # of 0.5 so lines share few traces
+    line_widths = [round(min(6.0, 2.5 + 0.3 * math.log(len(members))) * 2) / 2
+                   for _, _, members in lines]
+
+    # Group the edges into one multi-segment line trace per (color, alpha,
+    # width); segments are separated by None and each point's customdata is
+    # the index of its line in line_meta
+    groups = {}
+    for (line_idx, current_station, next_station), xs, ys in zip(edges, curves_x, curves_y):
+        if current_station == CDTM_STATION or next_station == CDTM_STATION:
+            line_color = field_colors["CDTM"]
+            line_alpha = 0.3
+        else:
+            line_color = field_colors.get(lines[line_idx][1], field_colors["Other"])
+            line_alpha = 0.2
+
+        group = groups.setdefault((line_color, line_alpha, line_widths[line_idx]),
+                                  {'x': [], 'y': [], 'customdata': []})
+        group['x'].extend(xs.tolist())
+        group['x'].append(None)
+        group['y'].extend(ys.tolist())
+        group['y'].append(None)
+        group['customdata'].extend([line_idx] * len(xs))
+        group['customdata'].append(None)
+
+    # Draw paths; the page fills in the per-point hover text from layout.meta.
+    # Traces are plain dicts, which skips go.Scatter's property validation.
+    for (line_color, line_alpha, line_width), group in groups.items():
+        traces.append({
+            'type': 'scatter',
+            'x': group['x'],
+            'y': group['y'],
+            'mode': 'lines',
+            'line': {'color': line_color, 'width': line_width},
+            'opacity': line_alpha,
+            'meta': {'opacity': line_alpha, 'width': line_width},
+            'hovertemplate': '%{text}<extra></extra>',
+            'hoverlabel': {
+                'bgcolor': line_color,
+                'font': {'size': 13, 'family': "Arial", 'color': "white"}
+            },
+            'customdata': group['customdata'],
+            'showlegend': False,
+        })
+
+    # Draw nodes: one trace for the CDTM node and one for all other stations
+    visited = counts > 0
+
+    for is_cdtm_node in (True, False):
+        selected = np.flatnonzero(visited & (STATION_IS_CDTM == is_cdtm_node))
+        if len(selected) == 0:
+            continue
 
-            if next_node.get('is_cdtm'):
-                next_key = "CDTM"
-            else:
-                next_key = f"{next_node['degree']}|{next_node['field']}"
+        if is_cdtm_node:
+            node_color = field_colors["CDTM"]
+            node_sizes = np.minimum(50, 15 + counts[selected] * 0.03)
+        else:
+            node_color = "#1e293b"
+            node_sizes = np.minimum(30, 10 + counts[selected] * 0.02)
+
+        traces.append({
+            'type': 'scatter',
+            'x': STATION_SX[selected],
+            'y': STATION_SY[selected],
+            'mode': 'markers+text',
+            'marker': {
+                'size': node_sizes,
+                'color': node_color,
+                'line': {'color': 'white', 'width': 2}
+            },
+            'text': [STATION_LABELS[i] for i in selected],
+            'textposition': [STATION_TEXT_POSITIONS[i] for i in selected],
+            'textfont': {'size': 10 if is_cdtm_node else 8, 'color': node_color},
+            'customdata': counts[selected],
+            'hovertemplate': '<b>%{text}</b><br>%{customdata} alumni<extra></extra>',
+            'showlegend': False
+        })
+
+    return {
+        'data': traces,
+        'layout': {**BASE_LAYOUT, 'meta': line_meta}
+    }
 
-            if current_key not in stations or next_key not in stations:
-                continue
 
-            x1, y1 = stations[current_key]
-            x2, y2 = stations[next_key]
+def _make_filters(field_filter: str, degree_filter: str) -> Dict:
+    """Map dropdown values to extract_paths filters ('All' disables a filter)."""
+    return {
+        'field': field_filter if field_filter != 'All' else None,
+        'degree': degree_filter if degree_filter != 'All' else None
+    }
 
-            y_jitter_start = np.random.uniform(-0.1, 0.1)
-            y_jitter_end = np.random.uniform(-0.1, 0.1)
 
-            xs, ys = sigmoid_curve(
-                (x1, y1 + y_jitter_start),
-                (x2, y2 + y_jitter_end)
-            )
+@functools.lru_cache(maxsize=32)
+def extract_paths_cached(field_filter: str, degree_filter: str) -> Tuple[Dict, ...]:
+    """extract_paths memoized per filter combination.
 
-            if current.get('is_cdtm') or next_node.get('is_cdtm'):
-                line_color = field_colors["CDTM"]
-                line_alpha = 0.3
-            else:
-                line_color = color
-                line_alpha = 0.2
-
-            fig.add_trace(go.Scatter(
-                x=xs,
-                y=ys,
-                mode='lines',
-                line=dict(color=line_color, width=2.5),
-                opacity=line_alpha,
-                hovertemplate=hover_text + '<extra></extra>',
-                hoverlabel=dict(
-                    bgcolor=line_color,
-                    font_size=13,
-                    font_family="Arial",
-                    font_color="white"
-                ),
-                customdata=[[path_id, line_color, line_alpha, linkedin_url]] * len(xs),
-                showlegend=False,
-                name=path_id,
-            ))
-
-            station_counts[current_key] += 1
-            station_counts[next_key] += 1
-
-    # Draw nodes
-    for station_name, (sx, sy) in stations.items():
-        count = station_counts.get(station_name, 0)
-        if count == 0:
-            continue
+    PREPROCESSED_ALUMNI is read-only after startup, so results never go stale.
+    """
+    return tuple(extract_paths(_make_filters(field_filter, degree_filter)))
 
-        is_cdtm_node = (station_name == "CDTM")
 
-        if is_cdtm_node:
-            node_color = field_colors["CDTM"]
-            node_size = min(50, 15 + count * 0.03)
-            label = "CDTM"
-        else:
-            node_color = "#1e293b"
-            node_size = min(30, 10 + count * 0.02)
-            degree, field = station_name.split('|')
-            label = f"{degree}<br>{field}"
-
-        fig.add_trace(go.Scatter(
-            x=[sx],
-            y=[sy],
-            mode='markers+text',
-            marker=dict(
-                size=node_size,
-                color=node_color,
-                line=dict(color='white', width=2)
-            ),
-            text=label,
-            textposition="top center" if sy > 3.5 else "bottom center",
-            textfont=dict(size=10 if is_cdtm_node else 8, color=node_color),
-            hovertemplate=f'<b>{label}</b><br>{count} alumni<extra></extra>',
-            showlegend=False
-        ))
-
-    fig.update_layout(
-        title={
-            'text': "CDTM Alumni Education Pathways",
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 24}
-        },
-        xaxis=dict(range=[-0.5, 8], showgrid=False, showticklabels=False, zeroline=False),
-        yaxis=dict(range=[-0.5, 8], showgrid=False, showticklabels=False, zeroline=False),
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        height=800,
-        hovermode='closest',
-        hoverdistance=20,
-    )
+def build_graph_payload(field_filter: str, degree_filter: str) -> Dict:
+    """Build the /api/graph response body for one filter combination."""
+    paths = extract_paths_cached(field_filter, degree_filter)
+    # Seed from the filters so every worker renders the same jitter
+    seed = zlib.crc32(f"{field_filter}|{degree_filter}".encode('utf-8'))
+    figure = create_plotly_figure(paths, seed)
+
+    # Calculate statistics
+    total = len(paths)
+    with_cdtm = sum(1 for p in paths if any(n.get('is_cdtm') for n in p['nodes']))
+
+    if total > 0:
+        stats_html = f"""
+            <strong>📊 Statistics:</strong> {total} alumni paths shown
+            ({with_cdtm} include CDTM - {with_cdtm/total*100:.0f}%)
+        """
+    else:
+        stats_html = "<strong>📊 Statistics:</strong> No alumni paths match the selected filters"
 
-    return fig
+    return {
+        'data': figure['data'],
+        'layout': figure['layout'],
+        'stats': stats_html
+    }
+
+
+@functools.lru_cache(maxsize=32)
+def graph_response_body(field_filter: str, degree_filter: str) -> bytes:
+    """Serialized /api/graph body, memoized per filter combination.
+
+    The figure is rendered and serialized once per combination, so its jitter
+    stays fixed for the lifetime of the process.
+    """
+    payload = build_graph_payload(field_filter, degree_filter)
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload, cls=plotly.utils.PlotlyJSONEncoder).encode('utf-8')
 
 
 HTML_TEMPLATE = """
@@ -461,6 +651,27 @@ HTML_TEMPLATE = """
     <script>
         var currentFilters = {field: 'All', degree: 'All'};
         var hoveredPath = null;
+        var highlightCount = 0;  // Highlight traces appended after the figure's own traces
+
+        // Indices of the multi-segment path traces (highlight traces carry no customdata)
+        function lineTraceIndices(graphDiv) {
+            var indices = [];
+            for (var i = 0; i < graphDiv.data.length; i++) {
+                var trace = graphDiv.data[i];
+                if (trace.mode === 'lines' && trace.customdata) indices.push(i);
+            }
+            return indices;
+        }
+
+        function clearHighlight(graphDiv) {
+            if (highlightCount === 0) return Promise.resolve();
+            var indices = [];
+            for (var i = graphDiv.data.length - highlightCount; i < graphDiv.data.length; i++) {
+                indices.push(i);
+            }
+            highlightCount = 0;
+            return Plotly.deleteTraces(graphDiv, indices);
+        }
 
         function loadGraph() {
             var url = '/api/graph?field=' + currentFilters.field + '&degree=' + currentFilters.degree;
@@ -476,6 +687,19 @@ HTML_TEMPLATE = """
                     console.log('Number of traces:', data.data.length);
                     console.log('Layout:', data.layout);
 
+                    // newPlot replaces any highlight traces of the previous graph
+                    hoveredPath = null;
+                    highlightCount = 0;
+
+                    // Per-point hover text from the per-line table in layout.meta
+                    var lineMeta = data.layout.meta || [];
+                    data.data.forEach(function(trace) {
+                        if (trace.mode !== 'lines') return;
+                        trace.text = trace.customdata.map(function(lineIdx) {
+                            return lineIdx === null ? null : lineMeta[lineIdx][0];
+                        });
+                    });
+
                     Plotly.newPlot('graph', data.data, data.layout, {displayModeBar: true})
                         .then(() => {
                             console.log('Graph plotted successfully');
@@ -488,32 +712,43 @@ HTML_TEMPLATE = """
                             graphDiv.on('plotly_hover', function(eventData) {
                                 console.log('Hover event:', eventData);
                                 var point = eventData.points[0];
-                                if (!point.data.customdata || !point.data.customdata[0]) return;
+                                if (point.data.mode !== 'lines' || point.customdata === null) return;
 
-                                var pathId = point.data.customdata[0][0];
+                                var pathId = point.customdata;
                                 console.log('Hovered path:', pathId);
                                 if (hoveredPath === pathId) return;
                                 hoveredPath = pathId;
 
-                                var update = {opacity: [], 'line.width': []};
-                                for (var i = 0; i < graphDiv.data.length; i++) {
+                                // Copy the hovered path's segments into highlight traces
+                                var lineIndices = lineTraceIndices(graphDiv);
+                                var highlights = [];
+                                lineIndices.forEach(function(i) {
                                     var trace = graphDiv.data[i];
-                                    if (trace.mode === 'lines' && trace.customdata) {
-                                        var tracePathId = trace.customdata[0][0];
-                                        if (tracePathId === pathId) {
-                                            update.opacity.push(1.0);
-                                            update['line.width'].push(5);
-                                        } else {
-                                            update.opacity.push(0.03);
-                                            update['line.width'].push(1.5);
+                                    var xs = [], ys = [];
+                                    for (var j = 0; j < trace.customdata.length; j++) {
+                                        if (trace.customdata[j] === pathId) {
+                                            xs.push(trace.x[j]);
+                                            ys.push(trace.y[j]);
+                                        } else if (xs.length && xs[xs.length - 1] !== null) {
+                                            xs.push(null);
+                                            ys.push(null);
                                         }
-                                    } else {
-                                        update.opacity.push(trace.opacity !== undefined ? trace.opacity : 1);
-                                        update['line.width'].push(trace.marker ? trace.marker.size : 1);
                                     }
-                                }
+                                    if (xs.length) {
+                                        highlights.push({
+                                            x: xs, y: ys, mode: 'lines',
+                                            line: {color: trace.line.color, width: Math.max(5, trace.meta.width + 1)},
+                                            opacity: 1.0, hoverinfo: 'skip', showlegend: false
+                                        });
+                                    }
+                                });
+
                                 console.log('Applying hover style');
-                                Plotly.restyle(graphDiv, update);
+                                clearHighlight(graphDiv).then(function() {
+                                    Plotly.restyle(graphDiv, {opacity: 0.03, 'line.width': 1.5}, lineIndices);
+                                    highlightCount = highlights.length;
+                                    return Plotly.addTraces(graphDiv, highlights);
+                                });
                             });
 
                             graphDiv.on('plotly_unhover', function() {
@@ -521,28 +756,25 @@ HTML_TEMPLATE = """
                                 if (hoveredPath === null) return;
                                 hoveredPath = null;
 
-                                var update = {opacity: [], 'line.width': []};
-                                for (var i = 0; i < graphDiv.data.length; i++) {
-                                    var trace = graphDiv.data[i];
-                                    if (trace.mode === 'lines' && trace.customdata) {
-                                        var originalAlpha = trace.customdata[0][2];
-                                        update.opacity.push(originalAlpha);
-                                        update['line.width'].push(2.5);
-                                    } else {
-                                        update.opacity.push(trace.opacity !== undefined ? trace.opacity : 1);
-                                        update['line.width'].push(trace.marker ? trace.marker.size : 1);
-                                    }
-                                }
+                                var lineIndices = lineTraceIndices(graphDiv);
+                                var originalAlphas = lineIndices.map(function(i) {
+                                    return graphDiv.data[i].meta.opacity;
+                                });
+                                var originalWidths = lineIndices.map(function(i) {
+                                    return graphDiv.data[i].meta.width;
+                                });
                                 console.log('Resetting to normal style');
-                                Plotly.restyle(graphDiv, update);
+                                clearHighlight(graphDiv).then(function() {
+                                    Plotly.restyle(graphDiv, {opacity: originalAlphas, 'line.width': originalWidths}, lineIndices);
+                                });
                             });
 
                             graphDiv.on('plotly_click', function(eventData) {
                                 console.log('Click event:', eventData);
                                 var point = eventData.points[0];
-                                if (!point.data.customdata || !point.data.customdata[0]) return;
+                                if (point.data.mode !== 'lines' || point.customdata === null) return;
 
-                                var linkedinUrl = point.data.customdata[0][3];
+                                var linkedinUrl = graphDiv.layout.meta[point.customdata][1];
                                 if (linkedinUrl) {
                                     console.log('Opening LinkedIn:', linkedinUrl);
                                     window.open(linkedinUrl, '_blank');
@@ -595,34 +827,7 @@ def get_graph():
     field_filter = request.args.get('field', 'All')
     degree_filter = request.args.get('degree', 'All')
 
-    filters = {
-        'field': field_filter if field_filter != 'All' else None,
-        'degree': degree_filter if degree_filter != 'All' else None
-    }
-
-    paths = extract_paths(ALUMNI_DATA, filters)
-    fig = create_plotly_figure(paths)
-
-    # Calculate statistics
-    total = len(paths)
-    with_cdtm = sum(1 for p in paths if any(n.get('is_cdtm') for n in p['nodes']))
-
-    if total > 0:
-        stats_html = f"""
-            <strong>📊 Statistics:</strong> {total} alumni paths shown
-            ({with_cdtm} include CDTM - {with_cdtm/total*100:.0f}%)
-        """
-    else:
-        stats_html = "<strong>📊 Statistics:</strong> No alumni paths match the selected filters"
-
-    # Convert Plotly figure to JSON-serializable dict
-    fig_dict = fig.to_dict()
-
-    return jsonify({
-        'data': fig_dict['data'],
-        'layout': fig_dict['layout'],
-        'stats': stats_html
-    })
+    return Response(graph_response_body(field_filter, degree_filter), mimetype='application/json')
 
 
 if __name__ == '__main__':
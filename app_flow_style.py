@@ -4,35 +4,56 @@ Interactive Dash web application for visualizing CDTM alumni education paths
 using flow-style matplotlib visualization with sigmoid curves.
 """
 
+import functools
 import json
 import io
-import base64
+import os
+import threading
+from urllib.parse import urlencode
 import dash
 from dash import dcc, html, Input, Output
 import dash_bootstrap_components as dbc
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
+from flask import Response, request
 import matplotlib.patches as mpatches
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+from matplotlib.figure import Figure
 import numpy as np
-from collections import defaultdict, Counter
+from PIL import Image
 from typing import Dict, List, Tuple
 
 
+try:
+    import orjson  # Faster JSON parsing at startup
+except ImportError:
+    orjson = None
+
+
 # ==========================================
 # DATA LOADING
 # ==========================================
+def _load_json(path: str):
+    """Parse a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 def load_data():
     """Load alumni and schools data from JSON files."""
-    with open('data/cdtm_alumni_consolidated.json', 'r', encoding='utf-8') as f:
-        alumni_data = json.load(f)
-    with open('data/unique_schools_normalized.json', 'r', encoding='utf-8') as f:
-        schools_data = json.load(f)
+    alumni_data = _load_json('data/cdtm_alumni_consolidated.json')
+    schools_data = _load_json('data/unique_schools_normalized.json')
     return alumni_data, schools_data
 
 
 ALUMNI_DATA, SCHOOLS_DATA = load_data()
 
+# Random generator for the line jitter, shared by all renders
+RNG = np.random.default_rng()
+
 
 # ==========================================
 # DATA PROCESSING FUNCTIONS
@@ -91,60 +112,120 @@ def get_institution_type(school_name: str) -> str:
     return 'University'
 
 
-def extract_paths(alumni_data: List[Dict], filters: Dict = None) -> List[Dict]:
-    """Extract education paths from alumni data with optional filtering."""
-    paths = []
+def build_path_nodes(person: Dict) -> Tuple[List[Dict], str]:
+    """Build a person's path nodes (without CDTM) and primary field.
+
+    The primary field is the first non-Other field, or None if there is none.
+    """
+    path_nodes = []
+    primary_field = None
 
-    for person in alumni_data:
-        education_path = person.get('education_path', [])
-        if not education_path:
+    for edu in person.get('education_path', []):
+        school = edu.get('school', '')
+        degree = edu.get('degree', '')
+        field = edu.get('field', '')
+
+        # Skip CDTM
+        if 'CDTM' in school or 'Center for Digital Technology' in school:
             continue
 
-        # Build path
-        path_nodes = []
-        primary_field = None
+        degree_level = categorize_degree(degree, field)
+        field_category = categorize_field(field, degree)
+        institution_type = get_institution_type(school)
+
+        # Track primary field (first non-Other field)
+        if primary_field is None and field_category != "Other":
+            primary_field = field_category
 
-        for edu in education_path:
-            school = edu.get('school', '')
-            degree = edu.get('degree', '')
-            field = edu.get('field', '')
+        path_nodes.append({
+            'degree': degree_level,
+            'field': field_category,
+            'institution': institution_type
+        })
 
-            # Skip CDTM
-            if 'CDTM' in school or 'Center for Digital Technology' in school:
-                continue
+    return path_nodes, primary_field
 
-            degree_level = categorize_degree(degree, field)
-            field_category = categorize_field(field, degree)
-            institution_type = get_institution_type(school)
 
-            # Track primary field (first non-Other field)
-            if primary_field is None and field_category != "Other":
-                primary_field = field_category
+# Category labels and their integer codes in the column arrays
+FIELD_CATEGORIES = ["Engineering/Tech", "Business", "Sciences", "Other"]
+DEGREE_CATEGORIES = ["Bachelor's", "Master's", "Doctorate", "Diploma", "Other"]
+FIELD_CODES = {field: code for code, field in enumerate(FIELD_CATEGORIES)}
+DEGREE_CODES = {degree: code for code, degree in enumerate(DEGREE_CATEGORIES)}
 
-            path_nodes.append({
-                'degree': degree_level,
-                'field': field_category,
-                'institution': institution_type
-            })
 
-        # Apply filters
-        if filters:
-            if filters.get('field') and filters['field'] != 'All':
-                if primary_field != filters['field']:
-                    continue
+def build_columns(alumni_data: List[Dict]) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+    """Flatten all education paths into column arrays.
 
-            if filters.get('degree') and filters['degree'] != 'All':
-                if not any(node['degree'] == filters['degree'] for node in path_nodes):
-                    continue
+    Returns NODES with one entry per path node ('alumni_id', 'degree',
+    'field', 'station_id'; -1 for nodes without a station) and ALUMNI with
+    one entry per person ('primary_field', 'known_primary_field',
+    'node_start', 'node_end'). People without a path of at least two nodes
+    get an empty node range; a missing primary field shows as Other.
+    """
+    node_alumni_ids, node_degrees, node_fields, node_station_ids = [], [], [], []
+    primary_fields = np.full(len(alumni_data), FIELD_CODES["Other"], dtype=np.int8)
+    known_primary_fields = np.zeros(len(alumni_data), dtype=bool)
+    node_starts = np.zeros(len(alumni_data), dtype=np.int32)
+    node_ends = np.zeros(len(alumni_data), dtype=np.int32)
+
+    for alumni_idx, person in enumerate(alumni_data):
+        path_nodes, primary_field = build_path_nodes(person)
+        node_starts[alumni_idx] = len(node_degrees)
 
         if len(path_nodes) >= 2:  # Need at least 2 nodes for a path
-            paths.append({
-                'nodes': path_nodes,
-                'primary_field': primary_field or "Other",
-                'name': person.get('full_name', 'Unknown')
-            })
+            for node in path_nodes:
+                node_alumni_ids.append(alumni_idx)
+                node_degrees.append(DEGREE_CODES[node['degree']])
+                node_fields.append(FIELD_CODES[node['field']])
+                node_station_ids.append(STATION_ID.get((node['degree'], node['field']), -1))
+
+            if primary_field is not None:
+                primary_fields[alumni_idx] = FIELD_CODES[primary_field]
+                known_primary_fields[alumni_idx] = True
+
+        node_ends[alumni_idx] = len(node_degrees)
+
+    nodes = {
+        'alumni_id': np.array(node_alumni_ids, dtype=np.int32),
+        'degree': np.array(node_degrees, dtype=np.int8),
+        'field': np.array(node_fields, dtype=np.int8),
+        'station_id': np.array(node_station_ids, dtype=np.int16),
+    }
+    alumni = {
+        'primary_field': primary_fields,
+        'known_primary_field': known_primary_fields,
+        'node_start': node_starts,
+        'node_end': node_ends,
+    }
+    return nodes, alumni
+
+
+def extract_paths(filters: Dict = None) -> np.ndarray:
+    """Select the alumni whose education path matches the filters.
+
+    Returns their indices into ALUMNI, in ascending order.
+    """
+    mask = ALUMNI['node_end'] - ALUMNI['node_start'] >= 2
+
+    if filters:
+        # A missing primary field is shown as Other but matches no field filter
+        if filters.get('field') and filters['field'] != 'All':
+            mask &= ALUMNI['known_primary_field']
+            mask &= ALUMNI['primary_field'] == FIELD_CODES.get(filters['field'], -1)
 
-    return paths
+        if filters.get('degree') and filters['degree'] != 'All':
+            has_degree = np.zeros(len(mask), dtype=bool)
+            has_degree[NODES['alumni_id'][NODES['degree'] == DEGREE_CODES.get(filters['degree'], -1)]] = True
+            mask &= has_degree
+
+    return np.flatnonzero(mask)
+
+
+def concat_ranges(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Concatenate the integer ranges [start, end) without a Python loop."""
+    lengths = ends - starts
+    offsets = np.cumsum(lengths) - lengths
+    return np.repeat(starts - offsets, lengths) + np.arange(lengths.sum())
 
 
 def define_stations() -> Dict[str, Tuple[float, float]]:
@@ -182,177 +263,336 @@ def define_stations() -> Dict[str, Tuple[float, float]]:
     return stations
 
 
-def sigmoid_curve(p1: Tuple[float, float], p2: Tuple[float, float], n_points: int = 100) -> Tuple[np.ndarray, np.ndarray]:
-    """Generate an S-curve between two points."""
-    x1, y1 = p1
-    x2, y2 = p2
+# Station tables indexed by station id, in define_stations order
+STATIONS = define_stations()
+STATION_NAMES = list(STATIONS)
+STATIONS_X = np.array([sx for sx, _ in STATIONS.values()], dtype=np.float64)
+STATIONS_Y = np.array([sy for _, sy in STATIONS.values()], dtype=np.float64)
+
+# Station id for each (degree, field) pair; pairs without a station get -1
+STATION_ID = {tuple(name.split('|')): sid for sid, name in enumerate(STATION_NAMES)}
 
-    x = np.linspace(x1, x2, n_points)
+NODES, ALUMNI = build_columns(ALUMNI_DATA)
 
-    # Sigmoid easing using cosine
-    t = (x - x1) / (x2 - x1) if x2 != x1 else np.zeros_like(x)
-    y = y1 + (y2 - y1) * (1 - np.cos(np.pi * t)) / 2
 
-    return x, y
+def sigmoid_curves(x1: np.ndarray, y1: np.ndarray, x2: np.ndarray, y2: np.ndarray,
+                   n_points: int = 100) -> np.ndarray:
+    """Generate S-curves for a batch of edges.
+
+    Takes 1-D arrays of start/end coordinates and returns the curve points
+    as a float32 array of shape (n_edges, n_points, 2); pass float32
+    coordinates to keep the whole computation in float32.
+    """
+    t = np.linspace(0.0, 1.0, n_points, dtype=np.float32)
+
+    # Sigmoid easing using cosine; flat for edges without horizontal extent
+    ease = np.where((x2 != x1)[:, None], (1 - np.cos(np.pi * t)) / 2, 0.0)
+
+    x = x1[:, None] + (x2 - x1)[:, None] * t
+    y = y1[:, None] + (y2 - y1)[:, None] * ease
+    return np.stack([x, y], axis=-1)
 
 
 # ==========================================
 # VISUALIZATION FUNCTION
 # ==========================================
-def create_flow_visualization(paths: List[Dict]) -> str:
-    """Create flow visualization and return as base64 encoded image."""
+# Colors for the different fields
+FIELD_COLORS = {
+    "Engineering/Tech": "#3b82f6",  # Blue
+    "Business": "#ef4444",           # Red
+    "Sciences": "#10b981",           # Green
+    "Other": "#94a3b8"               # Gray
+}
 
-    stations = define_stations()
 
-    # Define colors for different fields
-    field_colors = {
-        "Engineering/Tech": "#3b82f6",  # Blue
-        "Business": "#ef4444",           # Red
-        "Sciences": "#10b981",           # Green
-        "Other": "#94a3b8"               # Gray
-    }
+# Fast lossy WebP encoding; for this plot it encodes faster than PNG and is
+# about a fifth of the size
+WEBP_KWARGS = {'quality': 60, 'method': 0}
 
-    # Setup figure
-    fig, ax = plt.subplots(figsize=(18, 10), facecolor='white', dpi=100)
-
-    # Count paths through each station for sizing
-    station_counts = Counter()
-
-    # STEP 1: Draw all the paths
-    for path_data in paths:
-        path_nodes = path_data['nodes']
-        primary_field = path_data['primary_field']
-        color = field_colors.get(primary_field, field_colors["Other"])
-
-        # Draw connections between consecutive nodes
-        for i in range(len(path_nodes) - 1):
-            current = path_nodes[i]
-            next_node = path_nodes[i + 1]
-
-            # Build station keys
-            current_key = f"{current['degree']}|{current['field']}"
-            next_key = f"{next_node['degree']}|{next_node['field']}"
-
-            # Skip if station doesn't exist
-            if current_key not in stations or next_key not in stations:
-                continue
-
-            # Get coordinates
-            x1, y1 = stations[current_key]
-            x2, y2 = stations[next_key]
-
-            # Add jitter to y-coordinates for volume effect
-            y_jitter_start = np.random.uniform(-0.12, 0.12)
-            y_jitter_end = np.random.uniform(-0.12, 0.12)
-
-            # Generate curve
-            xs, ys = sigmoid_curve(
-                (x1, y1 + y_jitter_start),
-                (x2, y2 + y_jitter_end)
-            )
 
-            # Plot with transparency for overlapping effect
-            ax.plot(xs, ys, color=color, alpha=0.08, linewidth=1.2, zorder=1)
+def figure_to_image(fig) -> Image.Image:
+    """Draw a figure at its own size and DPI into an RGBA image."""
+    fig.canvas.draw()
+    return Image.fromarray(np.array(fig.canvas.buffer_rgba()))
 
-            # Track station usage
-            station_counts[current_key] += 1
-            station_counts[next_key] += 1
 
-    # STEP 2: Draw the stations (nodes) on top
-    for station_name, (sx, sy) in stations.items():
-        count = station_counts.get(station_name, 0)
+def image_to_webp(image: Image.Image) -> bytes:
+    """Encode an opaque image as WebP."""
+    buf = io.BytesIO()
+    image.convert('RGB').save(buf, format='WEBP', **WEBP_KWARGS)
+    return buf.getvalue()
 
-        if count == 0:
-            continue  # Don't draw unused stations
 
-        # Size based on volume (but keep reasonable)
-        node_size = min(1500, 400 + count * 2)
+def _build_base_fig():
+    """Draw the filter-independent figure that every render reuses.
 
-        # White background circle
-        ax.scatter(sx, sy, s=node_size, color='white', zorder=10, edgecolors='none')
+    Holds stations, labels, legend, title and subtitle; every station starts
+    with size 0 and create_flow_visualization resizes them per render.
+    """
+    # Setup figure
+    fig = Figure(figsize=(18, 10), facecolor='white', dpi=100)
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
 
-        # Outline
-        ax.scatter(sx, sy, s=node_size, facecolors='none',
-                  edgecolors='#1e293b', linewidth=2, zorder=11)
+    xs, ys = STATIONS_X, STATIONS_Y
+    sizes = np.zeros(len(STATION_NAMES))
 
-        # Label
+    # White background circles
+    ax.scatter(xs, ys, s=sizes, color='white', zorder=10, edgecolors='none')
+
+    # Outlines
+    ax.scatter(xs, ys, s=sizes, facecolors='none',
+              edgecolors='#1e293b', linewidth=2, zorder=11)
+
+    # Labels, alternating text position to avoid overlap
+    text_y_offsets = np.where(ys > 3.5, 0.35, -0.35)
+    for station_name, sx, sy, text_y_offset in zip(STATION_NAMES, xs, ys, text_y_offsets):
         degree, field = station_name.split('|')
         label = f"{degree}\n{field}"
 
-        # Alternate text position to avoid overlap
-        text_y_offset = 0.35 if sy > 3.5 else -0.35
         ax.text(sx, sy + text_y_offset, label,
                ha='center', va='center', fontsize=8,
                fontweight='bold', color='#1e293b', zorder=12,
                bbox=dict(boxstyle='round,pad=0.3', facecolor='white',
                         edgecolor='none', alpha=0.8))
 
-    # STEP 3: Add legend
+    # Legend
     legend_elements = [
-        mpatches.Patch(facecolor=field_colors["Engineering/Tech"],
+        mpatches.Patch(facecolor=FIELD_COLORS["Engineering/Tech"],
                       label='Engineering/Tech', alpha=0.7),
-        mpatches.Patch(facecolor=field_colors["Business"],
+        mpatches.Patch(facecolor=FIELD_COLORS["Business"],
                       label='Business', alpha=0.7),
-        mpatches.Patch(facecolor=field_colors["Sciences"],
+        mpatches.Patch(facecolor=FIELD_COLORS["Sciences"],
                       label='Sciences', alpha=0.7),
-        mpatches.Patch(facecolor=field_colors["Other"],
+        mpatches.Patch(facecolor=FIELD_COLORS["Other"],
                       label='Other', alpha=0.7),
     ]
     ax.legend(handles=legend_elements, loc='upper right',
              fontsize=11, frameon=True, fancybox=True)
 
-    # STEP 4: Final polish
+    # Final polish
     ax.set_xlim(-0.5, 8)
     ax.set_ylim(-0.5, 8)
     ax.axis('off')
     ax.set_title('CDTM Alumni Education Pathways',
                 fontsize=20, fontweight='bold', pad=20, color='#1e293b')
 
-    # Add subtitle with count
-    ax.text(0.5, 0.98, f'Visualizing education journeys of {len(paths)} CDTM alumni',
+    # Subtitle, the count is filled in per render
+    ax.text(0.5, 0.98, '',
            ha='center', va='top', transform=ax.transAxes,
            fontsize=10, color='#64748b', style='italic')
 
-    plt.tight_layout()
+    fig.tight_layout()
+
+    # Crop the figure to its tight bounding box (with savefig's default
+    # 0.1in padding) once, so renders can skip bbox_inches='tight' and its
+    # extra layout pass. The box does not depend on the filters.
+    bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(0.1)
+    fig_width, fig_height = fig.get_size_inches()
+    for axes in fig.axes:
+        pos = axes.get_position()
+        axes.set_position([
+            (pos.x0 * fig_width - bbox.x0) / bbox.width,
+            (pos.y0 * fig_height - bbox.y0) / bbox.height,
+            pos.width * fig_width / bbox.width,
+            pos.height * fig_height / bbox.height,
+        ])
+    fig.set_size_inches(bbox.width, bbox.height)
+
+    return fig
+
+
+def _build_label_stamps(fig) -> List[Tuple[Image.Image, Tuple[int, int]]]:
+    """Cut the station labels out of the base figure as RGBA stamps.
+
+    Each label is drawn alone on a transparent canvas and cropped to its
+    visible pixels. Returns (stamp, top-left pixel position) per station and
+    removes the labels from the figure, since their text boxes are by far
+    the most expensive part of a draw.
+    """
+    ax = fig.axes[0]
+    *station_labels, subtitle = ax.texts
+    others = [fig.patch, *ax.collections, ax.get_legend(), ax.title, subtitle]
+
+    for artist in others + station_labels:
+        artist.set_visible(False)
+
+    stamps = []
+    for label in station_labels:
+        label.set_visible(True)
+        rgba = np.asarray(figure_to_image(fig))
+        rows = np.flatnonzero(rgba[:, :, 3].any(axis=1))
+        cols = np.flatnonzero(rgba[:, :, 3].any(axis=0))
+        stamp = rgba[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1]
+        stamps.append((Image.fromarray(stamp), (int(cols[0]), int(rows[0]))))
+        label.remove()
+
+    for artist in others:
+        artist.set_visible(True)
+
+    return stamps
+
+
+_BASE_FIG = _build_base_fig()
+LABEL_STAMPS = _build_label_stamps(_BASE_FIG)
+
+# Renders temporarily add their flow layer to _BASE_FIG, so they take turns
+_BASE_FIG_LOCK = threading.Lock()
+
+
+def create_flow_visualization(alumni_idx: np.ndarray) -> bytes:
+    """Create flow visualization of the given alumni and return it as WebP bytes."""
+
+    # Line colors per field code
+    line_colors = [to_rgba(FIELD_COLORS[field], alpha=0.6) for field in FIELD_CATEGORIES]
+
+    # STEP 1: Edges between consecutive nodes of every path, skipping
+    # missing stations, as (current station id, next station id, field code)
+    sources = concat_ranges(ALUMNI['node_start'][alumni_idx], ALUMNI['node_end'][alumni_idx] - 1)
+    edges = np.column_stack([
+        NODES['station_id'][sources],
+        NODES['station_id'][sources + 1],
+        ALUMNI['primary_field'][NODES['alumni_id'][sources]],
+    ]).astype(np.intp)
+    edges = edges[(edges[:, 0] >= 0) & (edges[:, 1] >= 0)]
+
+    # Count paths through each station for sizing, in one pass over both
+    # ends of all edges
+    station_counts = np.bincount(edges[:, :2].ravel(), minlength=len(STATION_NAMES))
+
+    # Aggregate identical transitions into one flow each, widest drawn first
+    flows, flow_counts = np.unique(edges, axis=0, return_counts=True)
+    order = np.argsort(-flow_counts, kind='stable')
+    flows, flow_counts = flows[order], flow_counts[order]
+
+    # Get coordinates, adding jitter to y-coordinates so flows of different
+    # fields between the same stations stay apart (drawn for all at once)
+    # float32 is plenty at 100 dpi and halves the curve arrays
+    endpoints = np.column_stack([
+        STATIONS_X[flows[:, 0]], STATIONS_Y[flows[:, 0]],
+        STATIONS_X[flows[:, 1]], STATIONS_Y[flows[:, 1]],
+    ]).astype(np.float32)
+    jitter = RNG.random(size=(len(endpoints), 2), dtype=np.float32) * 0.24 - 0.12
+    endpoints[:, 1] += jitter[:, 0]
+    endpoints[:, 3] += jitter[:, 1]
+
+    # Generate all curves in one batch
+    segments = sigmoid_curves(*endpoints.T)
+
+    # One uniformly colored collection per field, larger fields underneath;
+    # line width grows with the number of alumni making the transition
+    linewidths = np.log1p(flow_counts) * 0.8
+    field_totals = np.bincount(flows[:, 2], weights=flow_counts, minlength=len(FIELD_CATEGORIES))
+    flow_collections = []
+    for field_code in np.argsort(-field_totals, kind='stable'):
+        in_field = flows[:, 2] == field_code
+        if not in_field.any():
+            continue
+
+        flow_collections.append(LineCollection(
+            segments[in_field], colors=[line_colors[field_code]],
+            linewidths=linewidths[in_field], zorder=1
+        ))
 
-    # Convert to base64
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', dpi=100, bbox_inches='tight', facecolor='white')
-    buf.seek(0)
-    img_base64 = base64.b64encode(buf.read()).decode('utf-8')
-    plt.close(fig)
+    # STEP 2: Size the stations (nodes) by volume (but keep reasonable),
+    # hiding unused ones
+    sizes = np.where(station_counts > 0, np.minimum(1500, 400 + station_counts * 2), 0)
 
-    return f"data:image/png;base64,{img_base64}"
+    # STEP 3: Draw onto the shared static figure; only the flow layer is
+    # added and removed again, everything else is updated in place
+    with _BASE_FIG_LOCK:
+        ax = _BASE_FIG.axes[0]
+        for collection in flow_collections:
+            ax.add_collection(collection)
 
+        try:
+            fill, outline = ax.collections[:2]
+            fill.set_sizes(sizes)
+            outline.set_sizes(sizes)
 
-def get_statistics(paths):
-    """Calculate statistics from paths."""
-    if not paths:
-        return {}
+            # Subtitle with count
+            subtitle, = ax.texts
+            subtitle.set_text(f'Visualizing education journeys of {len(alumni_idx)} CDTM alumni')
 
-    total_alumni = len(paths)
+            image = figure_to_image(_BASE_FIG)
+        finally:
+            for collection in flow_collections:
+                collection.remove()
 
-    # Count by primary field
-    field_counter = Counter([p['primary_field'] for p in paths])
+    # Labels of the used stations go on top of everything
+    for (stamp, position), count in zip(LABEL_STAMPS, station_counts):
+        if count:
+            image.alpha_composite(stamp, dest=position)
 
-    # Count degrees
-    degree_counter = Counter()
-    for path in paths:
-        for node in path['nodes']:
-            degree_counter[node['degree']] += 1
+    return image_to_webp(image)
+
+
+def _most_common(codes: np.ndarray, labels: List[str]) -> List[Tuple[str, int]]:
+    """(label, count) pairs by descending count, ties in order of first occurrence."""
+    counts = np.bincount(codes, minlength=len(labels))
+    present, first_seen = np.unique(codes, return_index=True)
+    order = np.lexsort((first_seen, -counts[present]))
+    return [(labels[code], int(counts[code])) for code in present[order]]
+
+
+def get_statistics(alumni_idx: np.ndarray) -> Dict:
+    """Calculate statistics for the given alumni."""
+    if not len(alumni_idx):
+        return {}
+
+    starts = ALUMNI['node_start'][alumni_idx]
+    ends = ALUMNI['node_end'][alumni_idx]
 
     # Path length stats
-    path_lengths = [len(p['nodes']) for p in paths]
+    path_lengths = ends - starts
 
     return {
-        'total_alumni': total_alumni,
-        'field_counter': field_counter.most_common(),
-        'degree_counter': degree_counter.most_common(5),
+        'total_alumni': len(alumni_idx),
+        'field_counter': _most_common(ALUMNI['primary_field'][alumni_idx], FIELD_CATEGORIES),
+        'degree_counter': _most_common(NODES['degree'][concat_ranges(starts, ends)], DEGREE_CATEGORIES)[:5],
         'avg_path_length': np.mean(path_lengths),
         'median_path_length': np.median(path_lengths)
     }
 
 
+# ==========================================
+# CACHED RESULTS PER FILTER COMBINATION
+# ==========================================
+# The alumni data is static for the process lifetime and the dropdowns only
+# offer 5 x 5 combinations, so results are cached by the raw filter values.
+@functools.lru_cache(maxsize=32)
+def _extract_paths(field_filter: str, degree_filter: str) -> np.ndarray:
+    """Select the alumni for a filter combination."""
+    filters = {
+        'field': field_filter if field_filter != 'All' else None,
+        'degree': degree_filter if degree_filter != 'All' else None
+    }
+    return extract_paths(filters)
+
+
+@functools.lru_cache(maxsize=32)
+def _render_image_bytes(field_filter: str, degree_filter: str) -> bytes:
+    """Render the flow diagram for a filter combination as WebP bytes."""
+    alumni_idx = _extract_paths(field_filter, degree_filter)
+    if len(alumni_idx):
+        return create_flow_visualization(alumni_idx)
+
+    # Create empty placeholder
+    fig = Figure(figsize=(18, 10))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    ax.text(0.5, 0.5, 'No data matches the selected filters',
+           ha='center', va='center', fontsize=16, color='#64748b')
+    ax.axis('off')
+    return image_to_webp(figure_to_image(fig))
+
+
+@functools.lru_cache(maxsize=32)
+def _statistics(field_filter: str, degree_filter: str) -> Dict:
+    """Calculate the statistics for a filter combination."""
+    return get_statistics(_extract_paths(field_filter, degree_filter))
+
+
 # ==========================================
 # DASH APP
 # ==========================================
@@ -366,7 +606,7 @@ app.layout = dbc.Container([
             html.H1("🎓 CDTM Alumni Education Path Explorer", className="text-center mb-4 mt-4"),
             html.P(
                 "Flow-style visualization showing how CDTM alumni progress through their education journey. "
-                "Each line represents one person's path, color-coded by primary field of study.",
+                "Each flow bundles the alumni making the same transition, color-coded by primary field of study.",
                 className="text-center text-muted mb-4"
             )
         ])
@@ -459,9 +699,9 @@ app.layout = dbc.Container([
             html.Div([
                 html.H5("How to Read This Visualization", className="mb-3"),
                 html.Ul([
-                    html.Li("Each flowing line represents one alumni's education path"),
+                    html.Li("Each flowing line bundles the alumni moving between two nodes"),
                     html.Li("Colors indicate the alumni's primary field of study"),
-                    html.Li("Thicker flows between nodes show more common transitions"),
+                    html.Li("Thicker flows show more common transitions"),
                     html.Li("Nodes are sized based on how many alumni pass through them"),
                     html.Li("Left to right shows progression from Bachelor's through advanced degrees")
                 ], className="small text-muted")
@@ -471,6 +711,15 @@ app.layout = dbc.Container([
 ], fluid=True)
 
 
+@app.server.route('/flow')
+def serve_flow():
+    """Serve the flow diagram image for the filters in the query string."""
+    image_bytes = _render_image_bytes(request.args.get('field', 'All'),
+                                  request.args.get('degree', 'All'))
+    return Response(image_bytes, mimetype='image/webp',
+                    headers={'Cache-Control': 'public, max-age=3600'})
+
+
 @app.callback(
     [Output('flow-diagram', 'src'),
      Output('statistics-panel', 'children')],
@@ -480,31 +729,9 @@ app.layout = dbc.Container([
 def update_visualization(field_filter, degree_filter):
     """Update the visualization based on filters."""
 
-    filters = {
-        'field': field_filter if field_filter != 'All' else None,
-        'degree': degree_filter if degree_filter != 'All' else None
-    }
-
-    # Extract paths
-    paths = extract_paths(ALUMNI_DATA, filters)
-
-    # Create visualization
-    if paths:
-        img_src = create_flow_visualization(paths)
-    else:
-        # Create empty placeholder
-        fig, ax = plt.subplots(figsize=(18, 10))
-        ax.text(0.5, 0.5, 'No data matches the selected filters',
-               ha='center', va='center', fontsize=16, color='#64748b')
-        ax.axis('off')
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', dpi=100)
-        buf.seek(0)
-        img_src = f"data:image/png;base64,{base64.b64encode(buf.read()).decode('utf-8')}"
-        plt.close(fig)
-
-    # Calculate statistics
-    stats = get_statistics(paths)
+    # The image itself is served by the /flow route, which the browser can cache
+    img_src = f"/flow?{urlencode({'field': field_filter, 'degree': degree_filter})}"
+    stats = _statistics(field_filter, degree_filter)
 
     # Create statistics panel
     if stats:
@@ -556,4 +783,6 @@ if __name__ == '__main__':
     print("\nPress Ctrl+C to stop the server")
     print("="*60 + "\n")
 
-    app.run_server(debug=True, host='0.0.0.0', port=8050)
+    # Debug mode (reloader, dev tools, hot reload) slows every callback, so
+    # it is only enabled on request
+    app.run(debug=bool(os.environ.get('DASH_DEV')), host='0.0.0.0', port=8050)
@@ -3,63 +3,94 @@
 Interactive Dash web application using Plotly with hover support for individual alumni.
 """
 
+import functools
 import json
+import os
+import re
+import sys
+import zlib
 import dash
 from dash import dcc, html, Input, Output
 import dash_bootstrap_components as dbc
-import plotly.graph_objects as go
+import plotly.io as pio
 import numpy as np
-from collections import defaultdict, Counter
 from typing import Dict, List, Tuple
 
+try:
+    import orjson  # Faster JSON parsing at startup
+except ImportError:
+    orjson = None
+
 
 # Data loading
+def _load_json(path: str):
+    """Parse a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 def load_data():
     """Load alumni and schools data."""
-    with open('data/cdtm_alumni_consolidated.json', 'r', encoding='utf-8') as f:
-        alumni_data = json.load(f)
-    with open('data/unique_schools_normalized.json', 'r', encoding='utf-8') as f:
-        schools_data = json.load(f)
+    alumni_data = _load_json('data/cdtm_alumni_consolidated.json')
+    schools_data = _load_json('data/unique_schools_normalized.json')
     return alumni_data, schools_data
 
 
 ALUMNI_DATA, SCHOOLS_DATA = load_data()
 
 
-# Helper functions (same as before)
+def _keyword_pattern(terms: List[str]) -> re.Pattern:
+    """Compile a case-insensitive substring alternation for the given terms."""
+    return re.compile('|'.join(re.escape(term) for term in terms), re.IGNORECASE)
+
+
+# Checked in order, the first matching category wins
+_DEGREE_PATTERNS = [
+    ("Bachelor's", _keyword_pattern(['bachelor', 'b.sc', 'b.a', 'b.eng', 'bsc'])),
+    ("Master's", _keyword_pattern(['master', 'm.sc', 'm.a', 'm.eng', 'msc', 'mba'])),
+    ("Doctorate", _keyword_pattern(['phd', 'ph.d', 'doctor', 'doctorate'])),
+    ("Diploma", _keyword_pattern(['dipl', 'diploma'])),
+]
+
+_FIELD_PATTERNS = [
+    ("Engineering/Tech", _keyword_pattern(['engineering', 'computer', 'informatics', 'software', 'electrical', 'mechanical', 'technology'])),
+    ("Business", _keyword_pattern(['business', 'management', 'mba', 'economics', 'finance', 'bwl'])),
+    ("Sciences", _keyword_pattern(['physics', 'chemistry', 'biology', 'mathematics', 'science', 'biotech'])),
+]
+
+_MBA_PATTERN = _keyword_pattern(['mba'])
+
+
+# Helper functions (same as before); memoized because the same degree and
+# field strings recur across alumni and callbacks
+@functools.lru_cache(maxsize=4096)
 def categorize_degree(degree: str, field: str) -> str:
     if not degree:
         return "Other"
-    degree_lower = degree.lower()
-    if any(term in degree_lower for term in ['bachelor', 'b.sc', 'b.a', 'b.eng', 'bsc']):
-        return "Bachelor's"
-    if any(term in degree_lower for term in ['master', 'm.sc', 'm.a', 'm.eng', 'msc', 'mba']):
-        return "Master's"
-    if any(term in degree_lower for term in ['phd', 'ph.d', 'doctor', 'doctorate']):
-        return "Doctorate"
-    if any(term in degree_lower for term in ['dipl', 'diploma']):
-        return "Diploma"
+    for category, pattern in _DEGREE_PATTERNS:
+        if pattern.search(degree):
+            return category
     return "Other"
 
 
+@functools.lru_cache(maxsize=4096)
 def categorize_field(field: str, degree: str) -> str:
     if not field:
-        if degree and 'mba' in degree.lower():
+        if degree and _MBA_PATTERN.search(degree):
             return "Business"
         return "Other"
-    field_lower = field.lower()
-    if any(term in field_lower for term in ['engineering', 'computer', 'informatics', 'software', 'electrical', 'mechanical', 'technology']):
-        return "Engineering/Tech"
-    if any(term in field_lower for term in ['business', 'management', 'mba', 'economics', 'finance', 'bwl']):
-        return "Business"
-    if any(term in field_lower for term in ['physics', 'chemistry', 'biology', 'mathematics', 'science', 'biotech']):
-        return "Sciences"
+    for category, pattern in _FIELD_PATTERNS:
+        if pattern.search(field):
+            return category
     return "Other"
 
 
-def get_institution_type(school_name: str) -> str:
-    if school_name in SCHOOLS_DATA:
-        return SCHOOLS_DATA[school_name].get('institution_type', 'University')
+def get_institution_type(school_name: str, schools_data: Dict) -> str:
+    if school_name in schools_data:
+        return schools_data[school_name].get('institution_type', 'University')
     return 'University'
 
 
@@ -67,96 +98,188 @@ def is_cdtm(school_name: str) -> bool:
     return 'CDTM' in school_name or 'Center for Digital Technology' in school_name
 
 
-def extract_paths(alumni_data: List[Dict], filters: Dict = None) -> List[Dict]:
-    """Extract education paths with optional filtering."""
-    paths = []
+def build_school_meta(alumni_data: List[Dict], schools_data: Dict) -> Dict[str, Tuple[bool, str]]:
+    """Map every school in the alumni data to (is CDTM, institution type)."""
+    schools = {edu.get('school', '') for person in alumni_data for edu in person.get('education_path', [])}
+    return {school: (is_cdtm(school), get_institution_type(school, schools_data)) for school in schools}
+
+
+def _preprocess(person: Dict, school_meta: Dict[str, Tuple[bool, str]]) -> Dict:
+    """Categorize one alumnus's education entries.
+
+    CDTM entries are dropped from the entry list; has_cdtm records whether
+    there was one. school_meta is the lookup built by build_school_meta.
+    """
+    entries = []
+    has_cdtm = False
+
+    for edu in person['education_path']:
+        school = edu.get('school', '')
+        degree = edu.get('degree', '')
+        field = edu.get('field', '')
+
+        school_is_cdtm, institution_type = school_meta[school]
+        if school_is_cdtm:
+            has_cdtm = True
+        else:
+            entries.append((categorize_degree(degree, field), categorize_field(field, degree), institution_type))
+
+    return {
+        'entries': tuple(entries),
+        'has_cdtm': has_cdtm,
+        'name': person.get('full_name', 'Unknown'),
+        'headline': person.get('headline', ''),
+        'linkedin_url': person.get('linkedin_url', '')
+    }
+
+
+# Categorization only depends on the static data, so it runs once at startup
+_SCHOOL_META = build_school_meta(ALUMNI_DATA, SCHOOLS_DATA)
+PREPROCESSED_ALUMNI = tuple(_preprocess(p, _SCHOOL_META) for p in ALUMNI_DATA if p.get('education_path'))
+
+# Only the preprocessed records are used from here on, so the raw alumni and
+# school records are released; the alumni count is kept for the startup banner
+ALUMNI_COUNT = len(ALUMNI_DATA)
+del ALUMNI_DATA, SCHOOLS_DATA, _SCHOOL_META
+
+
+# Integer codes of the filterable categories. Alumni without a known primary
+# field get -1, so the "Other" field filter matches none, as it always has.
+FIELD_CODES = {"Engineering/Tech": 0, "Business": 1, "Sciences": 2}
+DEGREE_CODES = {"Bachelor's": 0, "Master's": 1, "Doctorate": 2, "Diploma": 3, "Other": 4, "CDTM": 5}
+
+
+def _build_path(person: Dict) -> Dict:
+    """Build one preprocessed alumnus's path, or None if it has fewer than two nodes.
+
+    The path does not depend on the filters, which only select whole alumni.
+    """
+    # Nodes carry their station key, interned since only a few distinct keys exist
+    all_entries = [
+        {
+            'degree': degree_level,
+            'field': field_category,
+            'institution': institution_type,
+            'is_cdtm': False,
+            'key': sys.intern(f"{degree_level}|{field_category}")
+        }
+        for degree_level, field_category, institution_type in person['entries']
+    ]
+
+    if not all_entries:
+        return None
+
+    # Determine CDTM position in one scan: after the first Bachelor's-level entry,
+    # else after the first Master's, else after the first entry
+    first_bachelor = None
+    first_master = None
+
+    for i, entry in enumerate(all_entries):
+        if entry['degree'] in ("Bachelor's", "Diploma"):
+            first_bachelor = i
+            break
+        if first_master is None and entry['degree'] == "Master's":
+            first_master = i
+
+    if first_bachelor is not None:
+        insert_position = first_bachelor + 1
+        cdtm_level = "Bachelor's Level"
+    elif first_master is not None:
+        insert_position = first_master + 1
+        cdtm_level = "Master's Level"
+    else:
+        insert_position = 1 if len(all_entries) > 1 else 0
+        cdtm_level = "Bachelor's Level"
+
+    if person['has_cdtm']:
+        cdtm_node = {
+            'degree': 'CDTM',
+            'field': 'CDTM',
+            'institution': 'CDTM',
+            'is_cdtm': True,
+            'cdtm_level': cdtm_level,
+            'key': "CDTM"
+        }
+        all_entries.insert(insert_position, cdtm_node)
+
+    if len(all_entries) < 2:
+        return None
+
+    primary_field = None
+    for entry in all_entries:
+        if entry['field'] != "Other" and not entry.get('is_cdtm'):
+            primary_field = entry['field']
+            break
+
+    return {
+        'nodes': all_entries,
+        'primary_field': primary_field or "Other",
+        'known_primary_field': primary_field,
+        # Filter keys: primary field code and bitmask of the nodes' degree codes
+        'field_code': FIELD_CODES.get(primary_field, -1),
+        'degree_mask': sum(1 << DEGREE_CODES[degree] for degree in {entry['degree'] for entry in all_entries}),
+        'name': person['name'],
+        'headline': person['headline'],
+        'linkedin_url': person['linkedin_url']
+    }
 
-    for person in alumni_data:
-        education_path = person.get('education_path', [])
-        if not education_path:
-            continue
 
-        all_entries = []
-        cdtm_entry = None
+ALUMNI_PATHS = tuple(path for path in map(_build_path, PREPROCESSED_ALUMNI) if path is not None)
 
-        for edu in education_path:
-            school = edu.get('school', '')
-            degree = edu.get('degree', '')
-            field = edu.get('field', '')
+# Filter columns: each path's primary field code and a bitmask of the degree
+# codes among its nodes
+PATH_FIELD = np.array([path['field_code'] for path in ALUMNI_PATHS], dtype=np.int8)
+PATH_DEGREES = np.array([path['degree_mask'] for path in ALUMNI_PATHS], dtype=np.uint8)
 
-            if is_cdtm(school):
-                cdtm_entry = edu
+
+# Statistics columns: each path's displayed primary field code ("Other" when
+# unknown), whether it passes CDTM and its length, plus the degree codes of
+# the non-CDTM nodes of all paths, stored back to back from PATH_NODE_START
+FIELD_NAMES = ["Engineering/Tech", "Business", "Sciences", "Other"]
+DEGREE_NAMES = list(DEGREE_CODES)
+
+PATH_PRIMARY_FIELD = np.where(PATH_FIELD >= 0, PATH_FIELD, FIELD_NAMES.index("Other")).astype(np.intp)
+PATH_HAS_CDTM = np.array([any(node['is_cdtm'] for node in path['nodes']) for path in ALUMNI_PATHS], dtype=bool)
+PATH_LENGTH = np.array([len(path['nodes']) for path in ALUMNI_PATHS], dtype=np.intp)
+
+NODE_DEGREE = np.array([DEGREE_CODES[node['degree']] for path in ALUMNI_PATHS
+                        for node in path['nodes'] if not node['is_cdtm']], dtype=np.intp)
+PATH_NODE_END = np.cumsum(PATH_LENGTH - PATH_HAS_CDTM)
+PATH_NODE_START = PATH_NODE_END - (PATH_LENGTH - PATH_HAS_CDTM)
+
+
+def concat_ranges(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Concatenate the integer ranges [start, end) without a Python loop."""
+    lengths = ends - starts
+    offsets = np.cumsum(lengths) - lengths
+    return np.repeat(starts - offsets, lengths) + np.arange(lengths.sum())
+
+
+def filter_mask(field_codes: np.ndarray, degree_masks: np.ndarray, filters: Dict = None) -> np.ndarray:
+    """Boolean mask of the entries whose filter keys match the optional filters."""
+    selected = np.ones(len(field_codes), dtype=bool)
+
+    if filters:
+        if filters.get('field') and filters['field'] != 'All':
+            selected &= field_codes == FIELD_CODES.get(filters['field'], -2)
+        if filters.get('degree') and filters['degree'] != 'All':
+            code = DEGREE_CODES.get(filters['degree'])
+            if code is None:
+                selected[:] = False
             else:
-                degree_level = categorize_degree(degree, field)
-                field_category = categorize_field(field, degree)
-                institution_type = get_institution_type(school)
-
-                all_entries.append({
-                    'degree': degree_level,
-                    'field': field_category,
-                    'institution': institution_type,
-                    'is_cdtm': False
-                })
-
-        if not all_entries:
-            continue
+                selected &= (degree_masks >> code) & 1 == 1
+
+    return selected
+
+
+def select_paths(filters: Dict = None) -> np.ndarray:
+    """Indices into ALUMNI_PATHS of the paths matching the optional filters."""
+    return np.flatnonzero(filter_mask(PATH_FIELD, PATH_DEGREES, filters))
 
-        # Determine CDTM position
-        cdtm_level = None
-        insert_position = None
-
-        for i, entry in enumerate(all_entries):
-            if entry['degree'] in ["Bachelor's", "Diploma"]:
-                insert_position = i + 1
-                cdtm_level = "Bachelor's Level"
-                break
-
-        if insert_position is None:
-            for i, entry in enumerate(all_entries):
-                if entry['degree'] == "Master's":
-                    insert_position = i + 1
-                    cdtm_level = "Master's Level"
-                    break
-
-        if insert_position is None and len(all_entries) > 0:
-            insert_position = 1 if len(all_entries) > 1 else 0
-            cdtm_level = "Bachelor's Level"
-
-        if cdtm_entry and insert_position is not None and cdtm_level:
-            cdtm_node = {
-                'degree': 'CDTM',
-                'field': 'CDTM',
-                'institution': 'CDTM',
-                'is_cdtm': True,
-                'cdtm_level': cdtm_level
-            }
-            all_entries.insert(insert_position, cdtm_node)
-
-        primary_field = None
-        for entry in all_entries:
-            if entry['field'] != "Other" and not entry.get('is_cdtm'):
-                primary_field = entry['field']
-                break
-
-        # Apply filters
-        if filters:
-            if filters.get('field') and filters['field'] != 'All':
-                if primary_field != filters['field']:
-                    continue
-            if filters.get('degree') and filters['degree'] != 'All':
-                if not any(node['degree'] == filters['degree'] for node in all_entries):
-                    continue
-
-        if len(all_entries) >= 2:
-            paths.append({
-                'nodes': all_entries,
-                'primary_field': primary_field or "Other",
-                'name': person.get('full_name', 'Unknown'),
-                'headline': person.get('headline', ''),
-                'linkedin_url': person.get('linkedin_url', '')
-            })
-
-    return paths
+
+def extract_paths(filters: Dict = None) -> List[Dict]:
+    """Select the education paths matching the optional filters."""
+    return [ALUMNI_PATHS[i] for i in select_paths(filters)]
 
 
 def define_stations() -> Dict[str, Tuple[float, float]]:
@@ -184,106 +307,82 @@ def define_stations() -> Dict[str, Tuple[float, float]]:
     }
 
 
-def sigmoid_curve(p1: Tuple[float, float], p2: Tuple[float, float], n_points: int = 30) -> Tuple[np.ndarray, np.ndarray]:
-    """Generate S-curve."""
-    x1, y1 = p1
-    x2, y2 = p2
-    x = np.linspace(x1, x2, n_points)
-    t = (x - x1) / (x2 - x1) if x2 != x1 else np.zeros_like(x)
-    y = y1 + (y2 - y1) * (1 - np.cos(np.pi * t)) / 2
-    return x, y
+# Station positions never change, so they are looked up from one table
+STATIONS = define_stations()
+STATION_NAMES = list(STATIONS)
+STATION_INDEX = {name: idx for idx, name in enumerate(STATION_NAMES)}
 
+FIELD_COLORS = {
+    "Engineering/Tech": "#3b82f6",
+    "Business": "#ef4444",
+    "Sciences": "#10b981",
+    "Other": "#94a3b8",
+    "CDTM": "#f59e0b"
+}
 
-def create_plotly_figure(paths: List[Dict]):
-    """Create Plotly figure with hover support."""
-    stations = define_stations()
 
-    field_colors = {
-        "Engineering/Tech": "#3b82f6",
-        "Business": "#ef4444",
-        "Sciences": "#10b981",
-        "Other": "#94a3b8",
-        "CDTM": "#f59e0b"
-    }
+def drawable_edges(path_nodes: List[Dict]) -> List[Tuple[str, str]]:
+    """Station keys of the consecutive node pairs of a path that both have a station."""
+    keys = [node['key'] for node in path_nodes]
+    return [(current_key, next_key) for current_key, next_key in zip(keys, keys[1:])
+            if current_key in STATIONS and next_key in STATIONS]
 
-    fig = go.Figure()
-    station_counts = Counter()
 
-    # Draw paths
-    for path_idx, path_data in enumerate(paths):
-        path_nodes = path_data['nodes']
-        primary_field = path_data['primary_field']
-        color = field_colors.get(primary_field, field_colors["Other"])
+def _station_visits(path: Dict) -> np.ndarray:
+    """Number of edge endpoints a path has at each station."""
+    visits = np.zeros(len(STATION_NAMES), dtype=np.int64)
+    for current_key, next_key in drawable_edges(path['nodes']):
+        visits[STATION_INDEX[current_key]] += 1
+        visits[STATION_INDEX[next_key]] += 1
+    return visits
 
-        alumni_name = path_data['name']
-        headline = path_data['headline']
-        linkedin_url = path_data.get('linkedin_url', '')  # Extract LinkedIn URL
-        path_id = f"path_{path_idx}"  # Unique identifier for this path
 
-        for i in range(len(path_nodes) - 1):
-            current = path_nodes[i]
-            next_node = path_nodes[i + 1]
+PATH_STATION_VISITS = np.array([_station_visits(path) for path in ALUMNI_PATHS]).reshape(-1, len(STATION_NAMES))
 
-            if current.get('is_cdtm'):
-                current_key = "CDTM"
-            else:
-                current_key = f"{current['degree']}|{current['field']}"
 
-            if next_node.get('is_cdtm'):
-                next_key = "CDTM"
-            else:
-                next_key = f"{next_node['degree']}|{next_node['field']}"
+def sigmoid_curves(x1: np.ndarray, y1: np.ndarray, x2: np.ndarray, y2: np.ndarray,
+                   n_points: int = 30) -> Tuple[np.ndarray, np.ndarray]:
+    """Generate S-curves for a batch of edges.
 
-            if current_key not in stations or next_key not in stations:
-                continue
+    Takes 1-D arrays of start/end coordinates and returns (x, y) arrays of
+    shape (n_edges, n_points).
+    """
+    t = np.linspace(0.0, 1.0, n_points)
 
-            x1, y1 = stations[current_key]
-            x2, y2 = stations[next_key]
+    # Flat for edges without horizontal extent
+    ease = np.where((x2 != x1)[:, None], (1 - np.cos(np.pi * t)) / 2, 0.0)
 
-            y_jitter_start = np.random.uniform(-0.1, 0.1)
-            y_jitter_end = np.random.uniform(-0.1, 0.1)
+    x = x1[:, None] + (x2 - x1)[:, None] * t
+    y = y1[:, None] + (y2 - y1)[:, None] * ease
+    return x, y
 
-            xs, ys = sigmoid_curve(
-                (x1, y1 + y_jitter_start),
-                (x2, y2 + y_jitter_end)
-            )
 
-            if current.get('is_cdtm') or next_node.get('is_cdtm'):
-                line_color = field_colors["CDTM"]
-                line_alpha = 0.3
-            else:
-                line_color = color
-                line_alpha = 0.2
-
-            # Create simple hover text (no HTML links since they don't work in Plotly)
-            hover_text = f'<b>{alumni_name}</b><br>{headline}'
-            if linkedin_url:
-                hover_text += f'<br><br>Click to open LinkedIn profile'
-
-            fig.add_trace(go.Scatter(
-                x=xs,
-                y=ys,
-                mode='lines',
-                line=dict(color=line_color, width=2.5),
-                opacity=line_alpha,
-                hovertemplate=hover_text + '<extra></extra>',
-                hoverlabel=dict(
-                    bgcolor=line_color,
-                    font_size=13,
-                    font_family="Arial",
-                    font_color="white"
-                ),
-                customdata=[[path_id, line_color, line_alpha, linkedin_url]] * len(xs),
-                showlegend=False,
-                name=path_id,
-                meta={'path_id': path_id, 'alumni_name': alumni_name}  # Add metadata
-            ))
-
-            station_counts[current_key] += 1
-            station_counts[next_key] += 1
-
-    # Draw nodes
-    for station_name, (sx, sy) in stations.items():
+# Filter-independent part of the figure layout, including the default
+# template go.Figure would apply
+BASE_LAYOUT = {
+    'template': pio.templates[pio.templates.default].to_plotly_json(),
+    'title': {
+        'text': "CDTM Alumni Education Pathways",
+        'x': 0.5,
+        'xanchor': 'center',
+        'font': {'size': 20}
+    },
+    'xaxis': {'range': [-0.5, 8], 'showgrid': False, 'showticklabels': False, 'zeroline': False},
+    'yaxis': {'range': [-0.5, 8], 'showgrid': False, 'showticklabels': False, 'zeroline': False},
+    'plot_bgcolor': 'white',
+    'paper_bgcolor': 'white',
+    'height': 700,
+    'hovermode': 'closest',
+    'hoverdistance': 20,  # Increased hover detection distance
+    'uirevision': 'constant',  # Prevent layout changes on hover
+}
+
+
+def create_node_trace(station_counts: Dict[str, int]) -> Dict:
+    """Trace drawing every station with at least one visit, sized by visits."""
+    node_x, node_y, node_sizes, node_colors = [], [], [], []
+    labels, text_positions, text_sizes, node_counts = [], [], [], []
+    for station_name, (sx, sy) in STATIONS.items():
         count = station_counts.get(station_name, 0)
         if count == 0:
             continue
@@ -291,7 +390,7 @@ def create_plotly_figure(paths: List[Dict]):
         is_cdtm_node = (station_name == "CDTM")
 
         if is_cdtm_node:
-            node_color = field_colors["CDTM"]
+            node_color = FIELD_COLORS["CDTM"]
             node_size = min(50, 15 + count * 0.03)
             label = "CDTM"
         else:
@@ -300,73 +399,213 @@ def create_plotly_figure(paths: List[Dict]):
             degree, field = station_name.split('|')
             label = f"{degree}<br>{field}"
 
-        fig.add_trace(go.Scatter(
-            x=[sx],
-            y=[sy],
-            mode='markers+text',
-            marker=dict(
-                size=node_size,
-                color=node_color,
-                line=dict(color='white', width=2)
-            ),
-            text=label,
-            textposition="top center" if sy > 3.5 else "bottom center",
-            textfont=dict(size=10 if is_cdtm_node else 8, color=node_color),
-            hovertemplate=f'<b>{label}</b><br>{count} alumni<extra></extra>',
-            showlegend=False
-        ))
-
-    fig.update_layout(
-        title={
-            'text': "CDTM Alumni Education Pathways",
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 20}
+        node_x.append(sx)
+        node_y.append(sy)
+        node_sizes.append(node_size)
+        node_colors.append(node_color)
+        labels.append(label)
+        text_positions.append("top center" if sy > 3.5 else "bottom center")
+        text_sizes.append(10 if is_cdtm_node else 8)
+        node_counts.append(count)
+
+    return {
+        'type': 'scatter',
+        'x': node_x,
+        'y': node_y,
+        'mode': 'markers+text',
+        'marker': {
+            'size': node_sizes,
+            'color': node_colors,
+            'line': {'color': 'white', 'width': 2}
         },
-        xaxis=dict(range=[-0.5, 8], showgrid=False, showticklabels=False, zeroline=False),
-        yaxis=dict(range=[-0.5, 8], showgrid=False, showticklabels=False, zeroline=False),
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        height=700,
-        hovermode='closest',
-        hoverdistance=20,  # Increased hover detection distance
-        uirevision='constant'  # Prevent layout changes on hover
+        'text': labels,
+        'textposition': text_positions,
+        'textfont': {'size': text_sizes, 'color': node_colors},
+        'customdata': node_counts,
+        'hovertemplate': '<b>%{text}</b><br>%{customdata} alumni<extra></extra>',
+        'showlegend': False
+    }
+
+
+def create_plotly_figure(paths: List[Dict], seed: int = None) -> Dict:
+    """Create the Plotly figure dict with hover support.
+
+    Path traces are split by the alumni's filter keys, recorded in each
+    trace's meta, and the node trace comes last. The layout is BASE_LAYOUT
+    plus the per-path hover text and LinkedIn URL in layout.meta. seed makes
+    the line jitter reproducible; None draws fresh jitter.
+    """
+    traces = []
+    station_counts = {}
+
+    # Loop-invariant lookups, bound once
+    cdtm_color = FIELD_COLORS["CDTM"]
+    other_color = FIELD_COLORS["Other"]
+
+    # Collect the drawable edges of all paths
+    edges = []  # (path index, line color, line alpha)
+    starts = []
+    ends = []
+    # Hover text and LinkedIn URL, sent once per path in layout.meta
+    path_meta = []
+
+    for path_idx, path_data in enumerate(paths):
+        color = FIELD_COLORS.get(path_data['primary_field'], other_color)
+
+        alumni_name = path_data['name']
+        headline = path_data['headline']
+        linkedin_url = path_data.get('linkedin_url', '')  # Extract LinkedIn URL
+
+        # Create simple hover text (no HTML links since they don't work in Plotly)
+        hover_text = f'<b>{alumni_name}</b><br>{headline}'
+        if linkedin_url:
+            hover_text += f'<br><br>Click to open LinkedIn profile'
+        path_meta.append([hover_text, linkedin_url])
+
+        for current_key, next_key in drawable_edges(path_data['nodes']):
+            if current_key == "CDTM" or next_key == "CDTM":
+                edges.append((path_idx, cdtm_color, 0.3))
+            else:
+                edges.append((path_idx, color, 0.2))
+            starts.append(STATIONS[current_key])
+            ends.append(STATIONS[next_key])
+
+            station_counts[current_key] = station_counts.get(current_key, 0) + 1
+            station_counts[next_key] = station_counts.get(next_key, 0) + 1
+
+    # Generate all curves in one batch, jittering both ends of every edge
+    starts = np.array(starts, dtype=float).reshape(-1, 2)
+    ends = np.array(ends, dtype=float).reshape(-1, 2)
+    jitter = np.random.default_rng(seed).uniform(-0.1, 0.1, size=(len(edges), 2))
+    curves_x, curves_y = sigmoid_curves(
+        starts[:, 0], starts[:, 1] + jitter[:, 0],
+        ends[:, 0], ends[:, 1] + jitter[:, 1]
     )
 
-    return fig
+    # Group the edges into one WebGL line trace per (color, alpha, field
+    # code, degree mask), so a filter selects whole traces; polylines are
+    # separated by None and each point's customdata is its path's index into
+    # layout.meta
+    groups = {}
+    for (path_idx, line_color, line_alpha), xs, ys in zip(edges, curves_x, curves_y):
+        path_data = paths[path_idx]
+        group = groups.setdefault((line_color, line_alpha, path_data['field_code'], path_data['degree_mask']),
+                                  {'x': [], 'y': [], 'customdata': []})
+        group['x'].extend(xs.tolist())
+        group['x'].append(None)
+        group['y'].extend(ys.tolist())
+        group['y'].append(None)
+        group['customdata'].extend([path_idx] * len(xs))
+        group['customdata'].append(None)
+
+    # Draw paths; the hover script fills in the per-point hover text from
+    # layout.meta. Traces are plain dicts, which skips go.Scattergl's
+    # property validation.
+    for (line_color, line_alpha, field_code, degree_mask), group in groups.items():
+        traces.append({
+            'type': 'scattergl',
+            'x': group['x'],
+            'y': group['y'],
+            'mode': 'lines',
+            'line': {'color': line_color, 'width': 2.5},
+            'opacity': line_alpha,
+            'hovertemplate': '%{text}<extra></extra>',
+            'hoverlabel': {
+                'bgcolor': line_color,
+                'font': {'size': 13, 'family': "Arial", 'color': "white"}
+            },
+            'customdata': group['customdata'],
+            'showlegend': False,
+            # opacity is restored by the hover script on unhover
+            'meta': {'opacity': line_alpha, 'field_code': field_code, 'degree_mask': degree_mask}
+        })
+
+    # Draw nodes in a single trace
+    traces.append(create_node_trace(station_counts))
+
+    return {
+        'data': traces,
+        'layout': {**BASE_LAYOUT, 'meta': path_meta}
+    }
 
 
-def get_statistics(paths):
-    """Calculate statistics."""
-    if not paths:
-        return {}
+def _most_common(codes: np.ndarray, labels: List[str]) -> List[Tuple[str, int]]:
+    """(label, count) pairs by descending count, ties in order of first occurrence."""
+    counts = np.bincount(codes, minlength=len(labels))
+    present, first_seen = np.unique(codes, return_index=True)
+    order = np.lexsort((first_seen, -counts[present]))
+    return [(labels[code], int(counts[code])) for code in present[order]]
 
-    total_alumni = len(paths)
-    paths_with_cdtm = sum(1 for p in paths if any(n.get('is_cdtm') for n in p['nodes']))
-    field_counter = Counter([p['primary_field'] for p in paths])
 
-    degree_counter = Counter()
-    for path in paths:
-        for node in path['nodes']:
-            if not node.get('is_cdtm'):
-                degree_counter[node['degree']] += 1
+def get_statistics(path_idx: np.ndarray) -> Dict:
+    """Calculate statistics for the given indices into ALUMNI_PATHS."""
+    if not len(path_idx):
+        return {}
 
-    path_lengths = [len(p['nodes']) for p in paths]
+    node_idx = concat_ranges(PATH_NODE_START[path_idx], PATH_NODE_END[path_idx])
+    path_lengths = PATH_LENGTH[path_idx]
 
     return {
-        'total_alumni': total_alumni,
-        'paths_with_cdtm': paths_with_cdtm,
-        'field_counter': field_counter.most_common(),
-        'degree_counter': degree_counter.most_common(5),
+        'total_alumni': len(path_idx),
+        'paths_with_cdtm': int(np.count_nonzero(PATH_HAS_CDTM[path_idx])),
+        'field_counter': _most_common(PATH_PRIMARY_FIELD[path_idx], FIELD_NAMES),
+        'degree_counter': _most_common(NODE_DEGREE[node_idx], DEGREE_NAMES)[:5],
         'avg_path_length': np.mean(path_lengths),
         'median_path_length': np.median(path_lengths)
     }
 
 
+def _make_filters(field_filter: str, degree_filter: str) -> Dict:
+    """Map dropdown values to extract_paths filters ('All' disables a filter)."""
+    return {
+        'field': field_filter if field_filter != 'All' else None,
+        'degree': degree_filter if degree_filter != 'All' else None
+    }
+
+
+# The figure of all paths is sent once with the page. Filter changes only
+# toggle its path traces' visibility and replace the node trace.
+FULL_FIGURE = create_plotly_figure(ALUMNI_PATHS, zlib.crc32(b"All|All"))
+NODE_TRACE_INDEX = len(FULL_FIGURE['data']) - 1
+LINE_TRACE_FIELD = np.array([trace['meta']['field_code'] for trace in FULL_FIGURE['data'][:NODE_TRACE_INDEX]],
+                            dtype=np.int8)
+LINE_TRACE_DEGREES = np.array([trace['meta']['degree_mask'] for trace in FULL_FIGURE['data'][:NODE_TRACE_INDEX]],
+                              dtype=np.uint8)
+
+
+@functools.lru_cache(maxsize=32)
+def node_trace_for_filters(field_filter: str, degree_filter: str) -> Dict:
+    """Node trace memoized per filter combination."""
+    path_idx = select_paths(_make_filters(field_filter, degree_filter))
+    visits = PATH_STATION_VISITS[path_idx].sum(axis=0)
+    return create_node_trace(dict(zip(STATION_NAMES, visits.tolist())))
+
+
+def figure_patch(field_filter: str, degree_filter: str) -> dash.Patch:
+    """Patch turning FULL_FIGURE into the figure of one filter combination."""
+    visible = filter_mask(LINE_TRACE_FIELD, LINE_TRACE_DEGREES, _make_filters(field_filter, degree_filter))
+
+    patched = dash.Patch()
+    for trace_idx, trace_visible in enumerate(visible.tolist()):
+        patched['data'][trace_idx]['visible'] = trace_visible
+    patched['data'][NODE_TRACE_INDEX] = node_trace_for_filters(field_filter, degree_filter)
+    return patched
+
+
+@functools.lru_cache(maxsize=32)
+def statistics_for_filters(field_filter: str, degree_filter: str) -> Dict:
+    """get_statistics memoized per filter combination."""
+    return get_statistics(select_paths(_make_filters(field_filter, degree_filter)))
+
+
 # Dash app
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
 app.title = "CDTM Alumni Education Paths"
 
+# WSGI entry point for production servers, e.g.
+#   gunicorn -w 4 -k gthread --threads 2 app_plotly:server
+server = app.server
+
 app.layout = dbc.Container([
     dbc.Row([
         dbc.Col([
@@ -442,7 +681,15 @@ app.layout = dbc.Container([
                         id="loading-viz",
                         type="default",
                         children=[
-                            dcc.Graph(id='flow-diagram', config={'displayModeBar': True})
+                            dcc.Graph(
+                                id='flow-diagram',
+                                figure=FULL_FIGURE,
+                                config={
+                                    'displayModeBar': True,
+                                    'responsive': True,
+                                    'plotGlPixelRatio': 2
+                                }
+                            )
                         ]
                     )
                 ])
@@ -477,22 +724,26 @@ app.layout = dbc.Container([
 ], fluid=True)
 
 
+# The graph and the statistics are separate callbacks, so Dash requests them
+# in parallel and the graph update never waits for the statistics
 @app.callback(
-    [Output('flow-diagram', 'figure'),
-     Output('statistics-panel', 'children')],
+    Output('flow-diagram', 'figure'),
     [Input('field-filter', 'value'),
      Input('degree-filter', 'value')]
 )
 def update_visualization(field_filter, degree_filter):
     """Update visualization based on filters."""
-    filters = {
-        'field': field_filter if field_filter != 'All' else None,
-        'degree': degree_filter if degree_filter != 'All' else None
-    }
+    return figure_patch(field_filter, degree_filter)
 
-    paths = extract_paths(ALUMNI_DATA, filters)
-    fig = create_plotly_figure(paths)
-    stats = get_statistics(paths)
+
+@app.callback(
+    Output('statistics-panel', 'children'),
+    [Input('field-filter', 'value'),
+     Input('degree-filter', 'value')]
+)
+def update_statistics(field_filter, degree_filter):
+    """Update the statistics panel based on filters."""
+    stats = statistics_for_filters(field_filter, degree_filter)
 
     if stats:
         stats_content = [
@@ -516,7 +767,7 @@ def update_visualization(field_filter, degree_filter):
     else:
         stats_content = [html.P("No data available", className="small")]
 
-    return fig, stats_content
+    return stats_content
 
 
 @app.callback(
@@ -538,10 +789,16 @@ if __name__ == '__main__':
     print("\n" + "="*60)
     print("CDTM Alumni Education Path Explorer (Interactive Plotly)")
     print("="*60)
-    print(f"\nLoaded {len(ALUMNI_DATA)} alumni profiles")
+    print(f"\nLoaded {ALUMNI_COUNT} alumni profiles")
     print("\nOpen your browser and navigate to: http://127.0.0.1:8050")
     print("Hover over paths to see alumni names!")
     print("\nPress Ctrl+C to stop the server")
     print("="*60 + "\n")
 
-    app.run(debug=True, host='0.0.0.0', port=8050)
+    # Debug mode (hot reload, dev tools, prop validation) slows every callback,
+    # so it is only enabled on request
+    if os.environ.get('DASH_DEV'):
+        app.run(debug=True, host='0.0.0.0', port=8050)
+    else:
+        print("For production, serve with: gunicorn -w 4 -k gthread --threads 2 app_plotly:server\n")
+        app.run(debug=False, host='0.0.0.0', port=8050)
@@ -4,23 +4,53 @@ Interactive Dash web application for visualizing CDTM alumni education paths.
 """
 
 import json
+import functools
+import gzip
+import os
+import re
+import sys
+from dataclasses import dataclass
 import dash
 from dash import dcc, html, Input, Output, State, callback
 import dash_bootstrap_components as dbc
-import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.io.json import to_json_plotly
+import numpy as np
 from collections import defaultdict, Counter
-import colorsys
+from operator import itemgetter
 from typing import Dict, List, Tuple, Set
 
+try:
+    import orjson  # Faster JSON parsing at startup
+except ImportError:
+    orjson = None
+
 
 # Load data
+def _load_json(path: str):
+    """Parse a JSON file, using orjson when it is installed.
+
+    A gzipped copy next to the file (path + '.gz') is read instead when it is
+    at least as new as the plain file.
+    """
+    gz_path = path + '.gz'
+    if os.path.exists(gz_path) and (not os.path.exists(path)
+                                    or os.path.getmtime(gz_path) >= os.path.getmtime(path)):
+        with gzip.open(gz_path, 'rb') as f:
+            raw = f.read()
+    else:
+        with open(path, 'rb') as f:
+            raw = f.read()
+
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def load_data():
     """Load alumni and schools data from JSON files."""
-    with open('data/cdtm_alumni_consolidated.json', 'r', encoding='utf-8') as f:
-        alumni_data = json.load(f)
-
-    with open('data/unique_schools_normalized.json', 'r', encoding='utf-8') as f:
-        schools_data = json.load(f)
+    alumni_data = _load_json('data/cdtm_alumni_consolidated.json')
+    schools_data = _load_json('data/unique_schools_normalized.json')
 
     return alumni_data, schools_data
 
@@ -28,6 +58,41 @@ def load_data():
 ALUMNI_DATA, SCHOOLS_DATA = load_data()
 
 
+def _keyword_pattern(terms: List[str]) -> re.Pattern:
+    """Compile a case-insensitive substring alternation for the given terms."""
+    return re.compile('|'.join(re.escape(term) for term in terms), re.IGNORECASE)
+
+
+# Checked in order, the first matching category wins
+_DEGREE_PATTERNS = [
+    ("Bachelor's", _keyword_pattern(['bachelor', 'b.sc', 'b.a', 'b.eng', 'bsc', 'ba ', 'bs '])),
+    ("Master's", _keyword_pattern(['master', 'm.sc', 'm.a', 'm.eng', 'msc', 'ma ', 'ms ', 'mba'])),
+    ("Doctorate", _keyword_pattern(['phd', 'ph.d', 'doctor', 'doctorate'])),
+    ("Diploma", _keyword_pattern(['dipl', 'diploma'])),
+]
+
+_FIELD_PATTERNS = [
+    ("Engineering/Tech", _keyword_pattern([
+        'engineering', 'computer science', 'informatics', 'information systems',
+        'software', 'electrical', 'mechanical', 'industrial', 'technology', 'computer'
+    ])),
+    ("Business", _keyword_pattern([
+        'business', 'management', 'mba', 'economics', 'finance', 'accounting',
+        'marketing', 'entrepreneurship', 'bwl'
+    ])),
+    ("Sciences", _keyword_pattern([
+        'physics', 'chemistry', 'biology', 'mathematics', 'science',
+        'biotechnology', 'biotech'
+    ])),
+    ("Humanities", _keyword_pattern([
+        'psychology', 'sociology', 'political', 'law', 'humanities',
+        'communication', 'media', 'design'
+    ])),
+]
+
+_MBA_PATTERN = _keyword_pattern(['mba'])
+
+
 def categorize_degree(degree: str, field: str) -> str:
     """Categorize a degree into a standardized level."""
     if not degree:
@@ -35,16 +100,9 @@ def categorize_degree(degree: str, field: str) -> str:
             return "Certificate/Other"
         return "Unknown"
 
-    degree_lower = degree.lower()
-
-    if any(term in degree_lower for term in ['bachelor', 'b.sc', 'b.a', 'b.eng', 'bsc', 'ba ', 'bs ']):
-        return "Bachelor's"
-    if any(term in degree_lower for term in ['master', 'm.sc', 'm.a', 'm.eng', 'msc', 'ma ', 'ms ', 'mba']):
-        return "Master's"
-    if any(term in degree_lower for term in ['phd', 'ph.d', 'doctor', 'doctorate']):
-        return "Doctorate"
-    if any(term in degree_lower for term in ['dipl', 'diploma']):
-        return "Diploma"
+    for category, pattern in _DEGREE_PATTERNS:
+        if pattern.search(degree):
+            return category
 
     return "Certificate/Other"
 
@@ -52,35 +110,13 @@ def categorize_degree(degree: str, field: str) -> str:
 def categorize_field(field: str, degree: str) -> str:
     """Categorize field of study into broader categories."""
     if not field:
-        if degree and 'mba' in degree.lower():
+        if degree and _MBA_PATTERN.search(degree):
             return "Business"
         return "Unknown"
 
-    field_lower = field.lower()
-
-    if any(term in field_lower for term in [
-        'engineering', 'computer science', 'informatics', 'information systems',
-        'software', 'electrical', 'mechanical', 'industrial', 'technology', 'computer'
-    ]):
-        return "Engineering/Tech"
-
-    if any(term in field_lower for term in [
-        'business', 'management', 'mba', 'economics', 'finance', 'accounting',
-        'marketing', 'entrepreneurship', 'bwl'
-    ]):
-        return "Business"
-
-    if any(term in field_lower for term in [
-        'physics', 'chemistry', 'biology', 'mathematics', 'science',
-        'biotechnology', 'biotech'
-    ]):
-        return "Sciences"
-
-    if any(term in field_lower for term in [
-        'psychology', 'sociology', 'political', 'law', 'humanities',
-        'communication', 'media', 'design'
-    ]):
-        return "Humanities"
+    for category, pattern in _FIELD_PATTERNS:
+        if pattern.search(field):
+            return category
 
     return "Other"
 
@@ -89,18 +125,34 @@ def get_institution_info(school_name: str) -> Tuple[str, str, bool]:
     """Get institution type, country, and top-tier status."""
     if school_name in SCHOOLS_DATA:
         school_info = SCHOOLS_DATA[school_name]
+        # Every school record holds its own copy of these strings; interning
+        # makes equal categories the same object so comparisons and dict
+        # lookups short-circuit on identity
         return (
-            school_info.get('institution_type', 'Unknown'),
-            school_info.get('country', 'Unknown'),
+            sys.intern(school_info.get('institution_type', 'Unknown')),
+            sys.intern(school_info.get('country', 'Unknown')),
             school_info.get('is_top_tier', False)
         )
     return 'Unknown', 'Unknown', False
 
 
-def extract_education_sequences(alumni_data: List[Dict], filters: Dict = None) -> Tuple[List[List[Dict]], List[Dict]]:
-    """Extract education sequences from alumni data with optional filtering."""
-    sequences = []
-    alumni_info = []
+@dataclass(slots=True, frozen=True)
+class AlumniInfo:
+    """Display details of one alumnus, shared by every flow they appear in."""
+    name: str
+    headline: str
+    location: str
+    linkedin_url: str
+    sequence: List[Dict]
+
+
+def _preprocess_alumni(alumni_data: List[Dict]) -> List[Tuple[AlumniInfo, List[Dict]]]:
+    """Categorize every alumnus's education entries once.
+
+    Returns (alumni_info, sequence) pairs for all alumni with at least one
+    non-CDTM education entry.
+    """
+    preprocessed = []
 
     for person in alumni_data:
         education_path = person.get('education_path', [])
@@ -133,101 +185,210 @@ def extract_education_sequences(alumni_data: List[Dict], filters: Dict = None) -
                 'original_field': field
             })
 
-        # Apply filters
-        if filters:
-            if filters.get('field') and filters['field'] != 'All':
-                if not any(e['field_category'] == filters['field'] for e in sequence):
-                    continue
+        if sequence:
+            preprocessed.append((AlumniInfo(
+                person.get('full_name', 'Unknown'),
+                person.get('headline', ''),
+                person.get('location', ''),
+                person.get('linkedin_url', ''),
+                sequence
+            ), sequence))
 
-            if filters.get('degree') and filters['degree'] != 'All':
-                if not any(e['degree_level'] == filters['degree'] for e in sequence):
-                    continue
+    return preprocessed
 
-            if filters.get('institution') and filters['institution'] != 'All':
-                if not any(e['institution_type'] == filters['institution'] for e in sequence):
-                    continue
 
-        if sequence:
-            sequences.append(sequence)
-            alumni_info.append({
-                'name': person.get('full_name', 'Unknown'),
-                'headline': person.get('headline', ''),
-                'location': person.get('location', ''),
-                'linkedin_url': person.get('linkedin_url', ''),
-                'sequence': sequence
-            })
+# Categorization only depends on the static data, so it runs once at startup
+PREPROCESSED_ALUMNI = _preprocess_alumni(ALUMNI_DATA)
+
+
+# Filter dropdown -> education entry attribute it matches against
+FILTER_COLUMNS = {
+    'field': 'field_category',
+    'degree': 'degree_level',
+    'institution': 'institution_type',
+}
+
+
+def _build_edu_table(preprocessed: List[Tuple[Dict, List[Dict]]]):
+    """Build a columnar (SoA) view of all education entries.
+
+    Category strings are replaced by small integer codes so filters can be
+    evaluated with NumPy instead of comparing strings entry by entry.
+    Returns (codes, columns, alumni_idx) where codes maps each column to its
+    {category: code} table and alumni_idx gives the owning alumnus per entry.
+    """
+    codes = {column: {} for column in FILTER_COLUMNS.values()}
+    columns = {column: [] for column in codes}
+    alumni_idx = []
+
+    for idx, (_, sequence) in enumerate(preprocessed):
+        for edu in sequence:
+            alumni_idx.append(idx)
+            for column, table in codes.items():
+                columns[column].append(table.setdefault(edu[column], len(table)))
+
+    columns = {column: np.array(values, dtype=np.int16) for column, values in columns.items()}
+    return codes, columns, np.array(alumni_idx, dtype=np.int32)
+
+
+EDU_CODES, EDU_COLUMNS, EDU_ALUMNI_IDX = _build_edu_table(PREPROCESSED_ALUMNI)
+
+
+def extract_education_sequences(filters: Dict = None) -> Tuple[List[List[Dict]], List[AlumniInfo]]:
+    """Return the preprocessed education sequences matching the optional filters.
+
+    An alumnus matches a filter if any of their education entries has the
+    selected category.
+    """
+    selected = np.ones(len(PREPROCESSED_ALUMNI), dtype=bool)
+
+    for filter_key, column in FILTER_COLUMNS.items():
+        value = (filters or {}).get(filter_key)
+        if not value or value == 'All':
+            continue
+
+        code = EDU_CODES[column].get(value)
+        if code is None:
+            # No education entry has this category, so nobody can match
+            return [], []
+
+        matches = np.zeros(len(PREPROCESSED_ALUMNI), dtype=bool)
+        matches[EDU_ALUMNI_IDX[EDU_COLUMNS[column] == code]] = True
+        selected &= matches
+
+        # Skip the remaining filters once no alumnus is left
+        if not selected.any():
+            return [], []
+
+    sequences = []
+    alumni_info = []
+    for idx in np.flatnonzero(selected):
+        info, sequence = PREPROCESSED_ALUMNI[idx]
+        sequences.append(sequence)
+        alumni_info.append(info)
 
     return sequences, alumni_info
 
 
 def generate_colors(n: int, saturation: float = 0.7, value: float = 0.8) -> List[str]:
     """Generate n visually distinct colors."""
-    colors = []
-    for i in range(n):
-        hue = i / n
-        rgb = colorsys.hsv_to_rgb(hue, saturation, value)
-        colors.append(f'rgba({int(rgb[0]*255)}, {int(rgb[1]*255)}, {int(rgb[2]*255)}, 0.8)')
-    return colors
+    hue = np.arange(n) / n
 
+    # Vectorized version of colorsys.hsv_to_rgb for evenly spaced hues
+    sector = (hue * 6.0).astype(int)
+    f = hue * 6.0 - sector
+    p = np.full(n, value * (1.0 - saturation))
+    q = value * (1.0 - saturation * f)
+    t = value * (1.0 - saturation * (1.0 - f))
+    v = np.full(n, value)
 
-def build_sankey_data(sequences: List[List[Dict]], alumni_info: List[Dict], view_mode: str = 'field'):
-    """Build Sankey diagram data from education sequences."""
+    sector %= 6
+    r = np.choose(sector, [v, q, p, p, t, v])
+    g = np.choose(sector, [t, v, v, q, p, p])
+    b = np.choose(sector, [p, p, t, v, v, q])
+    rgb = (np.stack([r, g, b], axis=1) * 255).astype(int)
 
-    node_set = set()
-    flow_counter = defaultdict(int)
-    flow_alumni = defaultdict(list)  # Track which alumni use each flow
+    return [f'rgba({red}, {green}, {blue}, 0.8)' for red, green, blue in rgb.tolist()]
 
-    degree_levels = ['Bachelor\'s', 'Diploma', 'Master\'s', 'Doctorate']
 
-    for idx, sequence in enumerate(sequences):
-        stages = []
-
-        for degree_level in degree_levels:
-            entries = [e for e in sequence if e['degree_level'] == degree_level]
-            if entries:
-                stages.append(entries[0])
-
-        for i in range(len(stages) - 1):
-            current = stages[i]
-            next_stage = stages[i + 1]
-
-            if view_mode == 'field':
-                current_node = f"{current['degree_level']}\n{current['field_category']}"
-                next_node = f"{next_stage['degree_level']}\n{next_stage['field_category']}"
-            elif view_mode == 'institution':
-                current_node = f"{current['degree_level']}\n{current['institution_type']}"
-                next_node = f"{next_stage['degree_level']}\n{next_stage['institution_type']}"
-            else:  # country
-                current_node = f"{current['degree_level']}\n{current['country']}"
-                next_node = f"{next_stage['degree_level']}\n{next_stage['country']}"
-
-            node_set.add(current_node)
-            node_set.add(next_node)
-
-            flow_key = (current_node, next_node)
-            flow_counter[flow_key] += 1
-            flow_alumni[flow_key].append(alumni_info[idx])
-
-    node_list = sorted(list(node_set))
+# Degree level -> stage position in the Sankey diagram
+DEGREE_STAGE = {"Bachelor's": 0, "Diploma": 1, "Master's": 2, "Doctorate": 3}
+
+
+def get_stages(sequence: List[Dict]) -> List[Dict]:
+    """Return the first entry of each degree stage, in stage order."""
+    stages = [None] * len(DEGREE_STAGE)
+    for edu in sequence:
+        stage_idx = DEGREE_STAGE.get(edu['degree_level'])
+        if stage_idx is not None and stages[stage_idx] is None:
+            stages[stage_idx] = edu
+    return [stage for stage in stages if stage is not None]
+
+
+# Stage attribute shown next to the degree level in each view mode
+VIEW_GETTERS = {
+    'field': itemgetter('field_category'),
+    'institution': itemgetter('institution_type'),
+    'country': itemgetter('country')
+}
+
+
+def view_getter(view_mode: str):
+    """Return the stage attribute getter for a view mode (country by default)."""
+    return VIEW_GETTERS.get(view_mode, VIEW_GETTERS['country'])
+
+
+def stage_transitions(stages: List[Dict], get_category) -> List[Tuple[str, str]]:
+    """Return the (source node, target node) pairs between consecutive stages.
+
+    get_category is the view_getter of the active view mode.
+    """
+    # Label every stage once, then pair neighbouring labels
+    stage_nodes = [f"{stage['degree_level']}\n{get_category(stage)}" for stage in stages]
+    return list(zip(stage_nodes, stage_nodes[1:]))
+
+
+def _build_node_universe(view_mode: str) -> Tuple[List[str], Dict[str, int], List[str]]:
+    """Return every node of a view mode with its index and color.
+
+    Computed over all alumni, so each node keeps the same position and color
+    regardless of the active filters.
+    """
+    get_category = view_getter(view_mode)
+    node_list = sorted({
+        node
+        for _, sequence in PREPROCESSED_ALUMNI
+        for pair in stage_transitions(get_stages(sequence), get_category)
+        for node in pair
+    })
     node_dict = {node: idx for idx, node in enumerate(node_list)}
+    return node_list, node_dict, generate_colors(len(node_list))
+
+
+NODE_UNIVERSE = {view_mode: _build_node_universe(view_mode)
+                 for view_mode in ('field', 'institution', 'country')}
+
+
+# Number of alumni names listed in a flow's hover text
+MAX_HOVER_ALUMNI = 10
+
+
+def build_sankey_data(pairs: List[Tuple[str, str]], pair_alumni_idx: List[int],
+                      alumni_info: List[AlumniInfo], view_mode: str = 'field'):
+    """Build Sankey diagram data from the collected stage transitions."""
 
-    node_colors = generate_colors(len(node_list))
+    flow_counter = Counter(pairs)
 
-    sources = []
-    targets = []
-    values = []
+    # Track the first alumni using each flow (only those are shown on hover)
+    flow_alumni = defaultdict(list)
+    for flow_key, idx in zip(pairs, pair_alumni_idx):
+        alumni_list = flow_alumni[flow_key]
+        if len(alumni_list) < MAX_HOVER_ALUMNI:
+            alumni_list.append(alumni_info[idx])
+
+    universe_nodes, universe_index, universe_colors = NODE_UNIVERSE[view_mode]
+
+    # Only emit nodes that take part in a flow, keeping the universe order
+    used = sorted({universe_index[node] for flow_key in flow_counter for node in flow_key})
+    node_list = [universe_nodes[i] for i in used]
+    node_colors = [universe_colors[i] for i in used]
+    node_dict = {node: idx for idx, node in enumerate(node_list)}
+
+    n_flows = len(flow_counter)
+    sources = np.empty(n_flows, dtype=np.int32)
+    targets = np.empty(n_flows, dtype=np.int32)
+    values = np.empty(n_flows, dtype=np.int32)
     customdata = []
 
-    for (source_node, target_node), count in flow_counter.items():
-        sources.append(node_dict[source_node])
-        targets.append(node_dict[target_node])
-        values.append(count)
+    for i, ((source_node, target_node), count) in enumerate(flow_counter.items()):
+        sources[i] = node_dict[source_node]
+        targets[i] = node_dict[target_node]
+        values[i] = count
 
         # Prepare custom data for hover
-        alumni_list = flow_alumni[(source_node, target_node)]
-        alumni_names = [a['name'] for a in alumni_list[:10]]  # First 10
-        if len(alumni_list) > 10:
-            alumni_names.append(f"... and {len(alumni_list) - 10} more")
+        alumni_names = [a.name for a in flow_alumni[(source_node, target_node)]]
+        if count > MAX_HOVER_ALUMNI:
+            alumni_names.append(f"... and {count - MAX_HOVER_ALUMNI} more")
 
         customdata.append({
             'count': count,
@@ -239,297 +400,310 @@ def build_sankey_data(sequences: List[List[Dict]], alumni_info: List[Dict], view
     return node_list, sources, targets, values, node_colors, customdata
 
 
-def create_sankey_figure(sequences, alumni_info, view_mode='field'):
-    """Create a Sankey figure."""
-
-    if not sequences:
-        # Return empty figure
-        fig = go.Figure()
-        fig.update_layout(
-            title="No data available with current filters",
-            height=700
-        )
-        return fig
-
-    nodes, sources, targets, values, colors, customdata = build_sankey_data(
-        sequences, alumni_info, view_mode
-    )
-
-    # Create hover text for links
-    link_labels = []
-    for cd in customdata:
-        hover_text = f"<b>{cd['source']} → {cd['target']}</b><br>"
-        hover_text += f"<b>Count:</b> {cd['count']} alumni<br><br>"
-        hover_text += "<b>Sample alumni:</b><br>"
-        hover_text += "<br>".join(cd['alumni'])
-        link_labels.append(hover_text)
-
-    fig = go.Figure(data=[go.Sankey(
-        node=dict(
-            pad=20,
-            thickness=30,
-            line=dict(color="white", width=2),
-            label=nodes,
-            color=colors,
-            hovertemplate='<b>%{label}</b><br>%{value} transitions<extra></extra>'
-        ),
-        link=dict(
-            source=sources,
-            target=targets,
-            value=values,
-            color="rgba(150, 150, 150, 0.3)",
-            hovertemplate='%{customdata}<extra></extra>',
-            customdata=link_labels
-        )
-    )])
+def compute_all(filters: Dict = None, view_mode: str = 'field'):
+    """Filter the alumni and compute Sankey data and statistics in one pass.
 
-    title_suffix = {
-        'field': 'by Field of Study',
-        'institution': 'by Institution Type',
-        'country': 'by Country'
-    }
-
-    fig.update_layout(
-        title={
-            'text': f"CDTM Alumni Education Paths - {title_suffix.get(view_mode, '')}",
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 20, 'family': 'Arial, sans-serif'}
-        },
-        font=dict(size=11, family='Arial, sans-serif'),
-        height=700,
-        paper_bgcolor='white',
-        plot_bgcolor='white'
-    )
-
-    return fig
-
-
-def get_statistics(sequences, alumni_info):
-    """Calculate statistics from sequences."""
+    Returns (sankey_data, stats); sankey_data is the build_sankey_data tuple,
+    or None and an empty stats dict if no alumni match the filters.
+    """
+    sequences, alumni_info = extract_education_sequences(filters)
     if not sequences:
-        return {}
-
-    total_alumni = len(sequences)
+        return None, {}
 
     degree_counter = Counter()
     field_counter = Counter()
     institution_counter = Counter()
+    transition_counter = Counter()
+
+    pairs = []  # (source node, target node) for every Sankey transition
+    pair_alumni_idx = []  # Index into alumni_info for each pair
+    get_category = view_getter(view_mode)
 
-    for sequence in sequences:
+    for idx, sequence in enumerate(sequences):
         for edu in sequence:
             degree_counter[edu['degree_level']] += 1
             field_counter[edu['field_category']] += 1
             institution_counter[edu['institution_type']] += 1
 
-    # Most common transitions
-    transition_counter = Counter()
-    degree_levels = ['Bachelor\'s', 'Diploma', 'Master\'s', 'Doctorate']
-
-    for sequence in sequences:
-        stages = []
-        for degree_level in degree_levels:
-            entries = [e for e in sequence if e['degree_level'] == degree_level]
-            if entries:
-                stages.append(entries[0])
-
-        for i in range(len(stages) - 1):
-            current = stages[i]
-            next_stage = stages[i + 1]
+        stages = get_stages(sequence)
+
+        for flow_key in stage_transitions(stages, get_category):
+            pairs.append(flow_key)
+            pair_alumni_idx.append(idx)
+
+        # Most common transitions
+        for current, next_stage in zip(stages, stages[1:]):
             transition = (
                 f"{current['degree_level']} ({current['field_category']})",
                 f"{next_stage['degree_level']} ({next_stage['field_category']})"
             )
             transition_counter[transition] += 1
 
-    return {
-        'total_alumni': total_alumni,
+    stats = {
+        'total_alumni': len(sequences),
         'degree_counter': degree_counter.most_common(10),
         'field_counter': field_counter.most_common(10),
         'institution_counter': institution_counter.most_common(10),
         'top_transitions': transition_counter.most_common(10)
     }
 
+    return build_sankey_data(pairs, pair_alumni_idx, alumni_info, view_mode), stats
+
+
+# The default template go.Figure would apply, so dict figures look the same
+PLOTLY_TEMPLATE = pio.templates[pio.templates.default].to_plotly_json()
+
+
+def create_sankey_figure(sankey_data, view_mode='field'):
+    """Create a Sankey figure from build_sankey_data output."""
+
+    if not sankey_data:
+        # Return empty figure
+        return {
+            'data': [],
+            'layout': {
+                'template': PLOTLY_TEMPLATE,
+                'title': {'text': "No data available with current filters"},
+                'height': 700
+            }
+        }
+
+    nodes, sources, targets, values, colors, customdata = sankey_data
+
+    # Create hover text for links
+    link_labels = []
+    for cd in customdata:
+        hover_text = f"<b>{cd['source']} → {cd['target']}</b><br>"
+        hover_text += f"<b>Count:</b> {cd['count']} alumni<br><br>"
+        hover_text += "<b>Sample alumni:</b><br>"
+        hover_text += "<br>".join(cd['alumni'])
+        link_labels.append(hover_text)
+
+    title_suffix = {
+        'field': 'by Field of Study',
+        'institution': 'by Institution Type',
+        'country': 'by Country'
+    }
+
+    # Plain dict figure: Dash serializes it as is, skipping go.Figure's
+    # per-property validation
+    return {
+        'data': [{
+            'type': 'sankey',
+            'node': {
+                'pad': 20,
+                'thickness': 30,
+                'line': {'color': "white", 'width': 2},
+                'label': nodes,
+                'color': colors,
+                'hovertemplate': '<b>%{label}</b><br>%{value} transitions<extra></extra>'
+            },
+            'link': {
+                'source': sources,
+                'target': targets,
+                'value': values,
+                'color': "rgba(150, 150, 150, 0.3)",
+                'hovertemplate': '%{customdata}<extra></extra>',
+                'customdata': link_labels
+            }
+        }],
+        'layout': {
+            'template': PLOTLY_TEMPLATE,
+            'title': {
+                'text': f"CDTM Alumni Education Paths - {title_suffix.get(view_mode, '')}",
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 20, 'family': 'Arial, sans-serif'}
+            },
+            'font': {'size': 11, 'family': 'Arial, sans-serif'},
+            'height': 700,
+            'paper_bgcolor': 'white',
+            'plot_bgcolor': 'white'
+        }
+    }
+
 
 # Initialize the Dash app
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
 app.title = "CDTM Alumni Education Paths"
 
 # Layout
-app.layout = dbc.Container([
-    dbc.Row([
-        dbc.Col([
-            html.H1("🎓 CDTM Alumni Education Path Explorer", className="text-center mb-4 mt-4"),
-            html.P(
-                "Interactive visualization of education paths for CDTM alumni. "
-                "Hover over flows to see individual alumni names and details.",
-                className="text-center text-muted mb-4"
-            )
-        ])
-    ]),
-
-    dbc.Row([
-        dbc.Col([
-            dbc.Card([
-                dbc.CardHeader(html.H5("Filters & Controls")),
-                dbc.CardBody([
-                    dbc.Row([
-                        dbc.Col([
-                            html.Label("View Mode:", className="fw-bold"),
-                            dcc.Dropdown(
-                                id='view-mode',
-                                options=[
-                                    {'label': 'By Field of Study', 'value': 'field'},
-                                    {'label': 'By Institution Type', 'value': 'institution'},
-                                    {'label': 'By Country', 'value': 'country'}
-                                ],
-                                value='field',
-                                clearable=False
-                            )
-                        ], md=4),
-
-                        dbc.Col([
-                            html.Label("Filter by Field:", className="fw-bold"),
-                            dcc.Dropdown(
-                                id='field-filter',
-                                options=[
-                                    {'label': 'All Fields', 'value': 'All'},
-                                    {'label': 'Engineering/Tech', 'value': 'Engineering/Tech'},
-                                    {'label': 'Business', 'value': 'Business'},
-                                    {'label': 'Sciences', 'value': 'Sciences'},
-                                    {'label': 'Humanities', 'value': 'Humanities'},
-                                    {'label': 'Other', 'value': 'Other'}
-                                ],
-                                value='All',
-                                clearable=False
-                            )
-                        ], md=4),
-
-                        dbc.Col([
-                            html.Label("Filter by Degree:", className="fw-bold"),
-                            dcc.Dropdown(
-                                id='degree-filter',
-                                options=[
-                                    {'label': 'All Degrees', 'value': 'All'},
-                                    {'label': "Bachelor's", 'value': "Bachelor's"},
-                                    {'label': "Master's", 'value': "Master's"},
-                                    {'label': "Doctorate", 'value': "Doctorate"},
-                                    {'label': "Diploma", 'value': "Diploma"}
-                                ],
-                                value='All',
-                                clearable=False
-                            )
-                        ], md=4)
-                    ]),
-
-                    dbc.Row([
-                        dbc.Col([
-                            html.Label("Filter by Institution:", className="fw-bold mt-3"),
-                            dcc.Dropdown(
-                                id='institution-filter',
-                                options=[
-                                    {'label': 'All Institutions', 'value': 'All'},
-                                    {'label': 'University', 'value': 'University'},
-                                    {'label': 'Technical University', 'value': 'Technical University'},
-                                    {'label': 'Business School', 'value': 'Business School'},
-                                    {'label': 'College', 'value': 'College'}
-                                ],
-                                value='All',
-                                clearable=False
-                            )
-                        ], md=4),
-
-                        dbc.Col([
-                            html.Div([
-                                html.Label("", className="d-block"),
-                                dbc.Button(
-                                    "Reset All Filters",
-                                    id='reset-button',
-                                    color="secondary",
-                                    className="mt-4 w-100"
+@functools.lru_cache(maxsize=None)
+def build_layout():
+    """Build the page layout on the first request and reuse it afterwards."""
+    return dbc.Container([
+        dbc.Row([
+            dbc.Col([
+                html.H1("🎓 CDTM Alumni Education Path Explorer", className="text-center mb-4 mt-4"),
+                html.P(
+                    "Interactive visualization of education paths for CDTM alumni. "
+                    "Hover over flows to see individual alumni names and details.",
+                    className="text-center text-muted mb-4"
+                )
+            ])
+        ]),
+
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader(html.H5("Filters & Controls")),
+                    dbc.CardBody([
+                        dbc.Row([
+                            dbc.Col([
+                                html.Label("View Mode:", className="fw-bold"),
+                                dcc.Dropdown(
+                                    id='view-mode',
+                                    options=[
+                                        {'label': 'By Field of Study', 'value': 'field'},
+                                        {'label': 'By Institution Type', 'value': 'institution'},
+                                        {'label': 'By Country', 'value': 'country'}
+                                    ],
+                                    value='field',
+                                    clearable=False
                                 )
-                            ])
-                        ], md=4)
-                    ], className="mt-3")
-                ])
-            ], className="mb-4")
-        ])
-    ]),
-
-    dbc.Row([
-        dbc.Col([
-            dbc.Card([
-                dbc.CardHeader(html.H5("Education Flow Diagram")),
-                dbc.CardBody([
-                    dcc.Loading(
-                        id="loading-sankey",
-                        type="default",
-                        children=[
-                            dcc.Graph(
-                                id='sankey-diagram',
-                                config={'displayModeBar': True, 'displaylogo': False}
-                            )
-                        ]
-                    )
-                ])
+                            ], md=4),
+
+                            dbc.Col([
+                                html.Label("Filter by Field:", className="fw-bold"),
+                                dcc.Dropdown(
+                                    id='field-filter',
+                                    options=[
+                                        {'label': 'All Fields', 'value': 'All'},
+                                        {'label': 'Engineering/Tech', 'value': 'Engineering/Tech'},
+                                        {'label': 'Business', 'value': 'Business'},
+                                        {'label': 'Sciences', 'value': 'Sciences'},
+                                        {'label': 'Humanities', 'value': 'Humanities'},
+                                        {'label': 'Other', 'value': 'Other'}
+                                    ],
+                                    value='All',
+                                    clearable=False
+                                )
+                            ], md=4),
+
+                            dbc.Col([
+                                html.Label("Filter by Degree:", className="fw-bold"),
+                                dcc.Dropdown(
+                                    id='degree-filter',
+                                    options=[
+                                        {'label': 'All Degrees', 'value': 'All'},
+                                        {'label': "Bachelor's", 'value': "Bachelor's"},
+                                        {'label': "Master's", 'value': "Master's"},
+                                        {'label': "Doctorate", 'value': "Doctorate"},
+                                        {'label': "Diploma", 'value': "Diploma"}
+                                    ],
+                                    value='All',
+                                    clearable=False
+                                )
+                            ], md=4)
+                        ]),
+
+                        dbc.Row([
+                            dbc.Col([
+                                html.Label("Filter by Institution:", className="fw-bold mt-3"),
+                                dcc.Dropdown(
+                                    id='institution-filter',
+                                    options=[
+                                        {'label': 'All Institutions', 'value': 'All'},
+                                        {'label': 'University', 'value': 'University'},
+                                        {'label': 'Technical University', 'value': 'Technical University'},
+                                        {'label': 'Business School', 'value': 'Business School'},
+                                        {'label': 'College', 'value': 'College'}
+                                    ],
+                                    value='All',
+                                    clearable=False
+                                )
+                            ], md=4),
+
+                            dbc.Col([
+                                html.Div([
+                                    html.Label("", className="d-block"),
+                                    dbc.Button(
+                                        "Reset All Filters",
+                                        id='reset-button',
+                                        color="secondary",
+                                        className="mt-4 w-100"
+                                    )
+                                ])
+                            ], md=4)
+                        ], className="mt-3")
+                    ])
+                ], className="mb-4")
             ])
-        ], md=8),
-
-        dbc.Col([
-            dbc.Card([
-                dbc.CardHeader(html.H5("Statistics")),
-                dbc.CardBody([
-                    html.Div(id='statistics-panel')
+        ]),
+
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader(html.H5("Education Flow Diagram")),
+                    dbc.CardBody([
+                        dcc.Loading(
+                            id="loading-sankey",
+                            type="default",
+                            children=[
+                                dcc.Graph(
+                                    id='sankey-diagram',
+                                    config={'displayModeBar': True, 'displaylogo': False}
+                                )
+                            ]
+                        )
+                    ])
                 ])
-            ], className="mb-3"),
-
-            dbc.Card([
-                dbc.CardHeader(html.H5("Top Transitions")),
-                dbc.CardBody([
-                    html.Div(id='transitions-panel', style={'max-height': '400px', 'overflow-y': 'auto'})
+            ], md=8),
+
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader(html.H5("Statistics")),
+                    dbc.CardBody([
+                        html.Div(id='statistics-panel')
+                    ])
+                ], className="mb-3"),
+
+                dbc.Card([
+                    dbc.CardHeader(html.H5("Top Transitions")),
+                    dbc.CardBody([
+                        html.Div(id='transitions-panel', style={'max-height': '400px', 'overflow-y': 'auto'})
+                    ])
                 ])
+            ], md=4)
+        ]),
+
+        dbc.Row([
+            dbc.Col([
+                html.Hr(className="my-4"),
+                html.P(
+                    "Data source: CDTM Alumni LinkedIn profiles | "
+                    "Hover over flows to see individual alumni paths",
+                    className="text-center text-muted small"
+                )
             ])
-        ], md=4)
-    ]),
-
-    dbc.Row([
-        dbc.Col([
-            html.Hr(className="my-4"),
-            html.P(
-                "Data source: CDTM Alumni LinkedIn profiles | "
-                "Hover over flows to see individual alumni paths",
-                className="text-center text-muted small"
-            )
         ])
-    ])
-], fluid=True)
+    ], fluid=True)
 
 
-@app.callback(
-    [Output('sankey-diagram', 'figure'),
-     Output('statistics-panel', 'children'),
-     Output('transitions-panel', 'children')],
-    [Input('view-mode', 'value'),
-     Input('field-filter', 'value'),
-     Input('degree-filter', 'value'),
-     Input('institution-filter', 'value')]
-)
-def update_visualization(view_mode, field_filter, degree_filter, institution_filter):
-    """Update the visualization based on filters."""
+# Dash calls a callable layout when serving the page, not at import time
+app.layout = build_layout
+
+
+@functools.lru_cache(maxsize=1024)
+def _compute_outputs(view_mode, field_filter, degree_filter, institution_filter):
+    """Build the figure and panels for one combination of dropdown values.
 
+    ALUMNI_DATA is read-only after startup, so results are cached for the
+    lifetime of the process. The outputs are cached in their JSON-decoded
+    form (plain dicts and lists), so revisiting a combination skips both
+    Plotly's figure conversion and Dash's component tree serialization.
+    """
     filters = {
         'field': field_filter if field_filter != 'All' else None,
         'degree': degree_filter if degree_filter != 'All' else None,
         'institution': institution_filter if institution_filter != 'All' else None
     }
 
-    sequences, alumni_info = extract_education_sequences(ALUMNI_DATA, filters)
+    # Sankey data and statistics
+    sankey_data, stats = compute_all(filters, view_mode)
 
     # Create Sankey figure
-    fig = create_sankey_figure(sequences, alumni_info, view_mode)
-
-    # Calculate statistics
-    stats = get_statistics(sequences, alumni_info)
+    fig = create_sankey_figure(sankey_data, view_mode)
 
     # Create statistics panel
     if stats:
@@ -565,7 +739,21 @@ def update_visualization(view_mode, field_filter, degree_filter, institution_fil
     else:
         transitions_content = [html.P("No transitions found")]
 
-    return fig, stats_content, transitions_content
+    return tuple(json.loads(to_json_plotly([fig, stats_content, transitions_content])))
+
+
+@app.callback(
+    [Output('sankey-diagram', 'figure'),
+     Output('statistics-panel', 'children'),
+     Output('transitions-panel', 'children')],
+    [Input('view-mode', 'value'),
+     Input('field-filter', 'value'),
+     Input('degree-filter', 'value'),
+     Input('institution-filter', 'value')]
+)
+def update_visualization(view_mode, field_filter, degree_filter, institution_filter):
+    """Update the visualization based on filters."""
+    return _compute_outputs(view_mode, field_filter, degree_filter, institution_filter)
 
 
 @app.callback(
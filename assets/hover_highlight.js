@@ -6,13 +6,23 @@ if (!window.dashExtensions) {
 window.dashExtensions.setupPathHighlighting = function() {
     console.log('Setting up path highlighting...');
 
-    var graphDiv = document.getElementById('flow-diagram');
+    // In the Dash app 'flow-diagram' is the dcc.Graph container and the Plotly
+    // graph div sits inside it; in the static pages it is the graph div itself
+    var container = document.getElementById('flow-diagram');
+    var graphDiv = container && (container.classList.contains('js-plotly-plot')
+        ? container : container.querySelector('.js-plotly-plot'));
     if (!graphDiv) {
         console.log('Graph not found, retrying...');
         setTimeout(window.dashExtensions.setupPathHighlighting, 200);
         return;
     }
 
+    // Listeners stay attached across figure updates, so set them up only once
+    if (graphDiv._hasPathListeners) {
+        console.log('Path highlighting already set up');
+        return;
+    }
+
     // Wait for Plotly to be fully loaded
     if (!graphDiv.data || graphDiv.data.length === 0) {
         console.log('Graph data not loaded, retrying...');
@@ -23,49 +33,91 @@ window.dashExtensions.setupPathHighlighting = function() {
     console.log('Graph found with', graphDiv.data.length, 'traces');
 
     var hoveredPath = null;
-    var listeners_attached = false;
 
-    // Remove old listeners if they exist
-    if (graphDiv._hasPathListeners) {
-        Plotly.purge(graphDiv);
-        console.log('Removed old listeners');
+    // Indices of the batched path traces (highlight traces carry no customdata)
+    function lineTraceIndices() {
+        var indices = [];
+        for (var i = 0; i < graphDiv.data.length; i++) {
+            var trace = graphDiv.data[i];
+            if (trace.mode === 'lines' && trace.customdata) indices.push(i);
+        }
+        return indices;
+    }
+
+    // Per-point hover text from the per-path table in layout.meta; a new
+    // figure arrives without it, so it is filled in after every plot
+    function fillHoverText() {
+        var pathMeta = graphDiv.layout.meta || [];
+        var indices = lineTraceIndices().filter(function(i) {
+            return !graphDiv.data[i].text;
+        });
+        if (indices.length === 0) return;
+        var texts = indices.map(function(i) {
+            return graphDiv.data[i].customdata.map(function(pathIdx) {
+                return pathIdx === null ? null : pathMeta[pathIdx][0];
+            });
+        });
+        Plotly.restyle(graphDiv, {text: texts}, indices);
+    }
+
+    fillHoverText();
+    graphDiv.on('plotly_afterplot', fillHoverText);
+
+    // Highlight traces are found by their meta tag rather than by position
+    function clearHighlight() {
+        var indices = [];
+        for (var i = 0; i < graphDiv.data.length; i++) {
+            var trace = graphDiv.data[i];
+            if (trace.meta && trace.meta.highlight) indices.push(i);
+        }
+        if (indices.length === 0) return Promise.resolve();
+        return Plotly.deleteTraces(graphDiv, indices);
     }
 
     // Add hover listener
     graphDiv.on('plotly_hover', function(data) {
         console.log('Hover detected');
         var point = data.points[0];
-        if (!point.data.customdata || !point.data.customdata[0]) return;
+        if (point.data.mode !== 'lines' || point.customdata === null || point.customdata === undefined) return;
 
-        var pathId = point.data.customdata[0][0];
+        var pathId = point.customdata;
         console.log('Hovering over path:', pathId);
 
         if (hoveredPath === pathId) return;
         hoveredPath = pathId;
 
-        var update = {opacity: [], 'line.width': []};
-        for (var i = 0; i < graphDiv.data.length; i++) {
+        // Copy the hovered path's segments into highlight traces drawn on top
+        // of the dimmed batches
+        var lineIndices = lineTraceIndices();
+        var highlights = [];
+        lineIndices.forEach(function(i) {
             var trace = graphDiv.data[i];
-            if (trace.mode === 'lines' && trace.customdata) {
-                var tracePathId = trace.customdata[0][0];
-                if (tracePathId === pathId) {
-                    // Highlight this path
-                    update.opacity.push(1.0);
-                    update['line.width'].push(5);
-                } else {
-                    // Dim other paths heavily
-                    update.opacity.push(0.03);
-                    update['line.width'].push(1.5);
+            var xs = [], ys = [];
+            for (var j = 0; j < trace.customdata.length; j++) {
+                if (trace.customdata[j] === pathId) {
+                    xs.push(trace.x[j]);
+                    ys.push(trace.y[j]);
+                } else if (xs.length && xs[xs.length - 1] !== null) {
+                    xs.push(null);
+                    ys.push(null);
                 }
-            } else {
-                // Keep nodes unchanged
-                update.opacity.push(trace.opacity !== undefined ? trace.opacity : 1);
-                update['line.width'].push(trace.marker ? trace.marker.size : 1);
             }
-        }
+            if (xs.length) {
+                highlights.push({
+                    type: trace.type, x: xs, y: ys, mode: 'lines',
+                    line: {color: trace.line.color, width: 5},
+                    opacity: 1.0, hoverinfo: 'skip', showlegend: false,
+                    meta: {highlight: true}
+                });
+            }
+        });
 
         console.log('Applying hover style...');
-        Plotly.restyle(graphDiv, update);
+        clearHighlight().then(function() {
+            // Dim other paths heavily
+            Plotly.restyle(graphDiv, {opacity: 0.03, 'line.width': 1.5}, lineIndices);
+            return Plotly.addTraces(graphDiv, highlights);
+        });
     });
 
     // Add unhover listener
@@ -74,30 +126,24 @@ window.dashExtensions.setupPathHighlighting = function() {
         if (hoveredPath === null) return;
         hoveredPath = null;
 
-        var update = {opacity: [], 'line.width': []};
-        for (var i = 0; i < graphDiv.data.length; i++) {
-            var trace = graphDiv.data[i];
-            if (trace.mode === 'lines' && trace.customdata) {
-                var originalAlpha = trace.customdata[0][2];
-                update.opacity.push(originalAlpha);
-                update['line.width'].push(2.5);
-            } else {
-                update.opacity.push(trace.opacity !== undefined ? trace.opacity : 1);
-                update['line.width'].push(trace.marker ? trace.marker.size : 1);
-            }
-        }
+        var lineIndices = lineTraceIndices();
+        var originalAlphas = lineIndices.map(function(i) {
+            return graphDiv.data[i].meta.opacity;
+        });
 
         console.log('Resetting to normal style...');
-        Plotly.restyle(graphDiv, update);
+        clearHighlight().then(function() {
+            Plotly.restyle(graphDiv, {opacity: originalAlphas, 'line.width': 2.5}, lineIndices);
+        });
     });
 
     // Add click listener for LinkedIn
     graphDiv.on('plotly_click', function(data) {
         console.log('Click detected');
         var point = data.points[0];
-        if (!point.data.customdata || !point.data.customdata[0]) return;
+        if (point.data.mode !== 'lines' || point.customdata === null || point.customdata === undefined) return;
 
-        var linkedinUrl = point.data.customdata[0][3];
+        var linkedinUrl = graphDiv.layout.meta[point.customdata][1];
         if (linkedinUrl) {
             console.log('Opening LinkedIn:', linkedinUrl);
             window.open(linkedinUrl, '_blank');
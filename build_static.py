@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Pre-render the interactive Plotly app's figure for every filter combination as static HTML.
+
+The app only has 25 filter states, so its figures can be written once and served
+from any static file server, e.g. ``python -m http.server -d dist``.
+"""
+
+import os
+import re
+import html
+
+import plotly.io as pio
+
+from app_plotly import (
+    FULL_FIGURE, NODE_TRACE_INDEX, LINE_TRACE_FIELD, LINE_TRACE_DEGREES,
+    ALUMNI_COUNT, filter_mask, node_trace_for_filters, _make_filters
+)
+
+
+FIELD_FILTERS = ['All', 'Engineering/Tech', 'Business', 'Sciences', 'Other']
+DEGREE_FILTERS = ['All', "Bachelor's", "Master's", "Doctorate", "Diploma"]
+OUTPUT_DIR = 'dist'
+
+with open('assets/hover_highlight.js', 'r', encoding='utf-8') as f:
+    HOVER_SCRIPT = f.read()
+
+
+def _url_slug(value: str) -> str:
+    """Turn a filter value into a URL friendly slug."""
+    return re.sub(r'[^a-z0-9]+', '-', value.lower()).strip('-')
+
+
+def static_figure(field_filter: str, degree_filter: str) -> dict:
+    """The figure the app shows for one filter combination.
+
+    Same as applying figure_patch to FULL_FIGURE, with the hidden path traces left out.
+    """
+    visible = filter_mask(LINE_TRACE_FIELD, LINE_TRACE_DEGREES, _make_filters(field_filter, degree_filter))
+    line_traces = [trace for trace, keep in zip(FULL_FIGURE['data'][:NODE_TRACE_INDEX], visible.tolist()) if keep]
+    return {
+        'data': line_traces + [node_trace_for_filters(field_filter, degree_filter)],
+        'layout': FULL_FIGURE['layout']
+    }
+
+
+def write_index(pages: list):
+    """Write an index page linking to every pre-rendered filter combination."""
+    links = '\n'.join(
+        f'<li><a href="{filename}">{html.escape(field_filter)} / {html.escape(degree_filter)}</a></li>'
+        for field_filter, degree_filter, filename in pages
+    )
+    with open(os.path.join(OUTPUT_DIR, 'index.html'), 'w', encoding='utf-8') as f:
+        f.write(f"""<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>CDTM Alumni Education Paths</title></head>
+<body>
+<h1>CDTM Alumni Education Path Explorer</h1>
+<p>Field / Degree filter:</p>
+<ul>
+{links}
+</ul>
+</body>
+</html>
+""")
+
+
+def main():
+    """Write one HTML file per filter combination plus an index page."""
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    print(f"Loaded {ALUMNI_COUNT} alumni profiles")
+
+    pages = []
+    for field_filter in FIELD_FILTERS:
+        for degree_filter in DEGREE_FILTERS:
+            filename = f"{_url_slug(field_filter)}_{_url_slug(degree_filter)}.html"
+            pio.write_html(
+                static_figure(field_filter, degree_filter),
+                os.path.join(OUTPUT_DIR, filename),
+                include_plotlyjs='cdn',
+                full_html=True,
+                div_id='flow-diagram',
+                config={'displayModeBar': True, 'responsive': True, 'plotGlPixelRatio': 2},
+                post_script=HOVER_SCRIPT
+            )
+            pages.append((field_filter, degree_filter, filename))
+            print(f"✓ {field_filter} / {degree_filter} -> {filename}")
+
+    write_index(pages)
+    print(f"\n✓ Wrote {len(pages)} visualizations to {OUTPUT_DIR}/")
+    print(f"✓ Serve them with: python -m http.server -d {OUTPUT_DIR}")
+
+
+if __name__ == '__main__':
+    main()
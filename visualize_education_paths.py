@@ -4,7 +4,7 @@ Visualize education paths of CDTM alumni using a Sankey diagram.
 """
 
 import json
-from collections import defaultdict, Counter
+from collections import Counter
 import plotly.graph_objects as go
 from typing import Dict, List, Tuple, Set
 
@@ -141,20 +141,20 @@ def build_sankey_data(sequences: List[List[Dict]], max_stages: int = 4) -> Tuple
 
     # Track all nodes and flows
     node_set = set()
-    flow_counter = defaultdict(int)
+    flow_keys = []
+
+    # Stages are taken in this order of degree levels
+    degree_levels = ['Bachelor\'s', 'Diploma', 'Master\'s', 'Doctorate', 'Certificate/Other']
 
     # Process each sequence
     for sequence in sequences:
-        # Group by degree level to create stages
-        degree_levels = ['Bachelor\'s', 'Diploma', 'Master\'s', 'Doctorate', 'Certificate/Other']
+        # First occurrence of each degree level, in one pass over the sequence
+        first_by_level = {}
+        for entry in sequence:
+            first_by_level.setdefault(entry['degree_level'], entry)
 
-        stages = []
-        for degree_level in degree_levels:
-            # Find entries matching this degree level
-            entries = [e for e in sequence if e['degree_level'] == degree_level]
-            if entries:
-                # Take the first occurrence
-                stages.append(entries[0])
+        # Group by degree level to create stages
+        stages = [first_by_level[level] for level in degree_levels if level in first_by_level]
 
         # Create flows between consecutive stages
         for i in range(len(stages) - 1):
@@ -169,11 +169,13 @@ def build_sankey_data(sequences: List[List[Dict]], max_stages: int = 4) -> Tuple
             node_set.add(next_node)
 
             # Track flow
-            flow_key = (current_node, next_node)
-            flow_counter[flow_key] += 1
+            flow_keys.append((current_node, next_node))
+
+    # Tally all flows in one pass
+    flow_counter = Counter(flow_keys)
 
     # Convert to lists for Plotly
-    node_list = sorted(list(node_set))
+    node_list = sorted(node_set)
     node_dict = {node: idx for idx, node in enumerate(node_list)}
 
     sources = []
@@ -231,7 +233,8 @@ def create_sankey_diagram(alumni_data: List[Dict], schools_data: Dict, output_fi
     )
 
     # Save to HTML
-    fig.write_html(output_file)
+    # plotly.js is loaded from the CDN instead of being embedded in the file
+    fig.write_html(output_file, include_plotlyjs='cdn', validate=False)
     print(f"Sankey diagram saved to {output_file}")
 
     # Print some statistics
@@ -241,9 +244,7 @@ def create_sankey_diagram(alumni_data: List[Dict], schools_data: Dict, output_fi
     print(f"Total education transitions: {sum(values)}")
 
     # Most common paths
-    path_counter = Counter()
-    for i, (s, t, v) in enumerate(zip(sources, targets, values)):
-        path_counter[(nodes[s], nodes[t])] = v
+    path_counter = Counter({(nodes[s], nodes[t]): v for s, t, v in zip(sources, targets, values)})
 
     print("\n=== Top 10 Education Transitions ===")
     for (source, target), count in path_counter.most_common(10):
@@ -4,24 +4,71 @@ Enhanced visualization of education paths of CDTM alumni using Sankey diagrams.
 Creates multiple views: by degree level & field, by institution type, and by country.
 """
 
+import functools
 import json
-from collections import defaultdict, Counter
+import re
+from collections import Counter
+from dataclasses import dataclass
+import numpy as np
 import plotly.graph_objects as go
 from typing import Dict, List, Tuple
-import colorsys
+
+try:
+    import orjson  # Faster JSON parsing
+except ImportError:
+    orjson = None
+
+
+def _load_json(path: str):
+    """Parse a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
 
 
 def load_data(alumni_file: str, schools_file: str) -> Tuple[List[Dict], Dict]:
     """Load alumni and schools data from JSON files."""
-    with open(alumni_file, 'r', encoding='utf-8') as f:
-        alumni_data = json.load(f)
+    alumni_data = _load_json(alumni_file)
+    schools_data = _load_json(schools_file)
+    return alumni_data, schools_data
 
-    with open(schools_file, 'r', encoding='utf-8') as f:
-        schools_data = json.load(f)
 
-    return alumni_data, schools_data
+def _keyword_pattern(terms: List[str]) -> re.Pattern:
+    """Compile a substring alternation for the given lowercase terms."""
+    return re.compile('|'.join(re.escape(term) for term in terms))
+
 
+# Matched against the lowercased text; checked in order, the first matching category wins
+_DEGREE_PATTERNS = [
+    ("Bachelor's", _keyword_pattern(['bachelor', 'b.sc', 'b.a', 'b.eng', 'bsc', 'ba ', 'bs '])),
+    ("Master's", _keyword_pattern(['master', 'm.sc', 'm.a', 'm.eng', 'msc', 'ma ', 'ms ', 'mba'])),
+    ("Doctorate", _keyword_pattern(['phd', 'ph.d', 'doctor', 'doctorate'])),
+    ("Diploma", _keyword_pattern(['dipl', 'diploma'])),
+]
+
+_FIELD_PATTERNS = [
+    ("Engineering/Tech", _keyword_pattern([
+        'engineering', 'computer science', 'informatics', 'information systems',
+        'software', 'electrical', 'mechanical', 'industrial', 'technology', 'computer'
+    ])),
+    ("Business", _keyword_pattern([
+        'business', 'management', 'mba', 'economics', 'finance', 'accounting',
+        'marketing', 'entrepreneurship', 'bwl'
+    ])),
+    ("Sciences", _keyword_pattern([
+        'physics', 'chemistry', 'biology', 'mathematics', 'science',
+        'biotechnology', 'biotech'
+    ])),
+    ("Humanities", _keyword_pattern([
+        'psychology', 'sociology', 'political', 'law', 'humanities',
+        'communication', 'media', 'design'
+    ])),
+]
 
+# Memoized because the same degree and field strings recur across alumni
+@functools.lru_cache(maxsize=4096)
 def categorize_degree(degree: str, field: str) -> str:
     """Categorize a degree into a standardized level."""
     if not degree:
@@ -30,26 +77,14 @@ def categorize_degree(degree: str, field: str) -> str:
         return "Unknown"
 
     degree_lower = degree.lower()
-
-    # Bachelor's degrees
-    if any(term in degree_lower for term in ['bachelor', 'b.sc', 'b.a', 'b.eng', 'bsc', 'ba ', 'bs ']):
-        return "Bachelor's"
-
-    # Master's degrees
-    if any(term in degree_lower for term in ['master', 'm.sc', 'm.a', 'm.eng', 'msc', 'ma ', 'ms ', 'mba']):
-        return "Master's"
-
-    # Doctoral degrees
-    if any(term in degree_lower for term in ['phd', 'ph.d', 'doctor', 'doctorate']):
-        return "Doctorate"
-
-    # Diploma
-    if any(term in degree_lower for term in ['dipl', 'diploma']):
-        return "Diploma"
+    for category, pattern in _DEGREE_PATTERNS:
+        if pattern.search(degree_lower):
+            return category
 
     return "Certificate/Other"
 
 
+@functools.lru_cache(maxsize=4096)
 def categorize_field(field: str, degree: str) -> str:
     """Categorize field of study into broader categories."""
     if not field:
@@ -58,53 +93,45 @@ def categorize_field(field: str, degree: str) -> str:
         return "Unknown"
 
     field_lower = field.lower()
+    for category, pattern in _FIELD_PATTERNS:
+        if pattern.search(field_lower):
+            return category
 
-    # Engineering & Technology
-    if any(term in field_lower for term in [
-        'engineering', 'computer science', 'informatics', 'information systems',
-        'software', 'electrical', 'mechanical', 'industrial', 'technology', 'computer'
-    ]):
-        return "Engineering/Tech"
-
-    # Business & Management
-    if any(term in field_lower for term in [
-        'business', 'management', 'mba', 'economics', 'finance', 'accounting',
-        'marketing', 'entrepreneurship', 'bwl'
-    ]):
-        return "Business"
-
-    # Natural Sciences
-    if any(term in field_lower for term in [
-        'physics', 'chemistry', 'biology', 'mathematics', 'science',
-        'biotechnology', 'biotech'
-    ]):
-        return "Sciences"
+    return "Other"
 
-    # Social Sciences & Humanities
-    if any(term in field_lower for term in [
-        'psychology', 'sociology', 'political', 'law', 'humanities',
-        'communication', 'media', 'design'
-    ]):
-        return "Humanities"
 
-    return "Other"
+_NO_SCHOOL_INFO = {}
 
 
 def get_institution_info(school_name: str, schools_data: Dict) -> Tuple[str, str, bool]:
     """Get institution type, country, and top-tier status from normalized schools data."""
-    if school_name in schools_data:
-        school_info = schools_data[school_name]
-        return (
-            school_info.get('institution_type', 'Unknown'),
-            school_info.get('country', 'Unknown'),
-            school_info.get('is_top_tier', False)
-        )
-    return 'Unknown', 'Unknown', False
+    # Unknown schools fall through to the defaults of an empty record
+    school_info = schools_data.get(school_name, _NO_SCHOOL_INFO)
+    return (
+        school_info.get('institution_type', 'Unknown'),
+        school_info.get('country', 'Unknown'),
+        school_info.get('is_top_tier', False)
+    )
 
 
-def extract_education_sequences(alumni_data: List[Dict], schools_data: Dict) -> List[List[Dict]]:
+@dataclass(slots=True)
+class EduEntry:
+    """One categorized, non-CDTM education entry of an alumnus."""
+    school: str
+    degree_level: str
+    field_category: str
+    institution_type: str
+    country: str
+    is_top_tier: bool
+    original_degree: str
+    original_field: str
+
+
+def extract_education_sequences(alumni_data: List[Dict], schools_data: Dict) -> List[List[EduEntry]]:
     """Extract education sequences from alumni data."""
     sequences = []
+    # School name -> institution info, looked up once per distinct school
+    institution_info = {}
 
     for person in alumni_data:
         education_path = person.get('education_path', [])
@@ -125,18 +152,20 @@ def extract_education_sequences(alumni_data: List[Dict], schools_data: Dict) ->
 
             degree_level = categorize_degree(degree, field)
             field_category = categorize_field(field, degree)
-            institution_type, country, is_top_tier = get_institution_info(school, schools_data)
-
-            sequence.append({
-                'school': school,
-                'degree_level': degree_level,
-                'field_category': field_category,
-                'institution_type': institution_type,
-                'country': country,
-                'is_top_tier': is_top_tier,
-                'original_degree': degree,
-                'original_field': field
-            })
+            if school not in institution_info:
+                institution_info[school] = get_institution_info(school, schools_data)
+            institution_type, country, is_top_tier = institution_info[school]
+
+            sequence.append(EduEntry(
+                school,
+                degree_level,
+                field_category,
+                institution_type,
+                country,
+                is_top_tier,
+                degree,
+                field
+            ))
 
         if sequence:
             sequences.append(sequence)
@@ -146,49 +175,70 @@ def extract_education_sequences(alumni_data: List[Dict], schools_data: Dict) ->
 
 def generate_colors(n: int, saturation: float = 0.7, value: float = 0.8) -> List[str]:
     """Generate n visually distinct colors."""
-    colors = []
-    for i in range(n):
-        hue = i / n
-        rgb = colorsys.hsv_to_rgb(hue, saturation, value)
-        colors.append(f'rgba({int(rgb[0]*255)}, {int(rgb[1]*255)}, {int(rgb[2]*255)}, 0.8)')
-    return colors
+    # Evenly spaced hues, converted to RGB in one batch with the same
+    # arithmetic as colorsys.hsv_to_rgb
+    hue = np.arange(n) / n
+    sector = (hue * 6.0).astype(int)
+    f = hue * 6.0 - sector
+    p = np.full(n, value * (1.0 - saturation))
+    q = value * (1.0 - saturation * f)
+    t = value * (1.0 - saturation * (1.0 - f))
+    v = np.full(n, value)
 
+    sector %= 6
+    r = np.choose(sector, [v, q, p, p, t, v])
+    g = np.choose(sector, [t, v, v, q, p, p])
+    b = np.choose(sector, [p, p, t, v, v, q])
 
-def build_sankey_data_by_field(sequences: List[List[Dict]]) -> Tuple[List[str], List[int], List[int], List[int], List[str]]:
-    """Build Sankey diagram data showing degree level and field transitions."""
+    rgb = (np.stack([r, g, b], axis=1) * 255).astype(int)
+    return [f'rgba({red}, {green}, {blue}, 0.8)' for red, green, blue in rgb.tolist()]
 
-    node_set = set()
-    flow_counter = defaultdict(int)
 
-    # Process each sequence
-    for sequence in sequences:
-        # Group by degree level to create stages
-        degree_levels = ['Bachelor\'s', 'Diploma', 'Master\'s', 'Doctorate']
+# Stages are taken in this order of degree levels
+DEGREE_LEVELS = ['Bachelor\'s', 'Diploma', 'Master\'s', 'Doctorate']
 
-        stages = []
-        for degree_level in degree_levels:
-            # Find entries matching this degree level
-            entries = [e for e in sequence if e['degree_level'] == degree_level]
-            if entries:
-                stages.append(entries[0])
 
-        # Create flows between consecutive stages
-        for i in range(len(stages) - 1):
-            current = stages[i]
-            next_stage = stages[i + 1]
+def extract_stages(sequence: List[EduEntry]) -> List[EduEntry]:
+    """First entry of each degree level in a sequence, in stage order."""
+    # Keep the earliest entry per degree level in a single pass
+    first_by_level = {}
+    for entry in sequence:
+        first_by_level.setdefault(entry.degree_level, entry)
+    return [first_by_level[level] for level in DEGREE_LEVELS if level in first_by_level]
+
+
+def build_sankey_data_by_field(sequence_stages: List[List[EduEntry]]) -> Tuple[List[str], List[int], List[int], List[int], List[str]]:
+    """Build Sankey diagram data showing degree level and field transitions.
+
+    Takes each sequence's stages as returned by extract_stages.
+    """
+
+    node_set = set()
+    flow_keys = []
+
+    # Process each sequence's stages
+    for stages in sequence_stages:
+        if len(stages) < 2:
+            continue
 
-            # Create node labels
-            current_node = f"{current['degree_level']}\n{current['field_category']}"
-            next_node = f"{next_stage['degree_level']}\n{next_stage['field_category']}"
+        # Create flows between consecutive stages; each stage's node label is
+        # built once and reused as the source of the next flow
+        current = stages[0]
+        current_node = f"{current.degree_level}\n{current.field_category}"
+        for next_stage in stages[1:]:
+            next_node = f"{next_stage.degree_level}\n{next_stage.field_category}"
 
             node_set.add(current_node)
             node_set.add(next_node)
 
-            flow_key = (current_node, next_node)
-            flow_counter[flow_key] += 1
+            flow_keys.append((current_node, next_node))
+            current_node = next_node
+
+    # Tally all flows in one pass
+    flow_counter = Counter(flow_keys)
 
     # Convert to lists for Plotly
-    node_list = sorted(list(node_set))
+    node_list = sorted(node_set)
     node_dict = {node: idx for idx, node in enumerate(node_list)}
 
     # Generate colors for nodes
@@ -206,37 +256,35 @@ def build_sankey_data_by_field(sequences: List[List[Dict]]) -> Tuple[List[str],
     return node_list, sources, targets, values, node_colors
 
 
-def build_sankey_data_by_institution(sequences: List[List[Dict]]) -> Tuple[List[str], List[int], List[int], List[int], List[str]]:
-    """Build Sankey diagram data showing institution type transitions."""
+def build_sankey_data_by_institution(sequence_stages: List[List[EduEntry]]) -> Tuple[List[str], List[int], List[int], List[int], List[str]]:
+    """Build Sankey diagram data showing institution type transitions.
 
-    node_set = set()
-    flow_counter = defaultdict(int)
+    Takes each sequence's stages as returned by extract_stages.
+    """
 
-    # Process each sequence
-    for sequence in sequences:
-        degree_levels = ['Bachelor\'s', 'Diploma', 'Master\'s', 'Doctorate']
+    node_set = set()
+    flow_keys = []
 
-        stages = []
-        for degree_level in degree_levels:
-            entries = [e for e in sequence if e['degree_level'] == degree_level]
-            if entries:
-                stages.append(entries[0])
+    # Process each sequence's stages
+    for stages in sequence_stages:
+        if len(stages) < 2:
+            continue
 
         # Create flows
-        for i in range(len(stages) - 1):
-            current = stages[i]
-            next_stage = stages[i + 1]
-
-            current_node = f"{current['degree_level']}\n{current['institution_type']}"
-            next_node = f"{next_stage['degree_level']}\n{next_stage['institution_type']}"
+        current = stages[0]
+        current_node = f"{current.degree_level}\n{current.institution_type}"
+        for next_stage in stages[1:]:
+            next_node = f"{next_stage.degree_level}\n{next_stage.institution_type}"
 
             node_set.add(current_node)
             node_set.add(next_node)
 
-            flow_key = (current_node, next_node)
-            flow_counter[flow_key] += 1
+            flow_keys.append((current_node, next_node))
+            current_node = next_node
+
+    flow_counter = Counter(flow_keys)
 
-    node_list = sorted(list(node_set))
+    node_list = sorted(node_set)
     node_dict = {node: idx for idx, node in enumerate(node_list)}
 
     node_colors = generate_colors(len(node_list))
@@ -262,9 +310,12 @@ def create_visualizations(alumni_data: List[Dict], schools_data: Dict):
     sequences = extract_education_sequences(alumni_data, schools_data)
     print(f"Extracted {len(sequences)} education sequences")
 
+    # Both views and the statistics use the same stages, so they are found once
+    sequence_stages = [extract_stages(sequence) for sequence in sequences]
+
     # Visualization 1: By Field of Study
     print("\nCreating visualization by field of study...")
-    nodes, sources, targets, values, colors = build_sankey_data_by_field(sequences)
+    nodes, sources, targets, values, colors = build_sankey_data_by_field(sequence_stages)
     print(f"Created {len(nodes)} nodes and {len(sources)} flows")
 
     fig1 = go.Figure(data=[go.Sankey(
@@ -297,12 +348,13 @@ def create_visualizations(alumni_data: List[Dict], schools_data: Dict):
         plot_bgcolor='white'
     )
 
-    fig1.write_html('education_paths_by_field.html')
+    # plotly.js is loaded from the CDN instead of being embedded in every file
+    fig1.write_html('education_paths_by_field.html', include_plotlyjs='cdn', validate=False)
     print("Saved to: education_paths_by_field.html")
 
     # Visualization 2: By Institution Type
     print("\nCreating visualization by institution type...")
-    nodes2, sources2, targets2, values2, colors2 = build_sankey_data_by_institution(sequences)
+    nodes2, sources2, targets2, values2, colors2 = build_sankey_data_by_institution(sequence_stages)
     print(f"Created {len(nodes2)} nodes and {len(sources2)} flows")
 
     fig2 = go.Figure(data=[go.Sankey(
@@ -335,14 +387,24 @@ def create_visualizations(alumni_data: List[Dict], schools_data: Dict):
         plot_bgcolor='white'
     )
 
-    fig2.write_html('education_paths_by_institution.html')
+    # plotly.js is loaded from the CDN instead of being embedded in every file
+    fig2.write_html('education_paths_by_institution.html', include_plotlyjs='cdn', validate=False)
     print("Saved to: education_paths_by_institution.html")
 
     # Print statistics
-    print_statistics(sequences)
+    print_statistics(sequences, sequence_stages)
+
+
+def _format_counts(counter: Counter, total: int) -> str:
+    """One line per counted value with its share of total, most common first."""
+    scale = 100 / total if total else 0
+    return "\n".join(
+        f"  {value:20s}: {count:4d} ({count * scale:.1f}%)"
+        for value, count in counter.most_common()
+    )
 
 
-def print_statistics(sequences: List[List[Dict]]):
+def print_statistics(sequences: List[List[EduEntry]], sequence_stages: List[List[EduEntry]]):
     """Print interesting statistics about the education paths."""
     print("\n" + "="*60)
     print("CDTM ALUMNI EDUCATION PATH STATISTICS")
@@ -358,49 +420,40 @@ def print_statistics(sequences: List[List[Dict]]):
 
     for sequence in sequences:
         for edu in sequence:
-            degree_counter[edu['degree_level']] += 1
-            field_counter[edu['field_category']] += 1
-            institution_counter[edu['institution_type']] += 1
+            degree_counter[edu.degree_level] += 1
+            field_counter[edu.field_category] += 1
+            institution_counter[edu.institution_type] += 1
 
+    # Each section is formatted as one block and printed with a single call
     print("\n--- Degree Levels ---")
-    for degree, count in degree_counter.most_common():
-        percentage = (count / total_alumni) * 100
-        print(f"  {degree:20s}: {count:4d} ({percentage:.1f}%)")
+    print(_format_counts(degree_counter, total_alumni))
 
     print("\n--- Fields of Study ---")
-    for field, count in field_counter.most_common():
-        percentage = (count / total_alumni) * 100
-        print(f"  {field:20s}: {count:4d} ({percentage:.1f}%)")
+    print(_format_counts(field_counter, total_alumni))
 
     print("\n--- Institution Types ---")
-    for inst_type, count in institution_counter.most_common():
-        percentage = (count / total_alumni) * 100
-        print(f"  {inst_type:20s}: {count:4d} ({percentage:.1f}%)")
+    print(_format_counts(institution_counter, total_alumni))
 
     # Common transitions
     print("\n--- Most Common Education Transitions ---")
-    transition_counter = Counter()
+    transitions = []
 
-    for sequence in sequences:
-        degree_levels = ['Bachelor\'s', 'Diploma', 'Master\'s', 'Doctorate']
-        stages = []
-
-        for degree_level in degree_levels:
-            entries = [e for e in sequence if e['degree_level'] == degree_level]
-            if entries:
-                stages.append(entries[0])
-
-        for i in range(len(stages) - 1):
-            current = stages[i]
-            next_stage = stages[i + 1]
-            transition = (
-                f"{current['degree_level']} ({current['field_category']})",
-                f"{next_stage['degree_level']} ({next_stage['field_category']})"
-            )
-            transition_counter[transition] += 1
-
-    for (source, target), count in transition_counter.most_common(15):
-        print(f"  {count:3d} alumni: {source} → {target}")
+    for stages in sequence_stages:
+        if len(stages) < 2:
+            continue
+
+        current = stages[0]
+        source = f"{current.degree_level} ({current.field_category})"
+        for next_stage in stages[1:]:
+            target = f"{next_stage.degree_level} ({next_stage.field_category})"
+            transitions.append((source, target))
+            source = target
+
+    transition_counter = Counter(transitions)
+    print("\n".join(
+        f"  {count:3d} alumni: {source} → {target}"
+        for (source, target), count in transition_counter.most_common(15)
+    ))
 
 
 def main():
@@ -3,38 +3,73 @@
 Interactive Plotly-based visualization with hover support showing individual alumni names.
 """
 
+import functools
 import json
+import re
+import sys
 import plotly.graph_objects as go
 import numpy as np
 from collections import defaultdict, Counter
 from typing import List, Dict, Tuple
 
+try:
+    import orjson  # Faster JSON parsing
+except ImportError:
+    orjson = None
+
+
+def _load_json(path: str):
+    """Parse a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 
 def load_data():
     """Load alumni and schools data."""
-    with open('data/cdtm_alumni_consolidated.json', 'r', encoding='utf-8') as f:
-        alumni_data = json.load(f)
-    with open('data/unique_schools_normalized.json', 'r', encoding='utf-8') as f:
-        schools_data = json.load(f)
+    alumni_data = _load_json('data/cdtm_alumni_consolidated.json')
+    schools_data = _load_json('data/unique_schools_normalized.json')
     return alumni_data, schools_data
 
 
+def _keyword_pattern(terms: List[str]) -> re.Pattern:
+    """Compile a substring alternation for the given lowercase terms."""
+    return re.compile('|'.join(re.escape(term) for term in terms))
+
+
+# Matched against the lowercased text; checked in order, the first matching category wins
+_DEGREE_PATTERNS = [
+    ("Bachelor's", _keyword_pattern(['bachelor', 'b.sc', 'b.a', 'b.eng', 'bsc'])),
+    ("Master's", _keyword_pattern(['master', 'm.sc', 'm.a', 'm.eng', 'msc', 'mba'])),
+    ("Doctorate", _keyword_pattern(['phd', 'ph.d', 'doctor', 'doctorate'])),
+    ("Diploma", _keyword_pattern(['dipl', 'diploma'])),
+]
+
+_FIELD_PATTERNS = [
+    ("Engineering/Tech", _keyword_pattern([
+        'engineering', 'computer', 'informatics', 'software', 'electrical',
+        'mechanical', 'technology'
+    ])),
+    ("Business", _keyword_pattern(['business', 'management', 'mba', 'economics', 'finance', 'bwl'])),
+    ("Sciences", _keyword_pattern(['physics', 'chemistry', 'biology', 'mathematics', 'science', 'biotech'])),
+]
+
+# Memoized because the same degree and field strings recur across alumni
+@functools.lru_cache(maxsize=4096)
 def categorize_degree(degree: str, field: str) -> str:
     """Categorize a degree into a standardized level."""
     if not degree:
         return "Other"
     degree_lower = degree.lower()
-    if any(term in degree_lower for term in ['bachelor', 'b.sc', 'b.a', 'b.eng', 'bsc']):
-        return "Bachelor's"
-    if any(term in degree_lower for term in ['master', 'm.sc', 'm.a', 'm.eng', 'msc', 'mba']):
-        return "Master's"
-    if any(term in degree_lower for term in ['phd', 'ph.d', 'doctor', 'doctorate']):
-        return "Doctorate"
-    if any(term in degree_lower for term in ['dipl', 'diploma']):
-        return "Diploma"
+    for category, pattern in _DEGREE_PATTERNS:
+        if pattern.search(degree_lower):
+            return category
     return "Other"
 
 
+@functools.lru_cache(maxsize=4096)
 def categorize_field(field: str, degree: str) -> str:
     """Categorize field of study."""
     if not field:
@@ -42,27 +77,19 @@ def categorize_field(field: str, degree: str) -> str:
             return "Business"
         return "Other"
     field_lower = field.lower()
-    if any(term in field_lower for term in [
-        'engineering', 'computer', 'informatics', 'software', 'electrical',
-        'mechanical', 'technology'
-    ]):
-        return "Engineering/Tech"
-    if any(term in field_lower for term in [
-        'business', 'management', 'mba', 'economics', 'finance', 'bwl'
-    ]):
-        return "Business"
-    if any(term in field_lower for term in [
-        'physics', 'chemistry', 'biology', 'mathematics', 'science', 'biotech'
-    ]):
-        return "Sciences"
+    for category, pattern in _FIELD_PATTERNS:
+        if pattern.search(field_lower):
+            return category
     return "Other"
 
 
+_NO_SCHOOL_INFO = {}
+
+
 def get_institution_type(school_name: str, schools_data: Dict) -> str:
     """Get institution type."""
-    if school_name in schools_data:
-        return schools_data[school_name].get('institution_type', 'University')
-    return 'University'
+    # Unknown schools fall through to the default of an empty record
+    return schools_data.get(school_name, _NO_SCHOOL_INFO).get('institution_type', 'University')
 
 
 def is_cdtm(school_name: str) -> bool:
@@ -73,6 +100,8 @@ def is_cdtm(school_name: str) -> bool:
 def extract_paths(alumni_data: List[Dict], schools_data: Dict) -> List[Dict]:
     """Extract education paths from alumni data, INCLUDING CDTM."""
     paths = []
+    # School name -> institution type, looked up once per distinct school
+    institution_types = {}
 
     for person in alumni_data:
         education_path = person.get('education_path', [])
@@ -92,13 +121,17 @@ def extract_paths(alumni_data: List[Dict], schools_data: Dict) -> List[Dict]:
             else:
                 degree_level = categorize_degree(degree, field)
                 field_category = categorize_field(field, degree)
-                institution_type = get_institution_type(school, schools_data)
+                if school not in institution_types:
+                    institution_types[school] = get_institution_type(school, schools_data)
+                institution_type = institution_types[school]
 
                 all_entries.append({
                     'degree': degree_level,
                     'field': field_category,
                     'institution': institution_type,
-                    'is_cdtm': False
+                    'is_cdtm': False,
+                    # Station key, interned since only a few distinct keys exist
+                    'key': sys.intern(f"{degree_level}|{field_category}")
                 })
 
         if not all_entries:
@@ -131,20 +164,21 @@ def extract_paths(alumni_data: List[Dict], schools_data: Dict) -> List[Dict]:
                 'field': 'CDTM',
                 'institution': 'CDTM',
                 'is_cdtm': True,
-                'cdtm_level': cdtm_level
+                'cdtm_level': cdtm_level,
+                'key': "CDTM"
             }
             all_entries.insert(insert_position, cdtm_node)
 
-        primary_field = None
-        for entry in all_entries:
-            if entry['field'] != "Other" and not entry.get('is_cdtm'):
-                primary_field = entry['field']
-                break
+        primary_field = next(
+            (entry['field'] for entry in all_entries
+             if entry['field'] != "Other" and not entry['is_cdtm']),
+            "Other"
+        )
 
         if len(all_entries) >= 2:
             paths.append({
                 'nodes': all_entries,
-                'primary_field': primary_field or "Other",
+                'primary_field': primary_field,
                 'name': person.get('full_name', 'Unknown'),
                 'headline': person.get('headline', ''),
                 'linkedin_url': person.get('linkedin_url', '')
@@ -178,15 +212,20 @@ def define_stations() -> Dict[str, Tuple[float, float]]:
     }
 
 
-def sigmoid_curve(p1: Tuple[float, float], p2: Tuple[float, float], n_points: int = 50) -> Tuple[np.ndarray, np.ndarray]:
-    """Generate an S-curve between two points."""
-    x1, y1 = p1
-    x2, y2 = p2
+def sigmoid_curves(x1: np.ndarray, y1: np.ndarray, x2: np.ndarray, y2: np.ndarray,
+                   n_points: int = 50) -> Tuple[np.ndarray, np.ndarray]:
+    """Generate S-curves for a batch of segments.
+
+    Takes 1-D arrays of start/end coordinates and returns (x, y) arrays of
+    shape (n_segments, n_points).
+    """
+    t = np.linspace(0.0, 1.0, n_points)
 
-    x = np.linspace(x1, x2, n_points)
-    t = (x - x1) / (x2 - x1) if x2 != x1 else np.zeros_like(x)
-    y = y1 + (y2 - y1) * (1 - np.cos(np.pi * t)) / 2
+    # Flat for segments without horizontal extent
+    ease = np.where((x2 != x1)[:, None], (1 - np.cos(np.pi * t)) / 2, 0.0)
 
+    x = x1[:, None] + (x2 - x1)[:, None] * t
+    y = y1[:, None] + (y2 - y1)[:, None] * ease
     return x, y
 
 
@@ -208,7 +247,13 @@ def create_plotly_visualization(paths: List[Dict], output_file: str = 'education
     # Count station usage for sizing
     station_counts = Counter()
 
-    # Draw paths as individual traces (for hover)
+    # Collect the drawable segments of all paths
+    segments = []  # (path index, line color, line alpha)
+    starts = []
+    ends = []
+    # Hover text and LinkedIn URL, stored once per path in layout.meta
+    path_meta = []
+
     for path_idx, path_data in enumerate(paths):
         path_nodes = path_data['nodes']
         primary_field = path_data['primary_field']
@@ -217,81 +262,80 @@ def create_plotly_visualization(paths: List[Dict], output_file: str = 'education
         alumni_name = path_data['name']
         headline = path_data['headline']
         linkedin_url = path_data.get('linkedin_url', '')
-        path_id = f"path_{path_idx}"  # Unique identifier for this path
 
         # Create simple hover text (HTML links don't work in Plotly hover tooltips)
         hover_text = f'<b>{alumni_name}</b><br>{headline}'
         if linkedin_url:
             hover_text += f'<br><br>Click to open LinkedIn profile'
+        path_meta.append([hover_text, linkedin_url])
 
-        # Draw each segment of the path
+        # Collect each segment of the path
         for i in range(len(path_nodes) - 1):
             current = path_nodes[i]
             next_node = path_nodes[i + 1]
 
-            # Build station keys
-            if current.get('is_cdtm'):
-                current_key = "CDTM"
-            else:
-                current_key = f"{current['degree']}|{current['field']}"
-
-            if next_node.get('is_cdtm'):
-                next_key = "CDTM"
-            else:
-                next_key = f"{next_node['degree']}|{next_node['field']}"
+            current_key = current['key']
+            next_key = next_node['key']
 
             if current_key not in stations or next_key not in stations:
                 continue
 
-            x1, y1 = stations[current_key]
-            x2, y2 = stations[next_key]
-
-            # Add small jitter
-            y_jitter_start = np.random.uniform(-0.1, 0.1)
-            y_jitter_end = np.random.uniform(-0.1, 0.1)
-
-            xs, ys = sigmoid_curve(
-                (x1, y1 + y_jitter_start),
-                (x2, y2 + y_jitter_end),
-                n_points=30
-            )
-
             # Use orange for CDTM connections
-            if current.get('is_cdtm') or next_node.get('is_cdtm'):
-                line_color = field_colors["CDTM"]
-                line_alpha = 0.3
+            if current_key == "CDTM" or next_key == "CDTM":
+                segments.append((path_idx, field_colors["CDTM"], 0.3))
             else:
-                line_color = color
-                line_alpha = 0.2
-
-            # Add trace for this path segment with improved hover
-            fig.add_trace(go.Scatter(
-                x=xs,
-                y=ys,
-                mode='lines',
-                line=dict(color=line_color, width=2.5),
-                opacity=line_alpha,
-                hovertemplate=hover_text + '<extra></extra>',
-                hoverlabel=dict(
-                    bgcolor=line_color,
-                    font_size=13,
-                    font_family="Arial",
-                    font_color="white"
-                ),
-                customdata=[[path_id, line_color, line_alpha, linkedin_url]] * len(xs),
-                showlegend=False,
-                name=path_id
-            ))
+                segments.append((path_idx, color, 0.2))
+            starts.append(stations[current_key])
+            ends.append(stations[next_key])
 
             station_counts[current_key] += 1
             station_counts[next_key] += 1
 
-    # Draw nodes
-    for station_name, (sx, sy) in stations.items():
-        count = station_counts.get(station_name, 0)
-        if count == 0:
-            continue
+    # Generate all curves in one batch, with small jitter on both ends of
+    # every segment
+    starts = np.array(starts, dtype=float).reshape(-1, 2)
+    ends = np.array(ends, dtype=float).reshape(-1, 2)
+    jitter = np.random.default_rng().uniform(-0.1, 0.1, size=(len(segments), 2))
+    curves_x, curves_y = sigmoid_curves(
+        starts[:, 0], starts[:, 1] + jitter[:, 0],
+        ends[:, 0], ends[:, 1] + jitter[:, 1],
+        n_points=30
+    )
+
+    # Segments are batched into one line trace per (color, alpha); each point
+    # carries its path's index as customdata, from which the hover script
+    # fills in the hover text
+    groups = {}
+    for segment_idx, (path_idx, line_color, line_alpha) in enumerate(segments):
+        groups.setdefault((line_color, line_alpha), []).append(segment_idx)
+
+    # Draw paths, one WebGL trace per group; a NaN after each segment breaks the line
+    n_points = curves_x.shape[1]
+    for (line_color, line_alpha), segment_indices in groups.items():
+        path_indices = np.array([segments[segment_idx][0] for segment_idx in segment_indices])
+        gaps = np.full((len(segment_indices), 1), np.nan)
+        fig.add_trace(go.Scattergl(
+            x=np.hstack([curves_x[segment_indices], gaps]).ravel().tolist(),
+            y=np.hstack([curves_y[segment_indices], gaps]).ravel().tolist(),
+            mode='lines',
+            line=dict(color=line_color, width=2.5),
+            opacity=line_alpha,
+            hovertemplate='%{text}<extra></extra>',
+            hoverlabel=dict(
+                bgcolor=line_color,
+                font_size=13,
+                font_family="Arial",
+                font_color="white"
+            ),
+            customdata=np.repeat(path_indices, n_points + 1).tolist(),
+            showlegend=False,
+            meta={'opacity': line_alpha}  # Restored by the hover script on unhover
+        ))
 
+    # Draw nodes
+    # Only stations some path passes through were counted
+    for station_name, count in station_counts.items():
+        sx, sy = stations[station_name]
         is_cdtm_node = (station_name == "CDTM")
 
         if is_cdtm_node:
@@ -346,44 +390,90 @@ def create_plotly_visualization(paths: List[Dict], output_file: str = 'education
         height=800,
         width=1600,
         hovermode='closest',
-        hoverdistance=20  # Increased hover detection distance
+        hoverdistance=20,  # Increased hover detection distance
+        meta=path_meta  # Looked up by path index on hover and click
     )
 
     # JavaScript for hover highlighting and click-to-open LinkedIn
+    # post_script runs inside plotly's own script tag, so it is plain JavaScript
     hover_script = """
-    <script>
         var graphDiv = document.getElementsByClassName('plotly-graph-div')[0];
         var hoveredPath = null;
 
-        // Handle hover highlighting
+        // Indices of the batched path traces (highlight traces carry no customdata)
+        function lineTraceIndices() {
+            var indices = [];
+            for (var i = 0; i < graphDiv.data.length; i++) {
+                var trace = graphDiv.data[i];
+                if (trace.mode === 'lines' && trace.customdata) indices.push(i);
+            }
+            return indices;
+        }
+
+        // Fill in each point's hover text from the per-path table in layout.meta
+        var textIndices = lineTraceIndices();
+        Plotly.restyle(graphDiv, {
+            text: textIndices.map(function(i) {
+                return Array.from(graphDiv.data[i].customdata, function(pathIdx) {
+                    return graphDiv.layout.meta[pathIdx][0];
+                });
+            })
+        }, textIndices);
+
+        // Highlight traces are found by their meta tag rather than by position
+        function clearHighlight() {
+            var indices = [];
+            for (var i = 0; i < graphDiv.data.length; i++) {
+                var trace = graphDiv.data[i];
+                if (trace.meta && trace.meta.highlight) indices.push(i);
+            }
+            if (indices.length === 0) return Promise.resolve();
+            return Plotly.deleteTraces(graphDiv, indices);
+        }
+
+        // Handle hover highlighting: dim all paths and draw the hovered
+        // path's segments on top
         graphDiv.on('plotly_hover', function(data) {
             var point = data.points[0];
-            if (!point.data.customdata || !point.data.customdata[0]) return;
+            if (point.data.mode !== 'lines' || point.customdata === null || point.customdata === undefined) return;
 
-            var pathId = point.data.customdata[0][0];
+            var pathId = point.customdata;
             if (hoveredPath === pathId) return;
             hoveredPath = pathId;
 
-            var update = {opacity: [], 'line.width': []};
-            for (var i = 0; i < graphDiv.data.length; i++) {
+            var lineIndices = lineTraceIndices();
+            var highlights = [];
+            lineIndices.forEach(function(i) {
                 var trace = graphDiv.data[i];
-                if (trace.mode === 'lines' && trace.customdata) {
-                    var tracePathId = trace.customdata[0][0];
-                    if (tracePathId === pathId) {
-                        // Highlight hovered path
-                        update.opacity.push(1.0);
-                        update['line.width'].push(5);
-                    } else {
-                        // Dim other paths
-                        update.opacity.push(0.03);
-                        update['line.width'].push(1.5);
+                var xs = [], ys = [];
+                for (var j = 0; j < trace.customdata.length; j++) {
+                    if (trace.customdata[j] === pathId) {
+                        xs.push(trace.x[j]);
+                        ys.push(trace.y[j]);
+                    } else if (xs.length && xs[xs.length - 1] !== null) {
+                        xs.push(null);
+                        ys.push(null);
                     }
-                } else {
-                    update.opacity.push(trace.opacity !== undefined ? trace.opacity : 1);
-                    update['line.width'].push(trace.line ? trace.line.width : 1);
                 }
-            }
-            Plotly.restyle(graphDiv, update);
+                if (xs.length) {
+                    highlights.push({
+                        type: trace.type,
+                        x: xs,
+                        y: ys,
+                        mode: 'lines',
+                        line: {color: trace.line.color, width: 5},
+                        opacity: 1.0,
+                        hoverinfo: 'skip',
+                        showlegend: false,
+                        meta: {highlight: true}
+                    });
+                }
+            });
+
+            clearHighlight().then(function() {
+                Plotly.restyle(graphDiv, {opacity: 0.03, 'line.width': 1.5}, lineIndices);
+                if (highlights.length) Plotly.addTraces(graphDiv, highlights);
+            });
         });
 
         // Handle unhover - reset to normal
@@ -391,35 +481,29 @@ def create_plotly_visualization(paths: List[Dict], output_file: str = 'education
             if (hoveredPath === null) return;
             hoveredPath = null;
 
-            var update = {opacity: [], 'line.width': []};
-            for (var i = 0; i < graphDiv.data.length; i++) {
-                var trace = graphDiv.data[i];
-                if (trace.mode === 'lines' && trace.customdata) {
-                    var originalAlpha = trace.customdata[0][2];
-                    update.opacity.push(originalAlpha);
-                    update['line.width'].push(2.5);
-                } else {
-                    update.opacity.push(trace.opacity !== undefined ? trace.opacity : 1);
-                    update['line.width'].push(trace.line ? trace.line.width : 1);
-                }
-            }
-            Plotly.restyle(graphDiv, update);
+            var lineIndices = lineTraceIndices();
+            var originalAlphas = lineIndices.map(function(i) {
+                return graphDiv.data[i].meta.opacity;
+            });
+            clearHighlight().then(function() {
+                Plotly.restyle(graphDiv, {opacity: originalAlphas, 'line.width': 2.5}, lineIndices);
+            });
         });
 
         // Handle click - open LinkedIn profile
         graphDiv.on('plotly_click', function(data) {
             var point = data.points[0];
-            if (!point.data.customdata || !point.data.customdata[0]) return;
+            if (point.data.mode !== 'lines' || point.customdata === null || point.customdata === undefined) return;
 
-            var linkedinUrl = point.data.customdata[0][3];
+            var linkedinUrl = graphDiv.layout.meta[point.customdata][1];
             if (linkedinUrl) {
                 window.open(linkedinUrl, '_blank');
             }
         });
-    </script>
     """
 
-    fig.write_html(output_file, post_script=hover_script)
+    # plotly.js is loaded from the CDN instead of being embedded in the file
+    fig.write_html(output_file, post_script=hover_script, include_plotlyjs='cdn', validate=False)
     print(f"\n✓ Saved interactive visualization to: {output_file}")
     print(f"✓ Hover over any path to highlight it - other paths will fade out")
     print(f"✓ Click on any path to open the alumni's LinkedIn profile in a new tab")
@@ -4,25 +4,68 @@ Create a flow-style visualization of CDTM alumni education paths using matplotli
 with sigmoid curves. NOW INCLUDING CDTM nodes to show when alumni attended CDTM.
 """
 
+import functools
 import json
+import re
+import sys
 import matplotlib
 matplotlib.use('Agg')  # Use non-GUI backend
 import matplotlib.pyplot as plt
 import numpy as np
 from collections import defaultdict, Counter
-from typing import List, Dict, Tuple
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Tuple
 import matplotlib.patches as mpatches
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+
+
+try:
+    import orjson  # Faster JSON parsing
+except ImportError:
+    orjson = None
+
+
+def _load_json(path: str):
+    """Parse a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
 
 
 def load_data():
     """Load alumni and schools data."""
-    with open('data/cdtm_alumni_consolidated.json', 'r', encoding='utf-8') as f:
-        alumni_data = json.load(f)
-    with open('data/unique_schools_normalized.json', 'r', encoding='utf-8') as f:
-        schools_data = json.load(f)
+    alumni_data = _load_json('data/cdtm_alumni_consolidated.json')
+    schools_data = _load_json('data/unique_schools_normalized.json')
     return alumni_data, schools_data
 
 
+def _keyword_pattern(terms: List[str]) -> re.Pattern:
+    """Compile a substring alternation for the given lowercase terms."""
+    return re.compile('|'.join(re.escape(term) for term in terms))
+
+
+# Matched against the lowercased text; checked in order, the first matching category wins
+_DEGREE_PATTERNS = [
+    ("Bachelor's", _keyword_pattern(['bachelor', 'b.sc', 'b.a', 'b.eng', 'bsc'])),
+    ("Master's", _keyword_pattern(['master', 'm.sc', 'm.a', 'm.eng', 'msc', 'mba'])),
+    ("Doctorate", _keyword_pattern(['phd', 'ph.d', 'doctor', 'doctorate'])),
+    ("Diploma", _keyword_pattern(['dipl', 'diploma'])),
+]
+
+_FIELD_PATTERNS = [
+    ("Engineering/Tech", _keyword_pattern([
+        'engineering', 'computer', 'informatics', 'software', 'electrical',
+        'mechanical', 'technology'
+    ])),
+    ("Business", _keyword_pattern(['business', 'management', 'mba', 'economics', 'finance', 'bwl'])),
+    ("Sciences", _keyword_pattern(['physics', 'chemistry', 'biology', 'mathematics', 'science', 'biotech'])),
+]
+
+# Memoized because the same degree and field strings recur across alumni
+@functools.lru_cache(maxsize=4096)
 def categorize_degree(degree: str, field: str) -> str:
     """Categorize a degree into a standardized level."""
     if not degree:
@@ -30,18 +73,14 @@ def categorize_degree(degree: str, field: str) -> str:
 
     degree_lower = degree.lower()
 
-    if any(term in degree_lower for term in ['bachelor', 'b.sc', 'b.a', 'b.eng', 'bsc']):
-        return "Bachelor's"
-    if any(term in degree_lower for term in ['master', 'm.sc', 'm.a', 'm.eng', 'msc', 'mba']):
-        return "Master's"
-    if any(term in degree_lower for term in ['phd', 'ph.d', 'doctor', 'doctorate']):
-        return "Doctorate"
-    if any(term in degree_lower for term in ['dipl', 'diploma']):
-        return "Diploma"
+    for category, pattern in _DEGREE_PATTERNS:
+        if pattern.search(degree_lower):
+            return category
 
     return "Other"
 
 
+@functools.lru_cache(maxsize=4096)
 def categorize_field(field: str, degree: str) -> str:
     """Categorize field of study."""
     if not field:
@@ -51,39 +90,33 @@ def categorize_field(field: str, degree: str) -> str:
 
     field_lower = field.lower()
 
-    if any(term in field_lower for term in [
-        'engineering', 'computer', 'informatics', 'software', 'electrical',
-        'mechanical', 'technology'
-    ]):
-        return "Engineering/Tech"
-
-    if any(term in field_lower for term in [
-        'business', 'management', 'mba', 'economics', 'finance', 'bwl'
-    ]):
-        return "Business"
-
-    if any(term in field_lower for term in [
-        'physics', 'chemistry', 'biology', 'mathematics', 'science', 'biotech'
-    ]):
-        return "Sciences"
+    for category, pattern in _FIELD_PATTERNS:
+        if pattern.search(field_lower):
+            return category
 
     return "Other"
 
 
-def get_institution_type(school_name: str, schools_data: Dict) -> str:
-    """Get institution type."""
-    if school_name in schools_data:
-        return schools_data[school_name].get('institution_type', 'University')
-    return 'University'
-
-
 def is_cdtm(school_name: str) -> bool:
     """Check if school is CDTM."""
     return 'CDTM' in school_name or 'Center for Digital Technology' in school_name
 
 
+@dataclass(slots=True)
+class PathNode:
+    """One stage of an alumni path: a categorized education entry or CDTM."""
+    degree: str
+    field: str
+    key: str  # Station key in define_stations
+    is_cdtm: bool = False
+    cdtm_level: Optional[str] = None
+
+
 def extract_paths(alumni_data: List[Dict], schools_data: Dict) -> List[Dict]:
-    """Extract education paths from alumni data, INCLUDING CDTM."""
+    """Extract education paths from alumni data, INCLUDING CDTM.
+
+    The diagram doesn't show institution types, so schools_data is not consulted.
+    """
     paths = []
 
     for person in alumni_data:
@@ -105,14 +138,11 @@ def extract_paths(alumni_data: List[Dict], schools_data: Dict) -> List[Dict]:
             else:
                 degree_level = categorize_degree(degree, field)
                 field_category = categorize_field(field, degree)
-                institution_type = get_institution_type(school, schools_data)
 
-                all_entries.append({
-                    'degree': degree_level,
-                    'field': field_category,
-                    'institution': institution_type,
-                    'is_cdtm': False
-                })
+                # Station key, interned since only a few distinct keys exist
+                all_entries.append(PathNode(
+                    degree_level, field_category, sys.intern(f"{degree_level}|{field_category}")
+                ))
 
         if not all_entries:
             continue
@@ -124,7 +154,7 @@ def extract_paths(alumni_data: List[Dict], schools_data: Dict) -> List[Dict]:
 
         # Find Bachelor's or Diploma
         for i, entry in enumerate(all_entries):
-            if entry['degree'] in ["Bachelor's", "Diploma"]:
+            if entry.degree in ["Bachelor's", "Diploma"]:
                 insert_position = i + 1
                 cdtm_level = "Bachelor's Level"
                 break
@@ -132,7 +162,7 @@ def extract_paths(alumni_data: List[Dict], schools_data: Dict) -> List[Dict]:
         # If no Bachelor's found, check for Master's
         if insert_position is None:
             for i, entry in enumerate(all_entries):
-                if entry['degree'] == "Master's":
+                if entry.degree == "Master's":
                     insert_position = i + 1
                     cdtm_level = "Master's Level"
                     break
@@ -145,13 +175,8 @@ def extract_paths(alumni_data: List[Dict], schools_data: Dict) -> List[Dict]:
         # Insert CDTM node if we found a position
         if cdtm_entry and insert_position is not None and cdtm_level:
             # CDTM is a single independent node - no field association
-            cdtm_node = {
-                'degree': 'CDTM',
-                'field': 'CDTM',  # Special marker so it creates "CDTM" key
-                'institution': 'CDTM',
-                'is_cdtm': True,
-                'cdtm_level': cdtm_level
-            }
+            # (CDTM is special and its station key doesn't use field)
+            cdtm_node = PathNode('CDTM', 'CDTM', "CDTM", True, cdtm_level)
 
             # Insert CDTM into the path
             all_entries.insert(insert_position, cdtm_node)
@@ -159,8 +184,8 @@ def extract_paths(alumni_data: List[Dict], schools_data: Dict) -> List[Dict]:
         # Determine primary field
         primary_field = None
         for entry in all_entries:
-            if entry['field'] != "Other" and not entry.get('is_cdtm'):
-                primary_field = entry['field']
+            if entry.field != "Other" and not entry.is_cdtm:
+                primary_field = entry.field
                 break
 
         if len(all_entries) >= 2:  # Need at least 2 nodes for a path
@@ -214,17 +239,22 @@ def define_stations() -> Dict[str, Tuple[float, float]]:
     return stations
 
 
-def sigmoid_curve(p1: Tuple[float, float], p2: Tuple[float, float], n_points: int = 100) -> Tuple[np.ndarray, np.ndarray]:
-    """Generate an S-curve between two points."""
-    x1, y1 = p1
-    x2, y2 = p2
+def sigmoid_curves(x1: np.ndarray, y1: np.ndarray, x2: np.ndarray, y2: np.ndarray,
+                   n_points: int = 30) -> Tuple[np.ndarray, np.ndarray]:
+    """Generate S-curves for a batch of segments.
 
-    x = np.linspace(x1, x2, n_points)
+    Takes 1-D arrays of start/end coordinates and returns (x, y) arrays of
+    shape (n_segments, n_points).
+    """
+    t = np.linspace(0.0, 1.0, n_points)
 
-    # Sigmoid easing using cosine
-    t = (x - x1) / (x2 - x1) if x2 != x1 else np.zeros_like(x)
-    y = y1 + (y2 - y1) * (1 - np.cos(np.pi * t)) / 2
+    # Sigmoid easing using cosine, shared by all segments; segments without
+    # horizontal extent stay flat
+    ease = (1 - np.cos(np.pi * t)) / 2
+    rise = np.where(x2 != x1, y2 - y1, 0.0)
 
+    x = x1[:, None] + (x2 - x1)[:, None] * t
+    y = y1[:, None] + rise[:, None] * ease
     return x, y
 
 
@@ -250,8 +280,8 @@ def plot_education_flows(paths: List[Dict], output_file: str = 'education_flow_v
     # Count paths through each station for sizing
     station_counts = Counter()
 
-    # STEP 1: Draw all the paths
-    plotted_count = 0
+    # STEP 1: Collect all path segments, counting identical transitions
+    flow_counter = Counter()  # (current station, next station, color) -> segments
     cdtm_count = 0
 
     for path_data in paths:
@@ -259,65 +289,66 @@ def plot_education_flows(paths: List[Dict], output_file: str = 'education_flow_v
         primary_field = path_data['primary_field']
         color = field_colors.get(primary_field, field_colors["Other"])
 
-        # Draw connections between consecutive nodes
+        # Connections between consecutive nodes
         for i in range(len(path_nodes) - 1):
             current = path_nodes[i]
             next_node = path_nodes[i + 1]
 
-            # Build station keys - CDTM is special and doesn't use field
-            if current.get('is_cdtm'):
-                current_key = "CDTM"
-            else:
-                current_key = f"{current['degree']}|{current['field']}"
-
-            if next_node.get('is_cdtm'):
-                next_key = "CDTM"
-            else:
-                next_key = f"{next_node['degree']}|{next_node['field']}"
+            current_key = current.key
+            next_key = next_node.key
 
             # Count CDTM passages
-            if current.get('is_cdtm') or next_node.get('is_cdtm'):
+            is_cdtm_segment = current_key == "CDTM" or next_key == "CDTM"
+            if is_cdtm_segment:
                 cdtm_count += 1
 
             # Skip if station doesn't exist
             if current_key not in stations or next_key not in stations:
                 continue
 
-            # Get coordinates
-            x1, y1 = stations[current_key]
-            x2, y2 = stations[next_key]
-
-            # Add jitter to y-coordinates for volume effect
-            y_jitter_start = np.random.uniform(-0.12, 0.12)
-            y_jitter_end = np.random.uniform(-0.12, 0.12)
-
-            # Generate curve
-            xs, ys = sigmoid_curve(
-                (x1, y1 + y_jitter_start),
-                (x2, y2 + y_jitter_end)
-            )
-
             # Use orange color if going through CDTM
-            if current.get('is_cdtm') or next_node.get('is_cdtm'):
-                plot_color = field_colors["CDTM"]
-                alpha = 0.12
-            else:
-                plot_color = color
-                alpha = 0.08
-
-            # Plot with transparency for overlapping effect
-            ax.plot(xs, ys, color=plot_color, alpha=alpha, linewidth=1.2, zorder=1)
-
-            plotted_count += 1
-
-            # Track station usage
-            station_counts[current_key] += 1
-            station_counts[next_key] += 1
-
-    print(f"Drew {plotted_count} path segments")
+            plot_color = field_colors["CDTM"] if is_cdtm_segment else color
+            flow_counter[(current_key, next_key, plot_color)] += 1
+
+    # Track station usage, once per unique transition instead of per segment
+    for (current_key, next_key, _), count in flow_counter.items():
+        station_counts[current_key] += count
+        station_counts[next_key] += count
+
+    plotted_count = sum(flow_counter.values())
+
+    # Each unique transition is drawn once, widest first so thin flows stay
+    # visible on top
+    flows = sorted(flow_counter.items(), key=lambda item: -item[1])
+    starts = np.array([stations[current_key] for (current_key, _, _), _ in flows], dtype=float).reshape(-1, 2)
+    ends = np.array([stations[next_key] for (_, next_key, _), _ in flows], dtype=float).reshape(-1, 2)
+    flow_counts = np.array([count for _, count in flows], dtype=float)
+
+    # Generate all curves in one batch, with jitter on both ends so flows of
+    # different fields between the same stations stay apart
+    jitter = np.random.default_rng().uniform(-0.12, 0.12, size=(len(flows), 2))
+    curves_x, curves_y = sigmoid_curves(
+        starts[:, 0], starts[:, 1] + jitter[:, 0],
+        ends[:, 0], ends[:, 1] + jitter[:, 1]
+    )
+
+    # Width and opacity grow with the number of alumni making the transition,
+    # starting from the look of a single translucent line
+    scale = np.sqrt(flow_counts)
+    line_colors = [to_rgba(plot_color, alpha) for ((_, _, plot_color), _), alpha
+                   in zip(flows, np.minimum(0.9, 0.08 * scale))]
+    ax.add_collection(LineCollection(
+        np.stack([curves_x, curves_y], axis=-1), colors=line_colors,
+        linewidths=1.2 * scale, zorder=1
+    ))
+
+    print(f"Drew {plotted_count} path segments as {len(flows)} flows")
     print(f"CDTM connections: {cdtm_count}")
 
-    # STEP 2: Draw the stations (nodes) on top
+    # STEP 2: Draw the stations (nodes) on top, all circles in two scatter calls
+    node_xs, node_ys, node_sizes = [], [], []
+    node_colors, edge_colors, edge_widths = [], [], []
+
     for station_name, (sx, sy) in stations.items():
         count = station_counts.get(station_name, 0)
 
@@ -340,12 +371,12 @@ def plot_education_flows(paths: List[Dict], output_file: str = 'education_flow_v
             edge_color = '#1e293b'
             edge_width = 2
 
-        # White/colored background circle
-        ax.scatter(sx, sy, s=node_size, color=node_color, zorder=10, edgecolors='none')
-
-        # Outline
-        ax.scatter(sx, sy, s=node_size, facecolors='none',
-                  edgecolors=edge_color, linewidth=edge_width, zorder=11)
+        node_xs.append(sx)
+        node_ys.append(sy)
+        node_sizes.append(node_size)
+        node_colors.append(node_color)
+        edge_colors.append(edge_color)
+        edge_widths.append(edge_width)
 
         # Label
         if is_cdtm_node:
@@ -366,6 +397,13 @@ def plot_education_flows(paths: List[Dict], output_file: str = 'education_flow_v
                bbox=dict(boxstyle='round,pad=0.3', facecolor='white',
                         edgecolor='none', alpha=0.9))
 
+    # White/colored background circles
+    ax.scatter(node_xs, node_ys, s=node_sizes, color=node_colors, zorder=10, edgecolors='none')
+
+    # Outlines
+    ax.scatter(node_xs, node_ys, s=node_sizes, facecolors='none',
+              edgecolors=edge_colors, linewidth=edge_widths, zorder=11)
+
     # STEP 3: Add legend
     legend_elements = [
         mpatches.Patch(facecolor=field_colors["Engineering/Tech"],
@@ -397,7 +435,7 @@ def plot_education_flows(paths: List[Dict], output_file: str = 'education_flow_v
     plt.tight_layout()
 
     # Save
-    plt.savefig(output_file, dpi=300, bbox_inches='tight', facecolor='white')
+    plt.savefig(output_file, dpi=150, bbox_inches='tight', facecolor='white')
     print(f"\n✓ Saved visualization to: {output_file}")
 
     plt.close()
@@ -414,7 +452,7 @@ def print_statistics(paths: List[Dict]):
     print(f"\nTotal alumni with paths: {len(paths)}")
 
     # Count paths with CDTM
-    paths_with_cdtm = sum(1 for p in paths if any(n.get('is_cdtm') for n in p['nodes']))
+    paths_with_cdtm = sum(1 for p in paths if any(n.is_cdtm for n in p['nodes']))
     print(f"Paths including CDTM: {paths_with_cdtm} ({paths_with_cdtm/len(paths)*100:.1f}%)")
 
     # Count by primary field
@@ -426,10 +464,10 @@ def print_statistics(paths: List[Dict]):
     # CDTM timing
     cdtm_bachelor_level = sum(1 for p in paths
                               for n in p['nodes']
-                              if n.get('is_cdtm') and n.get('cdtm_level') == "Bachelor's Level")
+                              if n.is_cdtm and n.cdtm_level == "Bachelor's Level")
     cdtm_master_level = sum(1 for p in paths
                            for n in p['nodes']
-                           if n.get('is_cdtm') and n.get('cdtm_level') == "Master's Level")
+                           if n.is_cdtm and n.cdtm_level == "Master's Level")
 
     print("\n--- CDTM Timing ---")
     print(f"  During Bachelor's level: {cdtm_bachelor_level}")